@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2020-2026 All rights reserved.
+# FILENAME:    ~~/benchmarks/__init__.py
+# VERSION:     1.0.7
+# CREATED:     2026-10-17 12:20
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION: https://www.w3docs.com/snippets/python/what-is-init-py-for.html
+#
+# HISTORY:
+# *************************************************************
+"""Offline benchmark harness measuring throughput, latency and allocations per call"""
+
+### Standard library ###
+from collections.abc import Callable, Coroutine
+from gc import collect, disable, enable, isenabled
+from time import perf_counter_ns
+from tracemalloc import get_traced_memory, is_tracing, reset_peak, start, stop
+from typing import Any, NamedTuple
+
+Setup = Callable[[], Callable[[], Any]]
+
+BENCHMARKS: dict[str, Setup] = {}
+
+
+class Result(NamedTuple):
+    name: str
+    calls: int
+    ops_per_sec: float
+    p50_us: float
+    p99_us: float
+    peak_bytes: int  # lowest peak of traced memory during a single call
+
+
+def benchmark(name: str) -> Callable[[Setup], Setup]:
+    """
+    Register setup function returning the zero-argument callable to be measured
+
+    ---
+    :param name: unique slash-separated benchmark name, i.e. "validate/header/normal"
+    :type name: str
+    """
+
+    def register(setup: Setup) -> Setup:
+        if name in BENCHMARKS:
+            raise ValueError(f'Benchmark "{name}" is already registered')
+        BENCHMARKS[name] = setup
+        return setup
+
+    return register
+
+
+def drive(coroutine: Coroutine[Any, Any, Any]) -> Any:
+    """
+    Run coroutine which never suspends to completion without an event loop
+
+    ---
+    :param coroutine: coroutine awaiting only channels that resolve immediately
+    :type coroutine: Coroutine
+    """
+    try:
+        coroutine.send(None)
+    except StopIteration as stop_iteration:
+        return stop_iteration.value
+    coroutine.close()
+    raise RuntimeError("Benchmarked coroutine unexpectedly suspended")
+
+
+def expect(
+    error: type[BaseException], function: Callable[[], Any]
+) -> Callable[[], Any]:
+    """
+    Wrap function expected to fail so that failure paths can be measured
+
+    ---
+    :param error: exception type the function must raise
+    :type error: type[BaseException]
+    :param function: zero-argument callable to be measured
+    :type function: Callable[[], Any]
+    """
+
+    def failing() -> None:
+        try:
+            function()
+        except error:
+            return
+        raise AssertionError(f"Expected {error.__name__} to be raised")
+
+    return failing
+
+
+def measure(name: str, setup: Setup, duration: float = 0.25) -> Result:
+    """
+    Measure given benchmark for roughly `duration` seconds
+
+    ---
+    :param name: name of the benchmark being measured
+    :type name: str
+    :param setup: registered setup function returning callable to be measured
+    :type setup: Setup
+    :param duration: (Optional) approximate number of seconds spent timing calls
+    :type duration: (float) Defaults to 0.25.
+    """
+    function: Callable[[], Any] = setup()
+    function()  # warm up caches before timing anything
+
+    ### Calibrate number of calls to fit the requested duration ###
+    started: int = perf_counter_ns()
+    function()
+    single: int = max(perf_counter_ns() - started, 1)
+    calls: int = max(5, min(200_000, int(duration * 1e9 / single)))
+
+    ### Time every call individually with the garbage collector paused ###
+    timings: list[int] = [0] * calls
+    collect()
+    gc_was_enabled: bool = isenabled()
+    disable()
+    try:
+        for index in range(calls):
+            started = perf_counter_ns()
+            function()
+            timings[index] = perf_counter_ns() - started
+    finally:
+        if gc_was_enabled:
+            enable()
+    timings.sort()
+
+    ### Lowest peak of traced memory over a few single calls ###
+    tracing: bool = is_tracing()
+    if not tracing:
+        start()
+    peak_bytes: int = -1
+    for _ in range(5):
+        reset_peak()
+        baseline, _ = get_traced_memory()
+        function()
+        _, peak = get_traced_memory()
+        peak_bytes = (
+            peak - baseline if peak_bytes < 0 else min(peak_bytes, peak - baseline)
+        )
+    if not tracing:
+        stop()
+
+    return Result(
+        name=name,
+        calls=calls,
+        ops_per_sec=calls * 1e9 / sum(timings),
+        p50_us=timings[calls // 2] / 1e3,
+        p99_us=timings[min(calls - 1, calls * 99 // 100)] / 1e3,
+        peak_bytes=max(0, peak_bytes),
+    )
+
+
+__all__: tuple[str, ...] = (
+    "BENCHMARKS",
+    "Result",
+    "Setup",
+    "benchmark",
+    "drive",
+    "expect",
+    "measure",
+)
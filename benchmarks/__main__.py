@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2020-2026 All rights reserved.
+# FILENAME:    ~~/benchmarks/__main__.py
+# VERSION:     1.0.7
+# CREATED:     2026-10-17 12:20
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+"""Run registered benchmarks, i.e. `python -m benchmarks --json bench.json`
+
+Pass `--compare` with a previously saved json file to print relative changes in
+throughput, so that regressions can be spotted across commits.
+"""
+
+### Standard library ###
+from argparse import ArgumentParser, Namespace
+from importlib import import_module
+from json import dump, load
+from platform import platform, python_implementation, python_version
+from subprocess import DEVNULL, CalledProcessError, check_output
+from typing import Any
+
+### Local modules ###
+from benchmarks import BENCHMARKS, Result, measure
+
+MODULES: tuple[str, ...] = (
+    "benchmarks.batch",
+    "benchmarks.cookies",
+    "benchmarks.exemptions",
+    "benchmarks.json_body",
+    "benchmarks.masking",
+    "benchmarks.multipart",
+    "benchmarks.refresh",
+    "benchmarks.serializer_cache",
+    "benchmarks.tokens",
+    "benchmarks.urlencoded",
+    "benchmarks.validation",
+    "benchmarks.websocket",
+)
+
+
+def revision() -> None | str:
+    try:
+        return check_output(
+            ("git", "rev-parse", "--short", "HEAD"), stderr=DEVNULL, text=True
+        ).strip()
+    except (CalledProcessError, OSError):
+        return None
+
+
+def main() -> None:
+    parser: ArgumentParser = ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("-k", "--filter", default="", help="substring of names to run")
+    parser.add_argument("--duration", default=0.25, type=float, help="seconds per run")
+    parser.add_argument("--json", help="write machine-readable results to this path")
+    parser.add_argument("--compare", help="json results of a previous run to compare")
+    parser.add_argument("--list", action="store_true", help="list benchmark names")
+    arguments: Namespace = parser.parse_args()
+    for module in MODULES:
+        import_module(module)
+
+    names: list[str] = [name for name in BENCHMARKS if arguments.filter in name]
+    if arguments.list:
+        print("\n".join(names))
+        return
+    baseline: dict[str, dict[str, Any]] = {}
+    if arguments.compare:
+        with open(arguments.compare) as file:
+            baseline = {entry["name"]: entry for entry in load(file)["results"]}
+
+    print(
+        f"{'benchmark':<40} {'ops/sec':>12} {'p50 us':>10} {'p99 us':>10} "
+        f"{'peak B':>10}{'  change' if baseline else ''}"
+    )
+    results: list[Result] = []
+    for name in names:
+        result: Result = measure(name, BENCHMARKS[name], arguments.duration)
+        results.append(result)
+        change: str = ""
+        if name in baseline:
+            ratio: float = result.ops_per_sec / baseline[name]["ops_per_sec"] - 1
+            change = f"  {ratio * 100:+.1f}%"
+        print(
+            f"{name:<40} {result.ops_per_sec:>12,.0f} {result.p50_us:>10.2f} "
+            f"{result.p99_us:>10.2f} {result.peak_bytes:>10,}{change}"
+        )
+    if arguments.json:
+        with open(arguments.json, "w") as file:
+            dump(
+                {
+                    "revision": revision(),
+                    "python": f"{python_implementation()} {python_version()}",
+                    "platform": platform(),
+                    "duration": arguments.duration,
+                    "results": [result._asdict() for result in results],
+                },
+                file,
+                indent=2,
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2020-2026 All rights reserved.
+# FILENAME:    ~~/benchmarks/batch.py
+# VERSION:     1.0.7
+# CREATED:     2026-10-17 21:30
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+"""Compare loops of single-token calls with batched `validate_many` and `generate_many`"""
+
+### Standard library ###
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+### Local modules ###
+from benchmarks import benchmark, drive
+from benchmarks.tokens import MODES, load
+from benchmarks.validation import make_request
+
+BATCH: int = 100
+
+
+def register_batch(mode: str) -> None:
+    csrf_protect_class = MODES[mode]
+
+    def batch() -> list[tuple[str, str]]:
+        load(csrf_protect_class, ("token_location", "header"))
+        return csrf_protect_class().generate_many(BATCH)
+
+    @benchmark(f"batch/validate/loop/{mode}")
+    def _() -> Callable[[], Any]:
+        headers: list[tuple[str, tuple[tuple[bytes, bytes], ...]]] = [
+            (signed, ((b"x-csrf-token", token.encode("latin-1")),))
+            for token, signed in batch()
+        ]
+        csrf_protect = csrf_protect_class()
+
+        def validate() -> None:
+            for signed, header in headers:
+                drive(csrf_protect.validate_csrf(make_request(signed, header)))
+
+        return validate
+
+    @benchmark(f"batch/validate_many/{mode}")
+    def _() -> Callable[[], Any]:
+        pairs: list[tuple[str, str]] = [(signed, token) for token, signed in batch()]
+        csrf_protect = csrf_protect_class()
+        return lambda: csrf_protect.validate_many(pairs)
+
+    @benchmark(f"batch/validate_many/threads/{mode}")
+    def _() -> Callable[[], Any]:
+        pairs: list[tuple[str, str]] = [(signed, token) for token, signed in batch()]
+        csrf_protect = csrf_protect_class()
+        executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=4)
+        return lambda: csrf_protect.validate_many(
+            pairs, executor=executor, chunksize=BATCH // 4
+        )
+
+    @benchmark(f"batch/generate/loop/{mode}")
+    def _() -> Callable[[], Any]:
+        load(csrf_protect_class)
+        csrf_protect = csrf_protect_class()
+        return lambda: [csrf_protect.generate_csrf_tokens() for _ in range(BATCH)]
+
+    @benchmark(f"batch/generate_many/{mode}")
+    def _() -> Callable[[], Any]:
+        load(csrf_protect_class)
+        csrf_protect = csrf_protect_class()
+        return lambda: csrf_protect.generate_many(BATCH)
+
+
+for mode in MODES:
+    register_batch(mode)
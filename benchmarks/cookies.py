@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2020-2026 All rights reserved.
+# FILENAME:    ~~/benchmarks/cookies.py
+# VERSION:     1.0.7
+# CREATED:     2026-10-17 18:40
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+"""Compare Starlette's `set_cookie` and `delete_cookie` with precomputed cookie plans"""
+
+### Standard library ###
+from collections.abc import Callable
+from typing import Any
+
+### Third-party packages ###
+from starlette.responses import Response
+
+### Local modules ###
+from benchmarks import benchmark
+from fastapi_csrf_protect.cookie_plan import CookiePlan
+
+SIGNED: str = "ImQ3ZDg0NmU0MDk2ZjVmNzEwOWE0YmI4MDE0MGU4YTI4ZjA4OWM1ZWUi.aPJ4sA.bYbIBTEQCxEYXMfZdnHr6-ywSp4"
+OPTIONS: dict[str, Any] = {
+    "path": "/",
+    "domain": None,
+    "secure": True,
+    "httponly": True,
+    "samesite": "lax",
+}
+
+
+@benchmark("cookie/set/starlette")
+def _() -> Callable[[], Any]:
+    def set_cookie() -> None:
+        Response().set_cookie("fastapi-csrf-token", SIGNED, max_age=3600, **OPTIONS)
+
+    return set_cookie
+
+
+@benchmark("cookie/set/plan")
+def _() -> Callable[[], Any]:
+    plan: CookiePlan = CookiePlan.compile("fastapi-csrf-token", 3600, *OPTIONS.values())
+
+    def set_cookie() -> None:
+        Response().raw_headers.append(plan.set_cookie(SIGNED))
+
+    return set_cookie
+
+
+@benchmark("cookie/unset/starlette")
+def _() -> Callable[[], Any]:
+    return lambda: Response().delete_cookie("fastapi-csrf-token", **OPTIONS)
+
+
+@benchmark("cookie/unset/plan")
+def _() -> Callable[[], Any]:
+    plan: CookiePlan = CookiePlan.compile("fastapi-csrf-token", 3600, *OPTIONS.values())
+    return lambda: Response().raw_headers.append(plan.unset_cookie())
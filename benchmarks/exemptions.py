@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2020-2026 All rights reserved.
+# FILENAME:    ~~/benchmarks/exemptions.py
+# VERSION:     1.0.7
+# CREATED:     2026-10-17 20:30
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+"""Compare linear scans of exempted paths and prefixes with compiled exemption tries"""
+
+### Standard library ###
+from collections.abc import Callable
+from typing import Any
+
+### Local modules ###
+from benchmarks import benchmark
+from fastapi_csrf_protect.exemptions import Exemptions
+
+PATHS: list[str] = [f"/api/v1/resource-{index}/status" for index in range(5000)]
+PREFIXES: list[str] = [f"/webhooks/provider-{index}" for index in range(1000)]
+REQUESTS: tuple[str, ...] = (
+    "/api/v1/resource-4999/status",
+    "/webhooks/provider-999/events/123",
+    "/api/v1/orders/123",
+)
+
+
+@benchmark("exemptions/linear")
+def _() -> Callable[[], Any]:
+    def lookup() -> None:
+        for path in REQUESTS:
+            _ = path in PATHS or any(
+                path == prefix or path.startswith(prefix + "/") for prefix in PREFIXES
+            )
+
+    return lookup
+
+
+@benchmark("exemptions/trie")
+def _() -> Callable[[], Any]:
+    exemptions: Exemptions = Exemptions()
+    for path in PATHS:
+        exemptions.add_path(path, methods={"POST"})
+    for prefix in PREFIXES:
+        exemptions.add_prefix(prefix)
+    exemptions.compile()
+
+    def lookup() -> None:
+        for path in REQUESTS:
+            exemptions.is_exempt("POST", path)
+
+    return lookup
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2020-2026 All rights reserved.
+# FILENAME:    ~~/benchmarks/json_body.py
+# VERSION:     1.0.7
+# CREATED:     2026-10-17 19:40
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+"""Compare full parse and lazy scan of bulk-import JSON bodies for the CSRF token"""
+
+### Standard library ###
+from collections.abc import Callable
+from json import dumps, loads
+from typing import Any
+
+### Local modules ###
+from benchmarks import benchmark
+from fastapi_csrf_protect.parsers import find_json_token
+
+TOKEN: str = "0123456789abcdef0123456789abcdef01234567"
+TOKEN_KEY: str = "csrf-token"
+
+
+def make_body(rows: int, token_first: bool) -> bytes:
+    records: list[dict[str, Any]] = [
+        {"id": index, "email": f"user{index}@example.com", "tags": ["a", "b"]}
+        for index in range(rows)
+    ]
+    payload: dict[str, Any] = (
+        {TOKEN_KEY: TOKEN, "records": records}
+        if token_first
+        else {"records": records, TOKEN_KEY: TOKEN}
+    )
+    return dumps(payload).encode("utf-8")
+
+
+def register_json(label: str, rows: int, token_first: bool) -> None:
+    position: str = "first" if token_first else "last"
+
+    @benchmark(f"json/{label}/{position}/loads")
+    def _() -> Callable[[], Any]:
+        body: bytes = make_body(rows, token_first)
+
+        def extract() -> None:
+            assert loads(body)[TOKEN_KEY] == TOKEN
+
+        return extract
+
+    @benchmark(f"json/{label}/{position}/scan")
+    def _() -> Callable[[], Any]:
+        body: bytes = make_body(rows, token_first)
+
+        def extract() -> None:
+            assert find_json_token(body, TOKEN_KEY)[0] == TOKEN
+
+        return extract
+
+
+for label, rows in (("1KB", 10), ("5MB", 80_000)):
+    for token_first in (True, False):
+        register_json(label, rows, token_first)
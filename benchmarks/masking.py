@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2020-2026 All rights reserved.
+# FILENAME:    ~~/benchmarks/masking.py
+# VERSION:     1.0.7
+# CREATED:     2026-10-17 23:00
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+"""Compare issuing a new token pair per page view with masking the token of the cookie"""
+
+### Standard library ###
+from collections.abc import Callable
+from typing import Any
+
+### Third-party packages ###
+from starlette.responses import Response
+
+### Local modules ###
+from benchmarks import benchmark, drive
+from benchmarks.tokens import MODES, load
+from benchmarks.validation import make_request
+from fastapi_csrf_protect.masking import mask_token
+
+
+def register_masking(mode: str) -> None:
+    csrf_protect_class = MODES[mode]
+
+    @benchmark(f"render/regenerate/{mode}")
+    def _() -> Callable[[], Any]:
+        load(csrf_protect_class)
+        csrf_protect = csrf_protect_class()
+
+        def render() -> None:
+            csrf_token, signed_token = csrf_protect.generate_csrf_tokens()
+            csrf_protect.set_csrf_cookie(signed_token, Response(csrf_token))
+
+        return render
+
+    for cache_size in (None, 1024):
+
+        def setup(cache_size: None | int = cache_size) -> Callable[[], Any]:
+            load(csrf_protect_class, ("verification_cache_size", cache_size))
+            csrf_protect = csrf_protect_class()
+            _, signed_token = csrf_protect.generate_csrf_tokens()
+            return lambda: Response(csrf_protect.mask_signed_token(signed_token))
+
+        benchmark(f"render/masked/{'cached/' if cache_size else ''}{mode}")(setup)
+
+    @benchmark(f"validate/header/masked/{mode}")
+    def _() -> Callable[[], Any]:
+        load(csrf_protect_class, ("token_location", "header"))
+        csrf_protect = csrf_protect_class()
+        csrf_token, signed_token = csrf_protect.generate_csrf_tokens()
+        headers: tuple[tuple[bytes, bytes], ...] = (
+            (b"x-csrf-token", mask_token(csrf_token).encode("latin-1")),
+        )
+        return lambda: drive(
+            csrf_protect.validate_csrf(make_request(signed_token, headers))
+        )
+
+
+for mode in MODES:
+    register_masking(mode)
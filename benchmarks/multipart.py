@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2020-2026 All rights reserved.
+# FILENAME:    ~~/benchmarks/multipart.py
+# VERSION:     1.0.7
+# CREATED:     2026-10-17 19:10
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+"""Compare buffered and streaming multipart token extraction next to a 10 MB upload
+
+Tokens placed after the upload are rejected: streaming stops at the file part.
+"""
+
+### Standard library ###
+from collections.abc import Callable
+from typing import Any
+
+### Third-party packages ###
+from starlette.types import Message
+
+### Local modules ###
+from benchmarks import benchmark, drive
+from fastapi_csrf_protect.parsers import (
+    MultipartTokenScanner,
+    find_multipart_token,
+    receive_body_token,
+)
+
+BOUNDARY: bytes = b"c3a4f1e07d5b4f0f9d2a8e6b1c0d7e5f"
+CHUNK_SIZE: int = 65536
+TOKEN: str = "0123456789abcdef0123456789abcdef01234567"
+TOKEN_KEY: str = "csrf-token"
+
+
+def make_body(upload_size: int, token_first: bool) -> bytes:
+    token_part: bytes = (
+        b"--" + BOUNDARY + b"\r\n"
+        b'Content-Disposition: form-data; name="' + TOKEN_KEY.encode() + b'"\r\n\r\n'
+        + TOKEN.encode() + b"\r\n"
+    )  # fmt: skip
+    file_part: bytes = (
+        b"--" + BOUNDARY + b"\r\n"
+        b'Content-Disposition: form-data; name="upload"; filename="upload.bin"\r\n'
+        b"Content-Type: application/octet-stream\r\n\r\n"
+        + b"x" * upload_size + b"\r\n"
+    )  # fmt: skip
+    parts: tuple[bytes, bytes] = (
+        (token_part, file_part) if token_first else (file_part, token_part)
+    )
+    return b"".join(parts) + b"--" + BOUNDARY + b"--\r\n"
+
+
+async def receive_body(receive: Callable[[], Any]) -> tuple[bytes, list[Message]]:
+    """Drain request body from receive channel, keeping messages to be replayed"""
+    chunks: list[bytes] = []
+    messages: list[Message] = []
+    while True:
+        message: Message = await receive()
+        messages.append(message)
+        chunks.append(message.get("body", b""))
+        if not message.get("more_body", False):
+            return b"".join(chunks), messages
+
+
+def make_receive(body: bytes) -> Callable[[], Callable[[], Any]]:
+    chunks: list[Message] = [
+        {
+            "type": "http.request",
+            "body": body[offset : offset + CHUNK_SIZE],
+            "more_body": offset + CHUNK_SIZE < len(body),
+        }
+        for offset in range(0, len(body), CHUNK_SIZE)
+    ]
+
+    def receive_factory() -> Callable[[], Any]:
+        iterator = iter(chunks)
+
+        async def receive() -> Message:
+            return next(iterator)
+
+        return receive
+
+    return receive_factory
+
+
+def register_multipart(token_first: bool) -> None:
+    position: str = "first" if token_first else "last"
+    expected: None | str = TOKEN if token_first else None
+
+    @benchmark(f"multipart/10MB/{position}/buffered")
+    def _() -> Callable[[], Any]:
+        receive_factory = make_receive(make_body(10 << 20, token_first))
+
+        def extract() -> None:
+            body, _ = drive(receive_body(receive_factory()))
+            assert find_multipart_token(body, BOUNDARY, TOKEN_KEY) == expected
+
+        return extract
+
+    @benchmark(f"multipart/10MB/{position}/streaming")
+    def _() -> Callable[[], Any]:
+        receive_factory = make_receive(make_body(10 << 20, token_first))
+
+        def extract() -> None:
+            scanner: MultipartTokenScanner = MultipartTokenScanner(BOUNDARY, TOKEN_KEY)
+            token, _ = drive(receive_body_token(receive_factory(), scanner))
+            assert token == expected
+
+        return extract
+
+
+for token_first in (True, False):
+    register_multipart(token_first)
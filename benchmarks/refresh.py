@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2020-2026 All rights reserved.
+# FILENAME:    ~~/benchmarks/refresh.py
+# VERSION:     1.0.7
+# CREATED:     2026-10-17 23:30
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+"""Compare `ensure_csrf_cookie` reusing a fresh cookie with issuing a new one, and token
+delivery answered with 304 Not Modified"""
+
+### Standard library ###
+from collections.abc import Callable
+from typing import Any
+
+### Third-party packages ###
+from starlette.responses import Response
+
+### Local modules ###
+from benchmarks import benchmark
+from benchmarks.tokens import MODES, load
+from benchmarks.validation import make_request
+from fastapi_csrf_protect.delivery import entity_tag
+
+
+def register_refresh(mode: str) -> None:
+    csrf_protect_class = MODES[mode]
+
+    @benchmark(f"ensure/issued/{mode}")
+    def _() -> Callable[[], Any]:
+        load(csrf_protect_class)
+        csrf_protect = csrf_protect_class()
+        return lambda: csrf_protect.ensure_csrf_cookie(make_request(None), Response())
+
+    for cache_size in (None, 1024):
+
+        def setup(cache_size: None | int = cache_size) -> Callable[[], Any]:
+            load(csrf_protect_class, ("verification_cache_size", cache_size))
+            csrf_protect = csrf_protect_class()
+            _, signed_token = csrf_protect.generate_csrf_tokens()
+            return lambda: csrf_protect.ensure_csrf_cookie(
+                make_request(signed_token), Response()
+            )
+
+        benchmark(f"ensure/reused/{'cached/' if cache_size else ''}{mode}")(setup)
+
+    @benchmark(f"deliver/not_modified/{mode}")
+    def _() -> Callable[[], Any]:
+        load(csrf_protect_class, ("verification_cache_size", 1024))
+        csrf_protect = csrf_protect_class()
+        _, signed_token = csrf_protect.generate_csrf_tokens()
+        headers: tuple[tuple[bytes, bytes], ...] = (
+            (b"if-none-match", entity_tag(signed_token).encode("latin-1")),
+        )
+        return lambda: csrf_protect.deliver_csrf_token(
+            make_request(signed_token, headers)
+        )
+
+
+for mode in MODES:
+    register_refresh(mode)
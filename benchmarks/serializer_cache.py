@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2020-2026 All rights reserved.
+# FILENAME:    ~~/benchmarks/serializer_cache.py
+# VERSION:     1.0.7
+# CREATED:     2026-10-17 09:12
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+"""Compare fresh, cached and compact serializers"""
+
+### Standard library ###
+from collections.abc import Callable
+from typing import Any
+
+### Third-party packages ###
+from itsdangerous import URLSafeTimedSerializer
+
+### Local modules ###
+from benchmarks import benchmark
+from fastapi_csrf_protect.serializer_cache import SerializerCache
+
+SECRET_KEY: str = "secret"
+SALT: str = "fastapi-csrf-token"
+TOKEN: str = "0123456789abcdef0123456789abcdef01234567"
+
+
+@benchmark("serializer/dumps/fresh")
+def _() -> Callable[[], Any]:
+    return lambda: URLSafeTimedSerializer(SECRET_KEY, salt=SALT).dumps(TOKEN)
+
+
+@benchmark("serializer/dumps/cached")
+def _() -> Callable[[], Any]:
+    cache: SerializerCache = SerializerCache()
+    return lambda: cache.get(SECRET_KEY, SALT).dumps(TOKEN)
+
+
+@benchmark("serializer/loads/fresh")
+def _() -> Callable[[], Any]:
+    signed: str = URLSafeTimedSerializer(SECRET_KEY, salt=SALT).dumps(TOKEN)
+    return lambda: URLSafeTimedSerializer(SECRET_KEY, salt=SALT).loads(
+        signed, max_age=3600
+    )
+
+
+@benchmark("serializer/loads/cached")
+def _() -> Callable[[], Any]:
+    cache: SerializerCache = SerializerCache()
+    signed: str = cache.get(SECRET_KEY, SALT).dumps(TOKEN)
+    return lambda: cache.get(SECRET_KEY, SALT).loads(signed, max_age=3600)
+
+
+@benchmark("serializer/dumps/compact")
+def _() -> Callable[[], Any]:
+    cache: SerializerCache = SerializerCache()
+    return lambda: cache.get(SECRET_KEY, SALT, "compact").dumps(TOKEN)
+
+
+@benchmark("serializer/loads/compact")
+def _() -> Callable[[], Any]:
+    cache: SerializerCache = SerializerCache()
+    signed: str = cache.get(SECRET_KEY, SALT, "compact").dumps(TOKEN)
+    return lambda: cache.get(SECRET_KEY, SALT, "compact").loads(signed, max_age=3600)
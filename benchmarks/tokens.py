@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2020-2026 All rights reserved.
+# FILENAME:    ~~/benchmarks/tokens.py
+# VERSION:     1.0.7
+# CREATED:     2026-10-17 12:20
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+"""Benchmarks for token issuance in Normal and Flexible modes"""
+
+### Standard library ###
+from collections.abc import Callable
+from typing import Any
+
+### Local modules ###
+from benchmarks import benchmark
+from fastapi_csrf_protect import CsrfProtect
+from fastapi_csrf_protect.flexible import CsrfProtect as FlexibleCsrfProtect
+
+MODES: dict[str, type[CsrfProtect] | type[FlexibleCsrfProtect]] = {
+    "normal": CsrfProtect,
+    "flexible": FlexibleCsrfProtect,
+}
+
+
+def load(
+    csrf_protect: type[CsrfProtect] | type[FlexibleCsrfProtect], *settings: tuple
+) -> None:
+    """Load settings on top of the secret key shared by every benchmark"""
+
+    @csrf_protect.load_config
+    def _() -> tuple[tuple[str, Any], ...]:
+        return (("secret_key", "secret"), *settings)
+
+
+def register_generate(mode: str) -> None:
+    csrf_protect_class = MODES[mode]
+
+    @benchmark(f"generate/{mode}")
+    def _() -> Callable[[], Any]:
+        load(csrf_protect_class)
+        return csrf_protect_class().generate_csrf_tokens
+
+    @benchmark(f"generate/pooled/{mode}")
+    def _() -> Callable[[], Any]:
+        load(csrf_protect_class, ("token_pool_size", 4096))
+        csrf_protect_class().profile.token_pool.fill()  # type: ignore[union-attr]
+        return csrf_protect_class().generate_csrf_tokens
+
+
+for mode in MODES:
+    register_generate(mode)
+
+
+__all__: tuple[str, ...] = ("MODES", "load")
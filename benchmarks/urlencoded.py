@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2020-2026 All rights reserved.
+# FILENAME:    ~~/benchmarks/urlencoded.py
+# VERSION:     1.0.7
+# CREATED:     2026-10-17 11:02
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+"""Compare urlencoded token extraction strategies on 1 KB, 100 KB and 10 MB bodies"""
+
+### Standard library ###
+from collections.abc import Callable
+from typing import Any
+
+### Third-party packages ###
+from pydantic import create_model
+from starlette.types import Message
+
+### Local modules ###
+from benchmarks import benchmark, drive
+from fastapi_csrf_protect.parsers import receive_urlencoded_token
+
+CHUNK_SIZE: int = 65536
+TOKEN: str = "0123456789abcdef0123456789abcdef01234567"
+TOKEN_KEY: str = "csrf-token"
+
+
+def legacy_get_csrf_from_body(data: bytes) -> str:
+    """Extraction strategy used before the streaming scanner"""
+    fields: dict[str, tuple[type, str]] = {TOKEN_KEY: (str, "csrf-token")}
+    Body = create_model("Body", **fields)  # type: ignore[call-overload]
+    content: str = (
+        '{"' + data.decode("utf-8").replace("&", '","').replace("=", '":"') + '"}'
+    )
+    return Body.model_validate_json(content).model_dump()[TOKEN_KEY]
+
+
+def make_body(size: int, token_first: bool) -> bytes:
+    token_pair: bytes = f"{TOKEN_KEY}={TOKEN}".encode("utf-8")
+    pairs: list[bytes] = []
+    filled: int = len(token_pair)
+    index: int = 0
+    while filled < size:
+        pair: bytes = f"field{index}={'x' * 64}".encode("utf-8")
+        pairs.append(pair)
+        filled += len(pair) + 1
+        index += 1
+    if token_first:
+        pairs.insert(0, token_pair)
+    else:
+        pairs.append(token_pair)
+    return b"&".join(pairs)
+
+
+def streaming(body: bytes) -> Callable[[], Any]:
+    chunks: list[Message] = [
+        {
+            "type": "http.request",
+            "body": body[offset : offset + CHUNK_SIZE],
+            "more_body": offset + CHUNK_SIZE < len(body),
+        }
+        for offset in range(0, len(body), CHUNK_SIZE)
+    ]
+
+    def extract() -> None:
+        iterator = iter(chunks)
+
+        async def receive() -> Message:
+            return next(iterator)
+
+        token, _ = drive(receive_urlencoded_token(receive, TOKEN_KEY))
+        assert token == TOKEN
+
+    return extract
+
+
+def register_urlencoded(label: str, size: int, token_first: bool) -> None:
+    position: str = "first" if token_first else "last"
+
+    @benchmark(f"urlencoded/{label}/{position}/legacy")
+    def _() -> Callable[[], Any]:
+        body: bytes = make_body(size, token_first)
+        return lambda: legacy_get_csrf_from_body(body)
+
+    @benchmark(f"urlencoded/{label}/{position}/streaming")
+    def _() -> Callable[[], Any]:
+        return streaming(make_body(size, token_first))
+
+
+for label, size in (("1KB", 1 << 10), ("100KB", 100 << 10), ("10MB", 10 << 20)):
+    for token_first in (True, False):
+        register_urlencoded(label, size, token_first)
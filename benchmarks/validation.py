@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2020-2026 All rights reserved.
+# FILENAME:    ~~/benchmarks/validation.py
+# VERSION:     1.0.7
+# CREATED:     2026-10-17 12:20
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+"""Benchmarks for `validate_csrf` per token location, mode and failure path, and for
+request-free `verify`"""
+
+### Standard library ###
+from collections.abc import Callable, Iterator
+from functools import partial
+from itertools import cycle
+from typing import Any
+
+### Third-party packages ###
+from starlette.datastructures import FormData
+from starlette.requests import Request
+from starlette.types import Message
+
+### Local modules ###
+from benchmarks import benchmark, drive, expect
+from benchmarks.tokens import MODES, load
+from fastapi_csrf_protect.exceptions import (
+    CrossOriginError,
+    CsrfProtectError,
+    MissingTokenError,
+    TokenValidationError,
+)
+from fastapi_csrf_protect.tenancy import TenantResolver, tenant_from_host
+
+FORM_FIELDS: bytes = b"email=user%40example.com&name=protect&password=secret"
+
+
+def make_request(
+    cookie: None | str,
+    headers: tuple[tuple[bytes, bytes], ...] = (),
+    body: bytes = b"",
+    form: None | FormData = None,
+) -> Request:
+    """Build request for POST /protected without any running server"""
+    raw_headers: list[tuple[bytes, bytes]] = list(headers)
+    if cookie is not None:
+        raw_headers.append((b"cookie", f"fastapi-csrf-token={cookie}".encode()))
+    if body:
+        raw_headers.append((b"content-type", b"application/x-www-form-urlencoded"))
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    request: Request = Request(
+        {
+            "type": "http",
+            "method": "POST",
+            "path": "/protected",
+            "headers": raw_headers,
+            "query_string": b"",
+        },
+        receive,
+    )
+    if form is not None:
+        request._form = form
+    return request
+
+
+def register_validation(mode: str) -> None:
+    csrf_protect_class = MODES[mode]
+
+    def validator(
+        location: str, cookie: None | str, token: None | str, time_limit: None | int
+    ) -> Callable[[], Any]:
+        csrf_protect = csrf_protect_class()
+        headers: tuple[tuple[bytes, bytes], ...] = ()
+        body: bytes = FORM_FIELDS
+        form: None | FormData = None
+        if token is not None and location == "header":
+            headers = ((b"x-csrf-token", token.encode("latin-1")),)
+        elif token is not None and location == "body":
+            body = FORM_FIELDS + b"&csrf-token=" + token.encode("latin-1")
+        elif location == "form":
+            fields: list[tuple[str, str]] = [("email", "user@example.com")]
+            form = FormData(fields + ([("csrf-token", token)] if token else []))
+
+        def validate() -> None:
+            request: Request = make_request(cookie, headers, body, form)
+            drive(csrf_protect.validate_csrf(request, time_limit=time_limit))
+
+        return validate
+
+    for location in ("header", "body", "form"):
+
+        def setup(location: str = location) -> Callable[[], Any]:
+            load(
+                csrf_protect_class,
+                ("token_key", "csrf-token"),
+                ("token_location", "header" if location == "header" else "body"),
+            )
+            token, signed = csrf_protect_class().generate_csrf_tokens()
+            return validator(location, signed, token, None)
+
+        benchmark(f"validate/{location}/{mode}")(setup)
+
+    @benchmark(f"validate/header/compact/{mode}")
+    def _() -> Callable[[], Any]:
+        load(
+            csrf_protect_class,
+            ("token_format", "compact"),
+            ("token_location", "header"),
+        )
+        token, signed = csrf_protect_class().generate_csrf_tokens()
+        return validator("header", signed, token, None)
+
+    @benchmark(f"validate/header/cached/{mode}")
+    def _() -> Callable[[], Any]:
+        load(
+            csrf_protect_class,
+            ("token_location", "header"),
+            ("verification_cache_size", 1024),
+        )
+        token, signed = csrf_protect_class().generate_csrf_tokens()
+        return validator("header", signed, token, None)
+
+    @benchmark(f"validate/header/tenant/{mode}")
+    def _() -> Callable[[], Any]:
+        secret_keys: dict[str, str] = {
+            f"tenant-{index}.test": f"secret-{index}" for index in range(1000)
+        }
+        load(
+            csrf_protect_class,
+            ("tenant_resolver", TenantResolver(tenant_from_host, secret_keys.get)),
+            ("token_location", "header"),
+        )
+        csrf_protect = csrf_protect_class()
+        requests: list[Callable[[], Request]] = []
+        for host in secret_keys:
+            headers: tuple[tuple[bytes, bytes], ...] = ((b"host", host.encode()),)
+            token, signed = csrf_protect.generate_csrf_tokens(
+                request=make_request(None, headers)
+            )
+            headers += ((b"x-csrf-token", token.encode("latin-1")),)
+            requests.append(partial(make_request, signed, headers))
+        tenants: Iterator[Callable[[], Request]] = cycle(requests)
+
+        def validate() -> None:
+            drive(csrf_protect.validate_csrf(next(tenants)()))
+
+        return validate
+
+    @benchmark(f"validate/header/same-origin/{mode}")
+    def _() -> Callable[[], Any]:
+        load(
+            csrf_protect_class,
+            ("origin_policy", "allow_same_origin"),
+            ("token_location", "header"),
+        )
+        csrf_protect = csrf_protect_class()
+        token, signed = csrf_protect.generate_csrf_tokens()
+        headers: tuple[tuple[bytes, bytes], ...] = (
+            (b"sec-fetch-site", b"same-origin"),
+            (b"x-csrf-token", token.encode("latin-1")),
+        )
+        return lambda: drive(csrf_protect.validate_csrf(make_request(signed, headers)))
+
+    @benchmark(f"validate/cross-site/{mode}")
+    def _() -> Callable[[], Any]:
+        load(csrf_protect_class, ("origin_policy", "reject_cross_site"))
+        csrf_protect = csrf_protect_class()
+        token, signed = csrf_protect.generate_csrf_tokens()
+        headers: tuple[tuple[bytes, bytes], ...] = (
+            (b"sec-fetch-site", b"cross-site"),
+            (b"x-csrf-token", token.encode("latin-1")),
+        )
+        return expect(
+            CrossOriginError,
+            lambda: drive(csrf_protect.validate_csrf(make_request(signed, headers))),
+        )
+
+    @benchmark(f"verify/{mode}")
+    def _() -> Callable[[], Any]:
+        load(csrf_protect_class)
+        csrf_protect = csrf_protect_class()
+        token, signed = csrf_protect.generate_csrf_tokens()
+        return partial(csrf_protect.verify, signed, token)
+
+    def failing(reason: str, error: type[CsrfProtectError], **overrides: Any) -> None:
+        def setup() -> Callable[[], Any]:
+            load(csrf_protect_class)
+            token, signed = csrf_protect_class().generate_csrf_tokens()
+            arguments: dict[str, Any] = {
+                "location": "header",
+                "cookie": signed,
+                "token": token,
+                "time_limit": None,
+            }
+            arguments.update(overrides)
+            return expect(error, validator(**arguments))
+
+        benchmark(f"validate/{reason}/{mode}")(setup)
+
+    failing("expired", TokenValidationError, time_limit=-1)
+    failing("invalid", TokenValidationError, cookie="invalid")
+    failing("mismatch", TokenValidationError, token="mismatch")
+    failing("missing-cookie", MissingTokenError, cookie=None)
+    failing("missing-token", CsrfProtectError, token=None)
+
+
+for mode in MODES:
+    register_validation(mode)
+
+
+__all__: tuple[str, ...] = ("make_request",)
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2020-2026 All rights reserved.
+# FILENAME:    ~~/benchmarks/websocket.py
+# VERSION:     1.0.7
+# CREATED:     2026-10-17 22:00
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+"""Load test WebSocket handshake validation with concurrent in-process connections"""
+
+### Standard library ###
+from asyncio import Queue, gather, run
+from collections.abc import Callable
+from typing import Any
+
+### Third-party packages ###
+from fastapi import Depends, FastAPI, WebSocket
+from starlette.types import ASGIApp, Message
+
+### Local modules ###
+from benchmarks import benchmark
+from benchmarks.tokens import MODES, load
+
+CONNECTIONS: int = 200
+MESSAGES: int = 50
+
+
+async def connect(app: ASGIApp, signed: str, token: str) -> list[Message]:
+    """Open one WebSocket connection, exchange messages and collect what was sent"""
+    inbox: Queue[Message] = Queue()
+    inbox.put_nowait({"type": "websocket.connect"})
+    for _ in range(MESSAGES):
+        inbox.put_nowait({"type": "websocket.receive", "text": "ping"})
+    inbox.put_nowait({"type": "websocket.disconnect", "code": 1000})
+    sent: list[Message] = []
+
+    async def send(message: Message) -> None:
+        sent.append(message)
+
+    await app(
+        {
+            "type": "websocket",
+            "path": "/ws",
+            "root_path": "",
+            "scheme": "ws",
+            "query_string": b"",
+            "headers": [(b"cookie", f"fastapi-csrf-token={signed}".encode("latin-1"))],
+            "subprotocols": [f"csrf-token.{token}"],
+        },
+        inbox.get,
+        send,
+    )
+    return sent
+
+
+def register_websocket(mode: str) -> None:
+    csrf_protect_class = MODES[mode]
+
+    def load_test(per_message: Callable[[Any, WebSocket], Any]) -> Callable[[], Any]:
+        load(csrf_protect_class, ("token_key", "csrf-token"))
+        app: FastAPI = FastAPI()
+        csrf_protect = csrf_protect_class()
+
+        @app.websocket(
+            "/ws", dependencies=[Depends(csrf_protect_class.validated_websocket)]
+        )
+        async def echo(websocket: WebSocket) -> None:
+            await websocket.accept(subprotocol=websocket.scope["subprotocols"][0])
+            async for message in websocket.iter_text():
+                await per_message(csrf_protect, websocket)
+                await websocket.send_text(message)
+
+        pairs: list[tuple[str, str]] = [
+            (signed, token) for token, signed in csrf_protect.generate_many(CONNECTIONS)
+        ]
+
+        async def connections() -> None:
+            outcomes: list[list[Message]] = await gather(
+                *(connect(app, signed, token) for signed, token in pairs)
+            )
+            assert all(len(sent) == MESSAGES + 1 for sent in outcomes)
+
+        return lambda: run(connections())
+
+    @benchmark(f"websocket/cached/{mode}")
+    def _() -> Callable[[], Any]:
+        async def recorded(csrf_protect: Any, websocket: WebSocket) -> None:
+            await csrf_protect.validate_websocket(websocket)
+
+        return load_test(recorded)
+
+    @benchmark(f"websocket/per-message/{mode}")
+    def _() -> Callable[[], Any]:
+        async def verified(csrf_protect: Any, websocket: WebSocket) -> None:
+            signed: str = websocket.cookies["fastapi-csrf-token"]
+            token: None | str = csrf_protect.get_csrf_from_websocket(websocket)
+            assert token is not None and csrf_protect.verify(signed, token)
+
+        return load_test(verified)
+
+
+for mode in MODES:
+    register_websocket(mode)
@@ -13,6 +13,7 @@ from fastapi import FastAPI, Form, Request, Depends
 from fastapi.responses import HTMLResponse, JSONResponse
 from fastapi_csrf_protect import CsrfProtect
 from fastapi_csrf_protect.exceptions import CsrfProtectError
+from fastapi_csrf_protect.masking import mask_token
 from minijinja import Environment
 from os import path
 from pydantic import EmailStr, StrictStr
@@ -55,11 +56,21 @@ async def form(
     request: Request, csrf_protect: Annotated[CsrfProtect, Depends(CsrfProtect)]
 ) -> HTMLResponse:
     """
-    Returns form template.
+    Returns form template, with a differently masked token on every render while the
+    signed cookie is still valid.
     """
+    signed_token: str | None = request.cookies.get("fastapi-csrf-token")
+    csrf_token: str | None = (
+        csrf_protect.mask_signed_token(signed_token) if signed_token else None
+    )
+    if csrf_token is not None:
+        content: str = environment.render_template(
+            "form.html", csrf_token=csrf_token, request=request
+        )
+        return HTMLResponse(content=content)
     csrf_token, signed_token = csrf_protect.generate_csrf_tokens()
-    content: str = environment.render_template(
-        "form.html", csrf_token=csrf_token, request=request
+    content = environment.render_template(
+        "form.html", csrf_token=mask_token(csrf_token), request=request
     )
     response: HTMLResponse = HTMLResponse(content=content)
     csrf_protect.set_csrf_cookie(signed_token, response)
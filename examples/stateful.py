@@ -14,6 +14,7 @@ from fastapi import FastAPI, Form, Request, Depends
 from fastapi.responses import HTMLResponse, JSONResponse
 from fastapi_csrf_protect import CsrfProtect
 from fastapi_csrf_protect.exceptions import CsrfProtectError
+from fastapi_csrf_protect.token_store import KeyValueTokenStore
 from minijinja import Environment
 from os import path
 from pydantic import EmailStr, StrictStr
@@ -52,29 +53,24 @@ def get_csrf_config():
     return CsrfSettings()
 
 
+def get_token_store(
+    cachette: Annotated[Cachette, Depends(Cachette)],
+    csrf_protect: Annotated[CsrfProtect, Depends(CsrfProtect)],
+) -> KeyValueTokenStore:
+    return KeyValueTokenStore(cachette, csrf_protect.generate_csrf_tokens, ttl=60)
+
+
 @app.get("/", response_class=HTMLResponse)
 async def form(
     request: Request,
-    cachette: Annotated[Cachette, Depends(Cachette)],
     csrf_protect: Annotated[CsrfProtect, Depends(CsrfProtect)],
+    token_store: Annotated[KeyValueTokenStore, Depends(get_token_store)],
 ) -> HTMLResponse:
     """
     Returns form template.
     """
-    session_id = request.cookies.get("session-id", None)
-    csrf_token: str
-    signed_token: str
-    if not session_id:
-        session_id = str(uuid())
-        csrf_token, signed_token = csrf_protect.generate_csrf_tokens()
-        await cachette.put(f"{session_id}-csrf-token", csrf_token)
-        await cachette.put(f"{session_id}-signed-token", signed_token)
-    else:
-        session_csrf = await cachette.fetch(f"{session_id}-csrf-token")
-        session_signed = await cachette.fetch(f"{session_id}-signed-token")
-        if not session_csrf or not session_signed:
-            raise CsrfProtectError(500, "Unable to find user signed tokens")
-        csrf_token, signed_token = session_csrf, session_signed
+    session_id = request.cookies.get("session-id", None) or str(uuid())
+    csrf_token, signed_token = await token_store.get_or_issue(session_id)
     content: str = environment.render_template(
         "form.html", csrf_token=csrf_token, request=request
     )
@@ -15,8 +15,10 @@ FastAPI extension that provides Csrf Protection Token support
 
 ### Local modules ###
 from fastapi_csrf_protect.core import CsrfProtect
+from fastapi_csrf_protect.middleware import CsrfProtectMiddleware
+from fastapi_csrf_protect.profile import CsrfProfile
 
-__all__: tuple[str, ...] = ("CsrfProtect",)
+__all__: tuple[str, ...] = ("CsrfProfile", "CsrfProtect", "CsrfProtectMiddleware")
 __name__ = "fastapi-csrf-protect"
 __package__ = "fastapi-csrf-protect"
 __version__ = "1.0.7"
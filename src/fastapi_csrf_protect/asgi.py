@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2020-2026 All rights reserved.
+# FILENAME:    ~~/src/fastapi_csrf_protect/asgi.py
+# VERSION:     1.0.7
+# CREATED:     2026-10-17 10:05
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+"""Helpers reading CSRF material straight from ASGI scopes and receive channels"""
+
+### Standard library ###
+from collections import deque
+
+### Third-party packages ###
+from starlette.requests import cookie_parser
+from starlette.types import Message, Receive
+
+
+def get_cookie(raw_headers: list[tuple[bytes, bytes]], cookie_key: str) -> None | str:
+    """
+    Get cookie value from raw ASGI headers without building a Request
+
+    ---
+    :param raw_headers: list of lowercased header name and value pairs from ASGI scope
+    :type raw_headers: list[tuple[bytes, bytes]]
+    :param cookie_key: name of the cookie to look up
+    :type cookie_key: str
+    """
+    cookies: list[str] = [
+        value.decode("latin-1") for name, value in raw_headers if name == b"cookie"
+    ]
+    if not cookies:
+        return None
+    return cookie_parser("; ".join(cookies)).get(cookie_key)
+
+
+def get_header(raw_headers: list[tuple[bytes, bytes]], name: bytes) -> None | str:
+    """
+    Get first value of a header from raw ASGI headers without building a Request
+
+    ---
+    :param raw_headers: list of lowercased header name and value pairs from ASGI scope
+    :type raw_headers: list[tuple[bytes, bytes]]
+    :param name: lowercased name of the header to look up
+    :type name: bytes
+    """
+    for header, value in raw_headers:
+        if header == name:
+            return value.decode("latin-1")
+    return None
+
+
+def replay_receive(messages: list[Message], receive: Receive) -> Receive:
+    """
+    Wrap receive channel so that already consumed messages are delivered again
+
+    ---
+    :param messages: messages already taken from the receive channel
+    :type messages: list[starlette.types.Message]
+    :param receive: ASGI receive channel of the current request
+    :type receive: starlette.types.Receive
+    """
+    if not messages:
+        return receive
+    pending: deque[Message] = deque(messages)
+
+    async def replay() -> Message:
+        if pending:
+            return pending.popleft()
+        return await receive()
+
+    return replay
+
+
+__all__: tuple[str, ...] = (
+    "get_cookie",
+    "get_header",
+    "replay_receive",
+)
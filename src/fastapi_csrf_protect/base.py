@@ -0,0 +1,1058 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2020-2026 All rights reserved.
+# FILENAME:    ~~/src/fastapi_csrf_protect/base.py
+# VERSION:     1.0.7
+# CREATED:     2026-10-18 10:00
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+"""Behavior shared by Normal and Flexible CsrfProtect, independent of token location"""
+
+### Standard library ###
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from concurrent.futures import Executor, Future
+from time import time
+from typing import Any, ClassVar
+
+### Third-party packages ###
+from itsdangerous import BadData
+from starlette.datastructures import FormData, UploadFile
+from starlette.exceptions import WebSocketException
+from starlette.requests import HTTPConnection, Request
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route, Router
+from starlette.status import WS_1008_POLICY_VIOLATION
+from starlette.types import Receive, Scope, Send
+from starlette.websockets import WebSocket
+
+### Local modules ###
+from fastapi_csrf_protect.asgi import get_cookie, get_header, replay_receive
+from fastapi_csrf_protect.body import ValidatedBody, parse_body
+from fastapi_csrf_protect.cookie_plan import send_with_header
+from fastapi_csrf_protect.delivery import CACHE_CONTROL, entity_tag, etag_matches
+from fastapi_csrf_protect.exceptions import (
+    CsrfProtectError,
+    MissingTokenError,
+    TokenValidationError,
+    UnknownTenantError,
+)
+from fastapi_csrf_protect.key_ring import KeyRing
+from fastapi_csrf_protect.masking import mask_token
+from fastapi_csrf_protect.metrics import Meter, MetricsSink, start_meter
+from fastapi_csrf_protect.origin_policy import SAME_ORIGIN
+from fastapi_csrf_protect.parsers import (
+    JsonTokenScanner,
+    MultipartTokenScanner,
+    UrlencodedTokenScanner,
+    find_json_token,
+    find_multipart_token,
+    find_urlencoded_token,
+    is_json,
+    multipart_boundary,
+    receive_body_token,
+    receive_urlencoded_token,
+)
+from fastapi_csrf_protect.profile import CsrfProfile
+from fastapi_csrf_protect.refresh import CookieRefresh
+from fastapi_csrf_protect.serializer_cache import serializer_cache
+from fastapi_csrf_protect.tenancy import Serializer
+from fastapi_csrf_protect.token_pool import issue_tokens, sign_tokens
+from fastapi_csrf_protect.verification_cache import VerificationCache
+from fastapi_csrf_protect.verify import (
+    EXPIRED,
+    INVALID_SIGNATURE,
+    MESSAGES,
+    OK,
+    TOKEN_MISMATCH,
+    UNKNOWN_KEY,
+    WEBSOCKET_STATE_KEY,
+    VerifyResult,
+    match_token,
+    verify_chunk,
+)
+
+
+class CsrfProtectBase(ABC):
+    """
+    Abstract mixin implementing token issuance, cookies, verification and validation on
+    top of a bound CsrfProfile, leaving only token extraction to Normal and Flexible modes
+
+    Subclasses implement abstract `_extract_token`, `_extract_scope_token` and
+    `_token_in_header`.
+    """
+
+    _metrics_sinks: ClassVar[tuple[MetricsSink, ...]]
+    _profile: CsrfProfile
+
+    def generate_csrf_tokens(
+        self, secret_key: None | str = None, request: None | HTTPConnection = None
+    ) -> tuple[str, str]:
+        """
+        Generate a CSRF token and a signed CSRF token using server's secret key to be stored in cookie.
+
+        ---
+        :param secret_key: (Optional) the secret key used when generating tokens for users
+        :type secret_key: (str | None) Defaults to None.
+        :param request: (Optional) incoming request, used to resolve the secret key of
+          its tenant, required when `tenant_resolver` is configured
+        :type request: (starlette.requests.HTTPConnection | None) Defaults to None.
+        :raises ValueError: when `tenant_resolver` is configured but neither request
+          nor secret key is given
+        """
+        profile: CsrfProfile = self._profile
+        if (
+            secret_key is None
+            and request is None
+            and profile.tenant_resolver is not None
+        ):
+            raise ValueError(
+                "A request is required to generate tokens with `tenant_resolver`."
+            )
+        if secret_key is None and request is not None:
+            tenant: None | tuple[str, Serializer] = self._resolve_tenant(request.scope)
+            if tenant is not None:
+                return sign_tokens(tenant[1])
+        secret_key = secret_key or profile.secret_key
+        if secret_key is None:
+            raise RuntimeError("A secret key is required to use CsrfProtect extension.")
+        if secret_key != profile.secret_key:
+            return issue_tokens(
+                secret_key, profile.salt, algorithm=profile.token_format
+            )
+        if profile.token_pool is not None:
+            pooled: None | tuple[str, str] = profile.token_pool.pop()
+            if pooled is not None:
+                return pooled
+        key_ring: None | KeyRing = profile.key_ring
+        return issue_tokens(
+            secret_key,
+            profile.salt,
+            None if key_ring is None else key_ring.key_id,
+            profile.token_format,
+        )
+
+    def generate_many(
+        self, count: int, secret_key: None | str = None
+    ) -> list[tuple[str, str]]:
+        """
+        Generate many CSRF tokens and their signed counterparts with one serializer,
+        i.e. for operations batched into one request
+
+        ---
+        :param count: number of token pairs to be generated
+        :type count: int
+        :param secret_key: (Optional) the secret key used when generating tokens for users
+        :type secret_key: (str | None) Defaults to None.
+        """
+        profile: CsrfProfile = self._profile
+        secret_key = secret_key or profile.secret_key
+        if secret_key is None:
+            raise RuntimeError("A secret key is required to use CsrfProtect extension.")
+        key_id: None | str = None
+        serializer: None | Serializer = None
+        if secret_key == profile.secret_key:
+            key_ring: None | KeyRing = profile.key_ring
+            key_id = None if key_ring is None else key_ring.key_id
+            serializer = profile.serializer
+        if serializer is None:
+            serializer = serializer_cache.get(
+                secret_key, profile.salt, profile.token_format
+            )
+        return [sign_tokens(serializer, key_id) for _ in range(count)]
+
+    def _resolve_tenant(self, scope: Scope) -> None | tuple[str, Serializer]:
+        """
+        Resolve secret key and serializer of the tenant owning the request, if any
+
+        ---
+        :param scope: ASGI connection scope of the incoming request
+        :type scope: starlette.types.Scope
+        :raises UnknownTenantError: when tenant is unknown and no `secret_key` is
+          configured to fall back to
+        """
+        profile: CsrfProfile = self._profile
+        if profile.tenant_resolver is None:
+            return None
+        tenant: None | tuple[str, Serializer] = profile.tenant_resolver.resolve(
+            scope, profile.salt, profile.token_format
+        )
+        if tenant is None and profile.secret_key is None:
+            raise UnknownTenantError("The request does not belong to a known tenant.")
+        return tenant
+
+    def get_csrf_from_body(self, data: bytes) -> str:
+        """
+        Get token from the request body
+
+        ---
+        :param data: attached request body containing cookie data with configured `token_key`
+        :type data: bytes
+        """
+        profile: CsrfProfile = self._profile
+        token: None | str = find_urlencoded_token(data, profile.token_key)
+        if token is None:
+            raise MissingTokenError(
+                f"Missing `{profile.token_key}` in request body.", "missing_body_token"
+            )
+        return token
+
+    def _get_csrf_from_document(self, document: Any) -> str:
+        """
+        Get token from top-level `token_key` of an already parsed JSON document
+
+        ---
+        :param document: parsed JSON request body
+        :type document: Any
+        """
+        token_key: str = self._profile.token_key
+        token: Any = document.get(token_key) if isinstance(document, dict) else None
+        if not isinstance(token, str):
+            raise MissingTokenError(
+                f"Missing `{token_key}` in request body.", "missing_body_token"
+            )
+        return token
+
+    async def get_csrf_from_json(self, request: Request) -> str:
+        """
+        Get token from top-level `token_key` of JSON request body, caching the parsed
+        document on the request whenever the whole body had to be parsed
+
+        ---
+        :param request: incoming Request instance with JSON body
+        :type request: fastapi.requests.Request
+        """
+        profile: CsrfProfile = self._profile
+        token, document = find_json_token(await request.body(), profile.token_key)
+        if document is not None:
+            request._json = document  # spare `request.json()` a second parse
+        if token is None:
+            raise MissingTokenError(
+                f"Missing `{profile.token_key}` in request body.", "missing_body_token"
+            )
+        return token
+
+    async def get_csrf_from_urlencoded(self, request: Request) -> str:
+        """
+        Get token from urlencoded request body, streaming it only up to the token field
+
+        Consumed body messages are replayed to whoever reads the request body next.
+
+        ---
+        :param request: incoming Request instance with urlencoded body
+        :type request: fastapi.requests.Request
+        """
+        if hasattr(request, "_body"):
+            return self.get_csrf_from_body(request._body)
+        profile: CsrfProfile = self._profile
+        token, messages = await receive_urlencoded_token(
+            request.receive, profile.token_key
+        )
+        request._receive = replay_receive(messages, request.receive)
+        if token is None:
+            raise MissingTokenError(
+                f"Missing `{profile.token_key}` in request body.", "missing_body_token"
+            )
+        return token
+
+    async def get_csrf_from_multipart(self, request: Request, boundary: bytes) -> str:
+        """
+        Get token from multipart request body, streaming it only up to the token field
+
+        Consumed body messages are replayed to whoever reads the request body next.
+
+        ---
+        :param request: incoming Request instance with `multipart/form-data` body
+        :type request: fastapi.requests.Request
+        :param boundary: boundary parameter of the request's Content-Type header
+        :type boundary: bytes
+        """
+        profile: CsrfProfile = self._profile
+        token: None | str
+        if hasattr(request, "_body"):
+            token = find_multipart_token(request._body, boundary, profile.token_key)
+        else:
+            token, messages = await receive_body_token(
+                request.receive, MultipartTokenScanner(boundary, profile.token_key)
+            )
+            request._receive = replay_receive(messages, request.receive)
+        if token is None:
+            raise MissingTokenError(
+                f"Missing `{profile.token_key}` in request body.", "missing_body_token"
+            )
+        return token
+
+    def set_csrf_cookie(self, csrf_signed_token: str, response: Response) -> None:
+        """
+        Sets Csrf Protection token to the response cookies
+
+        ---
+        :param csrf_signed_token: signed CSRF token from `generate_csrf_token` method
+        :type csrf_signed_token: str
+        :param response: The FastAPI response object to sets the access cookies in.
+        :type response: fastapi.responses.Response
+        """
+        if not isinstance(response, Response):
+            raise TypeError("The response must be an object response FastAPI")
+        response.raw_headers.append(
+            self._profile.cookie_plan.set_cookie(csrf_signed_token)
+        )
+
+    def set_csrf_cookie_send(self, csrf_signed_token: str, send: Send) -> Send:
+        """
+        Wrap ASGI send channel so that the response sets Csrf Protection token cookie,
+        i.e. for pure ASGI apps or streaming responses sent by downstream apps
+
+        ---
+        :param csrf_signed_token: signed CSRF token from `generate_csrf_token` method
+        :type csrf_signed_token: str
+        :param send: ASGI send channel of the current response
+        :type send: starlette.types.Send
+        """
+        return send_with_header(
+            send, self._profile.cookie_plan.set_cookie(csrf_signed_token)
+        )
+
+    def ensure_csrf_cookie(self, request: HTTPConnection, response: Response) -> str:
+        """
+        Get token of the incoming CSRF cookie while it has more than
+        `cookie_refresh_fraction` of `max_age` left, neither signing a new token nor
+        setting a cookie, otherwise generate a new pair and set its cookie
+
+        ---
+        :param request: incoming request, possibly carrying a CSRF cookie
+        :type request: starlette.requests.HTTPConnection
+        :param response: The FastAPI response object to set a new cookie in, if needed
+        :type response: fastapi.responses.Response
+        :return: unsigned token matching the cookie held by the client afterwards
+        :rtype: str
+        """
+        token, signed_token, reused = self._refresh_tokens(request)
+        if not reused:
+            self.set_csrf_cookie(signed_token, response)
+        return token
+
+    def _refresh_tokens(self, request: HTTPConnection) -> tuple[str, str, bool]:
+        """
+        Reuse tokens of the incoming CSRF cookie while it has more than
+        `cookie_refresh_fraction` of `max_age` left, otherwise generate a new pair
+
+        ---
+        :param request: incoming request, possibly carrying a CSRF cookie
+        :type request: starlette.requests.HTTPConnection
+        :return: tuple of unsigned token, signed token and whether the cookie was reused
+        :rtype: tuple[str, str, bool]
+        """
+        profile: CsrfProfile = self._profile
+        refresh: CookieRefresh = profile.cookie_refresh
+        signed_token: None | str = request.cookies.get(profile.cookie_key)
+        if signed_token is not None:
+            now: float = time()
+            tenant: None | tuple[str, Serializer] = self._resolve_tenant(request.scope)
+            result, token, _ = (
+                self._unsign(signed_token, now)
+                if tenant is None
+                else self._unsign(signed_token, now, tenant[0], serializer=tenant[1])
+            )
+            if result.ok and refresh.keep(result.issued_at or 0, now):
+                refresh.record(True)
+                return token, signed_token, True
+        token, signed_token = self.generate_csrf_tokens(request=request)
+        refresh.record(False)
+        return token, signed_token, False
+
+    def deliver_csrf_token(self, request: HTTPConnection) -> Response:
+        """
+        Respond with the token of the CSRF cookie, refreshed like `ensure_csrf_cookie`,
+        both as JSON body `{"csrf_token": <token>}` and in configured `header_name`
+        header, with an ETag derived from the signed cookie so that repeat calls are
+        answered with 304 Not Modified
+
+        ---
+        :param request: incoming request, possibly carrying a CSRF cookie
+        :type request: starlette.requests.HTTPConnection
+        """
+        token, signed_token, reused = self._refresh_tokens(request)
+        etag: str = entity_tag(signed_token)
+        headers: dict[str, str] = {
+            "cache-control": CACHE_CONTROL,
+            "etag": etag,
+            "vary": "Cookie",
+        }
+        if reused and etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers=headers)
+        headers[self._profile.header_name] = token
+        response: Response = JSONResponse({"csrf_token": token}, headers=headers)
+        if not reused:
+            self.set_csrf_cookie(signed_token, response)
+        return response
+
+    @classmethod
+    def router(cls, path: str = "/token", name: str = "csrf_token") -> Router:
+        """
+        Router serving `deliver_csrf_token` on GET with loaded configurations, so that
+        pages can be cached without cookies and fetch the token asynchronously,
+        i.e. `app.mount("/csrf", CsrfProtect.router())` serves "/csrf/token"
+
+        ---
+        :param path: (Optional) path of the token endpoint within the router
+        :type path: (str) Defaults to "/token".
+        :param name: (Optional) name of the route, i.e. for `url_for`
+        :type name: (str) Defaults to "csrf_token".
+        """
+
+        async def endpoint(request: Request) -> Response:
+            return cls().deliver_csrf_token(request)
+
+        return Router(routes=[Route(path, endpoint, methods=["GET"], name=name)])
+
+    def unset_csrf_cookie(self, response: Response) -> None:
+        """
+        Remove Csrf Protection token from the response cookies
+
+        ---
+        :param response: The FastAPI response object to delete the access cookies in.
+        :type response: fastapi.responses.Response
+        """
+        if not isinstance(response, Response):
+            raise TypeError("The response must be an object response FastAPI")
+        response.raw_headers.append(self._profile.cookie_plan.unset_cookie())
+
+    def unset_csrf_cookie_send(self, send: Send) -> Send:
+        """
+        Wrap ASGI send channel so that the response removes Csrf Protection token cookie
+
+        ---
+        :param send: ASGI send channel of the current response
+        :type send: starlette.types.Send
+        """
+        return send_with_header(send, self._profile.cookie_plan.unset_cookie())
+
+    async def validate_csrf(
+        self,
+        request: Request,
+        cookie_key: None | str = None,
+        secret_key: None | str = None,
+        time_limit: None | int = None,
+    ) -> None:
+        """
+        Check if the given data is a valid CSRF token. This compares the given
+        signed token to the one stored in the session.
+
+        ---
+        :param request: incoming Request instance
+        :type request: fastapi.requests.Request
+        :param cookie_key: (Optional) field name for the CSRF token field stored in cookies
+            Default is set in CsrfConfig when `load_config` was called;
+        :type cookie_key: str
+        :param secret_key: (Optional) secret key used to decrypt the token
+            Default is set in CsrfConfig when `load_config` was called;
+        :type secret_key: str
+        :param time_limit: (Optional) Number of seconds that the token is valid.
+            Default is set in CsrfConfig when `load_config` was called;
+        :type time_limit: int
+        :raises TokenValidationError: Contains the reason that validation failed.
+        """
+        profile: CsrfProfile = self._profile
+        serializer: None | Serializer = None
+        meter: Meter = start_meter(self._metrics_sinks)
+        try:
+            if secret_key is None:
+                tenant: None | tuple[str, Serializer] = self._resolve_tenant(
+                    request.scope
+                )
+                if tenant is not None:
+                    secret_key, serializer = tenant
+            secret_key = secret_key or profile.secret_key
+            if secret_key is None:
+                raise RuntimeError(
+                    "A secret key is required to use CsrfProtect extension."
+                )
+            if profile.origin_policy is not None:
+                meter.enter("origin")
+                if profile.origin_policy.check(request.scope):
+                    meter.finish(SAME_ORIGIN)
+                    return
+            meter.enter("cookie")
+            cookie_key = cookie_key or profile.cookie_key
+            signed_token = request.cookies.get(cookie_key)
+            if signed_token is None:
+                raise MissingTokenError(
+                    f"Missing Cookie: `{cookie_key}`.", "missing_cookie"
+                )
+            time_limit = time_limit or profile.max_age
+            token: str = await self._extract_token(request, meter)
+            meter.enter("verify")
+            self._verify_tokens(signed_token, token, secret_key, time_limit, serializer)
+        except CsrfProtectError as error:
+            meter.finish(error.reason)
+            raise
+        meter.finish("ok")
+
+    @abstractmethod
+    async def _extract_token(self, request: Request, meter: Meter) -> str:
+        """
+        Get token submitted with the request, from where the mode expects it
+
+        ---
+        :param request: incoming Request instance
+        :type request: fastapi.requests.Request
+        :param meter: meter timing the extraction phases of the ongoing validation
+        :type meter: fastapi_csrf_protect.metrics.Meter
+        :raises CsrfProtectError: when the token is missing or malformed
+        """
+
+    async def _get_csrf_from_request_body(self, request: Request, meter: Meter) -> str:
+        """
+        Get token from the request body, reusing form data or JSON document already
+        parsed on the request, otherwise scanning only as much of the body as needed
+
+        ---
+        :param request: incoming Request instance
+        :type request: fastapi.requests.Request
+        :param meter: meter timing the extraction phases of the ongoing validation
+        :type meter: fastapi_csrf_protect.metrics.Meter
+        """
+        profile: CsrfProfile = self._profile
+        if hasattr(request, "_json") and request._json is not None:
+            meter.enter("extract_json")
+            return self._get_csrf_from_document(request._json)
+        if hasattr(request, "_form") and request._form is not None:
+            meter.enter("extract_form")
+            form_data: None | UploadFile | str = request._form.get(profile.token_key)
+            if not form_data or isinstance(form_data, UploadFile):
+                raise MissingTokenError(
+                    "Form data must be of type string", "invalid_form_token"
+                )
+            return form_data
+        if is_json(request.headers.get("content-type")):
+            meter.enter("extract_json")
+            return await self.get_csrf_from_json(request)
+        meter.enter("extract_body")
+        boundary: None | bytes = multipart_boundary(request.headers.get("content-type"))
+        if boundary is None:
+            return await self.get_csrf_from_urlencoded(request)
+        return await self.get_csrf_from_multipart(request, boundary)
+
+    @abstractmethod
+    def _token_in_header(self, request: Request) -> bool:
+        """
+        Tell whether the token is taken from headers, so that the body may be parsed
+        after validation rather than before
+
+        ---
+        :param request: incoming Request instance
+        :type request: fastapi.requests.Request
+        """
+
+    async def validate_csrf_body(
+        self,
+        request: Request,
+        cookie_key: None | str = None,
+        secret_key: None | str = None,
+        time_limit: None | int = None,
+    ) -> ValidatedBody:
+        """
+        Check CSRF tokens like `validate_csrf` and return the request body, parsed only
+        once and cached on the request for FastAPI's body parameters and the endpoint.
+
+        ---
+        :param request: incoming Request instance
+        :type request: fastapi.requests.Request
+        :param cookie_key: (Optional) field name for the CSRF token field stored in cookies
+        :type cookie_key: str
+        :param secret_key: (Optional) secret key used to decrypt the token
+        :type secret_key: str
+        :param time_limit: (Optional) Number of seconds that the token is valid.
+        :type time_limit: int
+        :raises TokenValidationError: Contains the reason that validation failed.
+        :return: validation outcome and form data, JSON document or raw bytes of the body
+        :rtype: fastapi_csrf_protect.body.ValidatedBody
+        """
+        if self._token_in_header(request):
+            await self.validate_csrf(request, cookie_key, secret_key, time_limit)
+            return ValidatedBody(True, await parse_body(request))
+        data: FormData | Any = await parse_body(request)
+        await self.validate_csrf(request, cookie_key, secret_key, time_limit)
+        return ValidatedBody(True, data)
+
+    @classmethod
+    async def validated_body(cls, request: Request) -> ValidatedBody:
+        """
+        Dependency validating CSRF tokens with loaded configurations, returning the
+        parsed request body, i.e. `body: ValidatedBody = Depends(CsrfProtect.validated_body)`
+
+        ---
+        :param request: incoming Request instance
+        :type request: fastapi.requests.Request
+        """
+        return await cls().validate_csrf_body(request)
+
+    def get_csrf_from_websocket(self, websocket: WebSocket) -> None | str:
+        """
+        Get token submitted during WebSocket handshake as a subprotocol named after
+        `token_key` and suffixed by the token, i.e. "csrf-token.<token>", or, only when
+        `websocket_query_token` is enabled, as query parameter, i.e. "?csrf-token=<token>"
+
+        ---
+        :param websocket: WebSocket connection being opened
+        :type websocket: starlette.websockets.WebSocket
+        """
+        token_key: str = self._profile.token_key
+        prefix: str = token_key + "."
+        for subprotocol in websocket.scope.get("subprotocols", ()):
+            if subprotocol.startswith(prefix):
+                return subprotocol[len(prefix) :] or None
+        if not self._profile.websocket_query_token:
+            return None  # query strings end up in access logs and browser history
+        return websocket.query_params.get(token_key) or None
+
+    async def validate_websocket(self, websocket: WebSocket) -> None:
+        """
+        Check CSRF tokens of a WebSocket handshake, before `websocket.accept()`, and
+        record the outcome in connection state so that later checks cost one lookup
+
+        ---
+        :param websocket: WebSocket connection being opened
+        :type websocket: starlette.websockets.WebSocket
+        :raises TokenValidationError: Contains the reason that validation failed.
+        """
+        state: dict[str, Any] = websocket.scope.setdefault("state", {})
+        result: None | VerifyResult = state.get(WEBSOCKET_STATE_KEY)
+        if result is None:
+            meter: Meter = start_meter(self._metrics_sinks)
+            try:
+                meter.enter("cookie")
+                cookie_key: str = self._profile.cookie_key
+                signed_token: None | str = websocket.cookies.get(cookie_key)
+                if signed_token is None:
+                    raise MissingTokenError(
+                        f"Missing Cookie: `{cookie_key}`.", "missing_cookie"
+                    )
+                meter.enter("extract_websocket")
+                token: None | str = self.get_csrf_from_websocket(websocket)
+                if token is None:
+                    raise MissingTokenError(
+                        f"Missing `{self._profile.token_key}` in WebSocket handshake.",
+                        "missing_websocket_token",
+                    )
+                meter.enter("verify")
+                tenant: None | tuple[str, Serializer] = self._resolve_tenant(
+                    websocket.scope
+                )
+                result = (
+                    self.verify(signed_token, token)
+                    if tenant is None
+                    else self.verify(
+                        signed_token, token, secret_key=tenant[0], serializer=tenant[1]
+                    )
+                )
+                state[WEBSOCKET_STATE_KEY] = result
+                if not result.ok:
+                    raise TokenValidationError(MESSAGES[result.reason], result.reason)
+            except CsrfProtectError as error:
+                meter.finish(error.reason)
+                raise
+            meter.finish("ok")
+        elif not result.ok:
+            raise TokenValidationError(MESSAGES[result.reason], result.reason)
+
+    @classmethod
+    async def validated_websocket(cls, websocket: WebSocket) -> None:
+        """
+        Dependency validating WebSocket handshakes with loaded configurations, closing
+        rejected connections with policy violation (1008) before they are accepted,
+        i.e. `@app.websocket("/ws", dependencies=[Depends(CsrfProtect.validated_websocket)])`
+
+        ---
+        :param websocket: WebSocket connection being opened
+        :type websocket: starlette.websockets.WebSocket
+        """
+        try:
+            await cls().validate_websocket(websocket)
+        except CsrfProtectError as error:
+            raise WebSocketException(WS_1008_POLICY_VIOLATION, error.message)
+
+    async def validate_csrf_scope(self, scope: Scope, receive: Receive) -> Receive:
+        """
+        Check CSRF tokens straight from an ASGI scope without building a Request.
+
+        ---
+        :param scope: ASGI connection scope of the incoming request
+        :type scope: starlette.types.Scope
+        :param receive: ASGI receive channel of the incoming request
+        :type receive: starlette.types.Receive
+        :raises TokenValidationError: Contains the reason that validation failed.
+        :return: receive channel replaying any body messages consumed by validation
+        :rtype: starlette.types.Receive
+        """
+        profile: CsrfProfile = self._profile
+        serializer: None | Serializer = None
+        secret_key: None | str = profile.secret_key
+        meter: Meter = start_meter(self._metrics_sinks)
+        try:
+            tenant: None | tuple[str, Serializer] = self._resolve_tenant(scope)
+            if tenant is not None:
+                secret_key, serializer = tenant
+            if secret_key is None:
+                raise RuntimeError(
+                    "A secret key is required to use CsrfProtect extension."
+                )
+            if profile.origin_policy is not None:
+                meter.enter("origin")
+                if profile.origin_policy.check(scope):
+                    meter.finish(SAME_ORIGIN)
+                    return receive
+            meter.enter("cookie")
+            raw_headers: list[tuple[bytes, bytes]] = scope["headers"]
+            signed_token = get_cookie(raw_headers, profile.cookie_key)
+            if signed_token is None:
+                raise MissingTokenError(
+                    f"Missing Cookie: `{profile.cookie_key}`.", "missing_cookie"
+                )
+            token: str
+            token, receive = await self._extract_scope_token(
+                raw_headers, receive, meter
+            )
+            meter.enter("verify")
+            self._verify_tokens(
+                signed_token, token, secret_key, profile.max_age, serializer
+            )
+        except CsrfProtectError as error:
+            meter.finish(error.reason)
+            raise
+        meter.finish("ok")
+        return receive
+
+    @abstractmethod
+    async def _extract_scope_token(
+        self, raw_headers: list[tuple[bytes, bytes]], receive: Receive, meter: Meter
+    ) -> tuple[str, Receive]:
+        """
+        Get token submitted with an ASGI request, from where the mode expects it
+
+        ---
+        :param raw_headers: list of lowercased header name and value pairs from ASGI scope
+        :type raw_headers: list[tuple[bytes, bytes]]
+        :param receive: ASGI receive channel of the incoming request
+        :type receive: starlette.types.Receive
+        :param meter: meter timing the extraction phases of the ongoing validation
+        :type meter: fastapi_csrf_protect.metrics.Meter
+        :raises CsrfProtectError: when the token is missing or malformed
+        :return: tuple of token and receive channel replaying consumed body messages
+        :rtype: tuple[str, starlette.types.Receive]
+        """
+
+    async def _receive_body_token(
+        self, raw_headers: list[tuple[bytes, bytes]], receive: Receive, meter: Meter
+    ) -> tuple[str, Receive]:
+        """
+        Get token by scanning ASGI body messages only up to the token
+
+        ---
+        :param raw_headers: list of lowercased header name and value pairs from ASGI scope
+        :type raw_headers: list[tuple[bytes, bytes]]
+        :param receive: ASGI receive channel of the incoming request
+        :type receive: starlette.types.Receive
+        :param meter: meter timing the extraction phases of the ongoing validation
+        :type meter: fastapi_csrf_protect.metrics.Meter
+        :return: tuple of token and receive channel replaying consumed body messages
+        :rtype: tuple[str, starlette.types.Receive]
+        """
+        meter.enter("extract_body")
+        token, messages = await receive_body_token(
+            receive, self._body_scanner(raw_headers)
+        )
+        receive = replay_receive(messages, receive)
+        if token is None:
+            raise MissingTokenError(
+                f"Missing `{self._profile.token_key}` in request body.",
+                "missing_body_token",
+            )
+        return token, receive
+
+    def _body_scanner(
+        self, raw_headers: list[tuple[bytes, bytes]]
+    ) -> UrlencodedTokenScanner | MultipartTokenScanner | JsonTokenScanner:
+        """
+        Create scanner matching the content type of the request body
+
+        ---
+        :param raw_headers: list of lowercased header name and value pairs from ASGI scope
+        :type raw_headers: list[tuple[bytes, bytes]]
+        """
+        token_key: str = self._profile.token_key
+        content_type: None | str = get_header(raw_headers, b"content-type")
+        if is_json(content_type):
+            return JsonTokenScanner(token_key)
+        boundary: None | bytes = multipart_boundary(content_type)
+        if boundary is None:
+            return UrlencodedTokenScanner(token_key)
+        return MultipartTokenScanner(boundary, token_key)
+
+    def verify(
+        self,
+        signed_cookie: str | bytes,
+        submitted: str | bytes,
+        *,
+        now: None | float = None,
+        secret_key: None | str = None,
+        time_limit: None | int = None,
+        serializer: None | Serializer = None,
+    ) -> VerifyResult:
+        """
+        Verify signed token from cookies and match it against submitted token, without
+        raising nor requiring a request, i.e. for websockets or message-queue consumers
+
+        ---
+        :param signed_cookie: signed token taken from the CSRF cookie
+        :type signed_cookie: str | bytes
+        :param submitted: unsigned token submitted alongside, i.e. via header or body,
+          either as generated or masked by `mask_signed_token`
+        :type submitted: str | bytes
+        :param now: (Optional) current time in seconds since epoch, `time.time()` if None
+        :type now: (float | None) Defaults to None.
+        :param secret_key: (Optional) secret key used to decrypt the signed token, or the
+          newest key of the configured key ring to look up the key by id instead
+        :type secret_key: (str | None) Defaults to None.
+        :param time_limit: (Optional) number of seconds that the token is valid
+        :type time_limit: (int | None) Defaults to None.
+        :param serializer: (Optional) serializer already resolved for given secret key
+        :type serializer: (CachedSerializer | CompactSerializer | None) Defaults to None.
+        :return: outcome carrying one of the stable reason codes of `TokenValidationError`
+        :rtype: fastapi_csrf_protect.verify.VerifyResult
+        """
+        result, signature, key_id = self._unsign(
+            signed_cookie, now, secret_key, time_limit, serializer
+        )
+        if not result.ok:
+            return result
+        if not match_token(signature, submitted):
+            return VerifyResult(False, TOKEN_MISMATCH, result.issued_at)
+        if key_id is not None:
+            self._profile.key_ring.record(key_id)  # type: ignore[union-attr]
+        return result
+
+    def _unsign(
+        self,
+        signed_cookie: str | bytes,
+        now: None | float = None,
+        secret_key: None | str = None,
+        time_limit: None | int = None,
+        serializer: None | Serializer = None,
+    ) -> tuple[VerifyResult, str, None | str]:
+        """
+        Verify signature and age of signed token from cookies
+
+        ---
+        :param signed_cookie: signed token taken from the CSRF cookie
+        :type signed_cookie: str | bytes
+        :param now: (Optional) current time in seconds since epoch, `time.time()` if None
+        :type now: (float | None) Defaults to None.
+        :param secret_key: (Optional) secret key used to decrypt the signed token
+        :type secret_key: (str | None) Defaults to None.
+        :param time_limit: (Optional) number of seconds that the token is valid
+        :type time_limit: (int | None) Defaults to None.
+        :param serializer: (Optional) serializer already resolved for given secret key
+        :type serializer: (CachedSerializer | CompactSerializer | None) Defaults to None.
+        :return: tuple of outcome, unsigned token carried by the cookie when authentic
+          and fresh, otherwise empty string, and id of the key which signed it, if any
+        :rtype: tuple[fastapi_csrf_protect.verify.VerifyResult, str, str | None]
+        """
+        profile: CsrfProfile = self._profile
+        secret_key = secret_key or profile.secret_key
+        if secret_key is None:
+            raise RuntimeError("A secret key is required to use CsrfProtect extension.")
+        time_limit = time_limit or profile.max_age
+        signed_token: str = (
+            signed_cookie.decode("latin-1")
+            if isinstance(signed_cookie, bytes)
+            else signed_cookie
+        )
+        key_ring: None | KeyRing = profile.key_ring
+        key_id: None | str = None
+        if key_ring is not None and secret_key == profile.secret_key:
+            resolved: None | tuple[str, str, str] = key_ring.resolve(signed_token)
+            if resolved is None:
+                return VerifyResult(False, UNKNOWN_KEY), "", None
+            key_id, secret_key, signed_token = resolved
+        cache: None | VerificationCache = profile.verification_cache
+        cached: None | tuple[str, int] = (
+            None if cache is None else cache.get(secret_key, profile.salt, signed_token)
+        )
+        signature: str
+        issued_at: int
+        if cached is None:
+            if serializer is None and secret_key == profile.secret_key:
+                serializer = profile.serializer
+            if serializer is None:
+                serializer = serializer_cache.get(
+                    secret_key, profile.salt, profile.token_format
+                )
+            try:
+                signature, signed_at = serializer.loads(
+                    signed_token, return_timestamp=True
+                )
+            except BadData:
+                return VerifyResult(False, INVALID_SIGNATURE), "", None
+            issued_at = int(signed_at.timestamp())
+        else:
+            signature, issued_at = cached
+        age: int = int(time() if now is None else now) - issued_at
+        if age > time_limit or age < 0:
+            return VerifyResult(False, EXPIRED, issued_at), "", None
+        if cache is not None and cached is None:
+            cache.put(secret_key, profile.salt, signed_token, signature, issued_at)
+        return VerifyResult(True, OK, issued_at), signature, key_id
+
+    def mask_signed_token(self, signed_token: str) -> None | str:
+        """
+        Mask the token carried by an already set signed cookie with a fresh one-time
+        pad, so that every rendered page gets a different form value without signing
+        a new token nor setting a new cookie
+
+        ---
+        :param signed_token: signed token taken from request cookies
+        :type signed_token: str
+        :return: masked token accepted by `validate_csrf`, None when cookie is invalid
+          or expired and a new pair must be generated instead
+        :rtype: str | None
+        """
+        result, token, _ = self._unsign(signed_token)
+        return mask_token(token) if result.ok else None
+
+    def validate_many(
+        self,
+        pairs: Iterable[tuple[str | bytes, str | bytes]],
+        *,
+        now: None | float = None,
+        secret_key: None | str = None,
+        time_limit: None | int = None,
+        executor: None | Executor = None,
+        chunksize: int = 1024,
+    ) -> list[VerifyResult]:
+        """
+        Verify many pairs of signed cookie and submitted token, i.e. operations batched
+        into one GraphQL or JSON-RPC request, against one serializer and one clock read
+
+        ---
+        :param pairs: signed cookie and submitted token pairs, as accepted by `verify`
+        :type pairs: Iterable[tuple[str | bytes, str | bytes]]
+        :param now: (Optional) current time in seconds since epoch, `time.time()` if None
+        :type now: (float | None) Defaults to None.
+        :param secret_key: (Optional) secret key used to decrypt the signed tokens
+        :type secret_key: (str | None) Defaults to None.
+        :param time_limit: (Optional) number of seconds that the tokens are valid
+        :type time_limit: (int | None) Defaults to None.
+        :param executor: (Optional) executor, i.e. ThreadPoolExecutor or
+          ProcessPoolExecutor, verifying chunks of batches larger than `chunksize`
+          concurrently with `verify_chunk`, bypassing the verification cache
+        :type executor: (concurrent.futures.Executor | None) Defaults to None.
+        :param chunksize: (Optional) number of pairs verified per executor task
+        :type chunksize: (int) Defaults to 1024.
+        :return: one outcome per pair, in the order pairs were given
+        :rtype: list[fastapi_csrf_protect.verify.VerifyResult]
+        """
+        profile: CsrfProfile = self._profile
+        secret_key = secret_key or profile.secret_key
+        if secret_key is None:
+            raise RuntimeError("A secret key is required to use CsrfProtect extension.")
+        now = time() if now is None else now
+        items: list[tuple[str | bytes, str | bytes]] = list(pairs)
+        if executor is None or len(items) <= chunksize:
+            serializer: None | Serializer = (
+                None  # resolved per key id by `verify` otherwise
+            )
+            if secret_key != profile.secret_key:
+                serializer = serializer_cache.get(
+                    secret_key, profile.salt, profile.token_format
+                )
+            return [
+                self.verify(
+                    signed,
+                    submitted,
+                    now=now,
+                    secret_key=secret_key,
+                    time_limit=time_limit,
+                    serializer=serializer,
+                )
+                for signed, submitted in items
+            ]
+        key_ring: None | KeyRing = (
+            profile.key_ring if secret_key == profile.secret_key else None
+        )
+        results: list[VerifyResult] = [VerifyResult(False, UNKNOWN_KEY)] * len(items)
+        batches: dict[str, list[tuple[int, str | bytes, str | bytes]]] = {}
+        key_ids: dict[str, str] = {}
+        for index, (signed, submitted) in enumerate(items):
+            key: str = secret_key
+            if key_ring is not None:
+                resolved: None | tuple[str, str, str] = key_ring.resolve(
+                    signed.decode("latin-1") if isinstance(signed, bytes) else signed
+                )
+                if resolved is None:
+                    continue  # left as unknown key
+                key_ids[resolved[1]] = resolved[0]
+                _, key, signed = resolved
+            batches.setdefault(key, []).append((index, signed, submitted))
+        futures: list[tuple[str, list[int], Future[list[VerifyResult]]]] = []
+        for key, batch in batches.items():
+            for start in range(0, len(batch), chunksize):
+                chunk = batch[start : start + chunksize]
+                future: Future[list[VerifyResult]] = executor.submit(
+                    verify_chunk,
+                    key,
+                    profile.salt,
+                    profile.token_format,
+                    now,
+                    time_limit or profile.max_age,
+                    [(signed, submitted) for _, signed, submitted in chunk],
+                )
+                futures.append((key, [index for index, _, _ in chunk], future))
+        for key, indexes, future in futures:
+            for index, result in zip(indexes, future.result()):
+                results[index] = result
+                if result.ok and key_ring is not None:
+                    key_ring.record(key_ids[key])
+        return results
+
+    def _verify_tokens(
+        self,
+        signed_token: str,
+        token: str,
+        secret_key: str,
+        time_limit: int,
+        serializer: None | Serializer = None,
+    ) -> None:
+        """
+        Verify signed token from cookies and match it against submitted token
+
+        ---
+        :param signed_token: signed token taken from request cookies
+        :type signed_token: str
+        :param token: unsigned token submitted via header or body
+        :type token: str
+        :param secret_key: secret key used to decrypt the signed token, or the newest
+          key of the configured key ring to look up the key by id instead
+        :type secret_key: str
+        :param time_limit: number of seconds that the token is valid
+        :type time_limit: int
+        :param serializer: (Optional) serializer already resolved for given secret key
+        :type serializer: (CachedSerializer | CompactSerializer | None) Defaults to None.
+        :raises TokenValidationError: Contains the reason that validation failed.
+        """
+        result: VerifyResult = self.verify(
+            signed_token,
+            token,
+            secret_key=secret_key,
+            time_limit=time_limit,
+            serializer=serializer,
+        )
+        if not result.ok:
+            raise TokenValidationError(MESSAGES[result.reason], result.reason)
+
+
+__all__: tuple[str, ...] = ("CsrfProtectBase",)
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2020-2026 All rights reserved.
+# FILENAME:    ~~/src/fastapi_csrf_protect/body.py
+# VERSION:     1.0.7
+# CREATED:     2026-10-17 20:00
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+"""Parse request bodies once through Starlette's own caching, for validation and endpoint alike"""
+
+### Standard library ###
+from json import JSONDecodeError
+from typing import Any, NamedTuple
+
+### Third-party packages ###
+from starlette.datastructures import FormData
+from starlette.requests import Request
+
+### Local modules ###
+from fastapi_csrf_protect.parsers import is_json, multipart_boundary
+
+URLENCODED: str = "application/x-www-form-urlencoded"
+
+
+class ValidatedBody(NamedTuple):
+    validated: bool
+    data: FormData | Any  # FormData, JSON document or raw bytes, by content type
+
+
+async def parse_body(request: Request) -> FormData | Any:
+    """
+    Parse request body according to its content type, caching the result on request
+
+    Forms are parsed by `request.form()` and JSON by `request.json()`, both caching on
+    the request, so validation, FastAPI's body parameters and the endpoint itself all
+    share one parse. Any other content type is returned as bytes.
+
+    ---
+    :param request: incoming Request instance
+    :type request: starlette.requests.Request
+    :return: form data, JSON document, or raw bytes of undecodable JSON or other bodies
+    :rtype: FormData | Any
+    """
+    content_type: None | str = request.headers.get("content-type")
+    if is_json(content_type):
+        try:
+            return await request.json()
+        except (JSONDecodeError, UnicodeDecodeError):
+            return await request.body()
+    if multipart_boundary(content_type) is not None or (
+        content_type is not None
+        and content_type.partition(";")[0].strip().lower() == URLENCODED
+    ):
+        return await request.form()
+    return await request.body()
+
+
+__all__: tuple[str, ...] = ("URLENCODED", "ValidatedBody", "parse_body")
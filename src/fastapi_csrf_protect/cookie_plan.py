@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2020-2026 All rights reserved.
+# FILENAME:    ~~/src/fastapi_csrf_protect/cookie_plan.py
+# VERSION:     1.0.7
+# CREATED:     2026-10-17 18:40
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+"""Immutable plan of Set-Cookie header bytes for the CSRF cookie, precomputed at `load_config`"""
+
+### Standard library ###
+from __future__ import annotations
+
+from http.cookies import SimpleCookie
+from typing import Literal, NamedTuple
+
+### Third-party packages ###
+from starlette.types import Message, Send
+
+SET_COOKIE: bytes = b"set-cookie"
+
+_quoting: SimpleCookie = SimpleCookie()
+
+
+class CookiePlan(NamedTuple):
+    prefix: bytes
+    suffix: bytes
+    deletion: bytes
+
+    @classmethod
+    def compile(
+        cls,
+        cookie_key: str,
+        max_age: int,
+        path: None | str,
+        domain: None | str,
+        secure: bool,
+        httponly: bool,
+        samesite: Literal["lax", "strict", "none"] | None,
+    ) -> CookiePlan:
+        """
+        Precompute everything but the cookie value, in the same attribute order and
+        format as `starlette.responses.Response.set_cookie`
+
+        ---
+        :param cookie_key: name of the cookie carrying the signed CSRF token
+        :type cookie_key: str
+        :param max_age: number of seconds until the cookie expires
+        :type max_age: int
+        :param path: (Optional) path attribute of the cookie
+        :type path: str | None
+        :param domain: (Optional) domain attribute of the cookie
+        :type domain: str | None
+        :param secure: whether the cookie is only sent over https
+        :type secure: bool
+        :param httponly: whether the cookie is hidden from javascript
+        :type httponly: bool
+        :param samesite: (Optional) samesite attribute of the cookie
+        :type samesite: Literal["lax", "strict", "none"] | None
+        """
+
+        def attributes(max_age: int, expires: None | str = None) -> str:
+            # Sorted by attribute key, just like `http.cookies.Morsel.OutputString`
+            pairs: list[str] = []
+            if domain is not None:
+                pairs.append(f"Domain={domain}")
+            if expires is not None:
+                pairs.append(f"expires={expires}")
+            if httponly:
+                pairs.append("HttpOnly")
+            pairs.append(f"Max-Age={max_age}")
+            if path is not None:
+                pairs.append(f"Path={path}")
+            if samesite is not None:
+                pairs.append(f"SameSite={samesite}")
+            if secure:
+                pairs.append("Secure")
+            return "; " + "; ".join(pairs)
+
+        return cls(
+            f"{cookie_key}=".encode("latin-1"),
+            attributes(max_age).encode("latin-1"),
+            (
+                f'{cookie_key}=""'
+                + attributes(0, expires="Thu, 01 Jan 1970 00:00:00 GMT")
+            ).encode("latin-1"),
+        )
+
+    def set_cookie(self, value: str) -> tuple[bytes, bytes]:
+        """
+        Build raw Set-Cookie header storing given value
+
+        ---
+        :param value: signed CSRF token to be stored in the cookie
+        :type value: str
+        """
+        return SET_COOKIE, self.prefix + _quoting.value_encode(value)[1].encode(
+            "latin-1"
+        ) + self.suffix
+
+    def unset_cookie(self) -> tuple[bytes, bytes]:
+        """Build raw Set-Cookie header removing the cookie"""
+        return SET_COOKIE, self.deletion
+
+
+def send_with_header(send: Send, header: tuple[bytes, bytes]) -> Send:
+    """
+    Wrap ASGI send channel so that given header is added to the response start message
+
+    ---
+    :param send: ASGI send channel of the current response
+    :type send: starlette.types.Send
+    :param header: raw header name and value pair to be added
+    :type header: tuple[bytes, bytes]
+    """
+
+    async def sender(message: Message) -> None:
+        if message["type"] == "http.response.start":
+            message = {**message, "headers": [*message.get("headers", ()), header]}
+        await send(message)
+
+    return sender
+
+
+__all__: tuple[str, ...] = ("CookiePlan", "send_with_header")
@@ -11,13 +11,22 @@
 # *************************************************************
 
 ### Standard library ###
-from typing import Any, ClassVar, Callable, Literal, Sequence
+from sys import version_info
+from typing import Any, Callable, ClassVar, Literal, Sequence
+
+if version_info >= (3, 11):
+    from typing import Self
+else:
+    from typing_extensions import Self
 
 ### Third-party packages ###
 from pydantic_settings import BaseSettings
 
 ### Local modules ###
 from fastapi_csrf_protect.load_config import LoadConfig
+from fastapi_csrf_protect.metrics import MetricsSink
+from fastapi_csrf_protect.profile import CsrfProfile
+from fastapi_csrf_protect.serializer_cache import serializer_cache
 
 
 class CsrfConfig(object):
@@ -29,7 +38,9 @@ class CsrfConfig(object):
     _header_name: ClassVar[str] = "X-CSRF-Token"
     _header_type: ClassVar[None | str] = None
     _httponly: ClassVar[bool] = True
+    _loaded_profile: ClassVar[CsrfProfile] = CsrfProfile()
     _max_age: ClassVar[int] = 3600
+    _metrics_sinks: ClassVar[tuple[MetricsSink, ...]] = ()
     _methods: ClassVar[
         set[Literal["DELETE", "GET", "OPTIONS", "PATCH", "POST", "PUT"]]
     ] = {
@@ -38,11 +49,59 @@ class CsrfConfig(object):
         "PATCH",
         "DELETE",
     }
+    _profile: CsrfProfile  # bound per instance, see `__init__` and `from_profile`
     _salt: ClassVar[str] = "fastapi-csrf-token"
     _secret_key: ClassVar[None | str] = None
     _token_location: ClassVar[str] = "header"
     _token_key: ClassVar[str] = "csrf-token"
 
+    def __init__(self) -> None:
+        self._profile = self._loaded_profile  # unaffected by later `load_config` calls
+
+    @classmethod
+    def from_profile(cls, profile: CsrfProfile) -> Self:
+        """Create instance bound to given profile instead of loaded configurations
+
+        ---
+        :param profile: settings to be used by the created instance
+        :type profile: fastapi_csrf_protect.profile.CsrfProfile
+        """
+        instance: Self = cls.__new__(cls)
+        instance._profile = profile
+        return instance
+
+    @property
+    def profile(self) -> CsrfProfile:
+        """Settings bound to this instance, exposing key ring, token pool and caches
+
+        ---
+        :returns: profile loaded at instantiation or passed to `from_profile`
+        :rtype: fastapi_csrf_protect.profile.CsrfProfile
+        """
+        return self._profile
+
+    @classmethod
+    def add_metrics_sink(cls, sink: MetricsSink) -> None:
+        """Attach metrics sink receiving phase timings and outcome of every validation
+
+        ---
+        :param sink: object implementing `observe_phase` and `count_outcome`
+        :type sink: fastapi_csrf_protect.metrics.MetricsSink
+        """
+        cls._metrics_sinks = (*cls._metrics_sinks, sink)
+
+    @classmethod
+    def remove_metrics_sink(cls, sink: MetricsSink) -> None:
+        """Detach previously attached metrics sink
+
+        ---
+        :param sink: metrics sink passed to `add_metrics_sink`
+        :type sink: fastapi_csrf_protect.metrics.MetricsSink
+        """
+        cls._metrics_sinks = tuple(
+            attached for attached in cls._metrics_sinks if attached is not sink
+        )
+
     @classmethod
     def load_config(
         cls, settings: Callable[..., Sequence[tuple[str, Any]] | BaseSettings]
@@ -55,22 +114,25 @@ class CsrfConfig(object):
         :raises pydantic_core.ValidationError: in case of settings' attribute type mismatched
         """
         config = LoadConfig(**{key.lower(): value for key, value in settings()})
-        cls._cookie_key = config.cookie_key or cls._cookie_key
-        cls._cookie_path = config.cookie_path or cls._cookie_path
-        cls._cookie_domain = config.cookie_domain
-        cls._cookie_samesite = config.cookie_samesite
-        cls._cookie_secure = (
-            False if config.cookie_secure is None else config.cookie_secure
-        )
-        cls._header_name = config.header_name or cls._header_name
-        cls._header_type = config.header_type
-        cls._httponly = True if config.httponly is None else config.httponly
-        cls._max_age = config.max_age or cls._max_age
-        cls._methods = config.methods or cls._methods
-        cls._salt = config.salt or cls._salt
-        cls._secret_key = config.secret_key
-        cls._token_location = config.token_location or cls._token_location
-        cls._token_key = config.token_key or cls._token_key
+        previous: CsrfProfile = cls._loaded_profile
+        serializer_cache.clear()
+        profile: CsrfProfile = CsrfProfile.from_config(config, previous)
+        cls._loaded_profile = profile
+        previous.close()  # instances bound to previous profile sign tokens inline
+        cls._cookie_key = profile.cookie_key
+        cls._cookie_path = profile.cookie_path
+        cls._cookie_domain = profile.cookie_domain
+        cls._cookie_samesite = profile.cookie_samesite
+        cls._cookie_secure = profile.cookie_secure
+        cls._header_name = profile.header_name
+        cls._header_type = profile.header_type
+        cls._httponly = profile.httponly
+        cls._max_age = profile.max_age
+        cls._methods = set(profile.methods)
+        cls._salt = profile.salt
+        cls._secret_key = profile.secret_key
+        cls._token_location = profile.token_location
+        cls._token_key = profile.token_key
 
 
 __all__: tuple[str, ...] = ("CsrfConfig",)
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2020-2026 All rights reserved.
+# FILENAME:    ~~/src/fastapi_csrf_protect/delivery.py
+# VERSION:     1.0.7
+# CREATED:     2026-10-17 23:50
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+"""Entity tags for token delivery endpoints, so that repeat calls are answered with 304"""
+
+### Standard library ###
+from hashlib import sha256
+
+CACHE_CONTROL: str = "private, no-cache"  # cacheable per client, revalidated by ETag
+
+
+def entity_tag(signed_token: str) -> str:
+    """
+    Derive strong entity tag from signed token, without revealing the token itself
+
+    ---
+    :param signed_token: signed token held by the client after the response
+    :type signed_token: str
+    """
+    return f'"{sha256(signed_token.encode("utf-8")).hexdigest()[:32]}"'
+
+
+def etag_matches(if_none_match: None | str, etag: str) -> bool:
+    """
+    Tell whether an If-None-Match header lists given entity tag, weakly compared
+
+    ---
+    :param if_none_match: value of If-None-Match request header, if any
+    :type if_none_match: str | None
+    :param etag: entity tag of the current representation
+    :type etag: str
+    """
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip().removeprefix("W/")
+        if candidate == etag or candidate == "*":
+            return True
+    return False
+
+
+__all__: tuple[str, ...] = ("CACHE_CONTROL", "entity_tag", "etag_matches")
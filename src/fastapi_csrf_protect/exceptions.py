@@ -12,29 +12,42 @@
 
 
 class CsrfProtectError(Exception):
-    def __init__(self, status_code: int, message: str):
+    def __init__(self, status_code: int, message: str, reason: str = "csrf_error"):
         self.status_code = status_code
         self.message = message
+        self.reason = reason  # stable code for metrics, unlike human-readable message
+
+
+class CrossOriginError(CsrfProtectError):
+    def __init__(self, message: str, reason: str = "cross_site"):
+        super().__init__(403, message, reason)
 
 
 class InvalidHeaderError(CsrfProtectError):
-    def __init__(self, message: str):
-        super().__init__(422, message)
+    def __init__(self, message: str, reason: str = "invalid_header"):
+        super().__init__(422, message, reason)
 
 
 class MissingTokenError(CsrfProtectError):
-    def __init__(self, message: str):
-        super().__init__(400, message)
+    def __init__(self, message: str, reason: str = "missing_token"):
+        super().__init__(400, message, reason)
 
 
 class TokenValidationError(CsrfProtectError):
-    def __init__(self, message: str):
-        super().__init__(401, message)
+    def __init__(self, message: str, reason: str = "invalid_token"):
+        super().__init__(401, message, reason)
+
+
+class UnknownTenantError(CsrfProtectError):
+    def __init__(self, message: str, reason: str = "unknown_tenant"):
+        super().__init__(400, message, reason)
 
 
 __all__: tuple[str, ...] = (
+    "CrossOriginError",
     "CsrfProtectError",
     "InvalidHeaderError",
     "MissingTokenError",
     "TokenValidationError",
+    "UnknownTenantError",
 )
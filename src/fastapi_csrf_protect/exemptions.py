@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2020-2026 All rights reserved.
+# FILENAME:    ~~/src/fastapi_csrf_protect/exemptions.py
+# VERSION:     1.0.7
+# CREATED:     2026-10-17 20:30
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+"""Registry of paths, prefixes and routes exempt from CSRF Protection middleware"""
+
+### Standard library ###
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from re import Pattern, compile, escape
+from typing import Any
+
+ANY_METHOD: str = "*"
+PARAMETER: Pattern[str] = compile(r"\{([^{}:]+)(?::([^{}]+))?\}")
+
+
+class _Node(object):
+    """Node of a path trie, keyed by path segment"""
+
+    __slots__ = ("children", "exact", "parameter", "prefix", "rest")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _Node] = {}
+        self.exact: bool = False  # path ending at this node
+        self.parameter: None | _Node = None  # child matching any non-empty segment
+        self.prefix: bool = False  # path ending at or below this node
+        self.rest: bool = False  # path ending below this node, i.e. `{name:path}`
+
+    def insert(self, segments: list[None | str], kind: str) -> None:
+        node: _Node = self
+        for segment in segments:
+            if segment is None:
+                if node.parameter is None:
+                    node.parameter = _Node()
+                node = node.parameter
+            else:
+                child: None | _Node = node.children.get(segment)
+                if child is None:
+                    child = node.children[segment] = _Node()
+                node = child
+        setattr(node, kind, True)
+
+    def match(self, segments: list[str], start: int) -> bool:
+        node: _Node = self
+        for index in range(start, len(segments)):
+            if node.prefix or node.rest:
+                return True
+            segment: str = segments[index]
+            child: None | _Node = node.children.get(segment)
+            if node.parameter is not None and segment:
+                if child is not None and child.match(segments, index + 1):
+                    return True
+                node = node.parameter
+            elif child is None:
+                return False
+            else:
+                node = child
+        return node.exact or node.prefix
+
+
+class Exemptions(object):
+    """
+    Registry of exact paths, path prefixes and route names bypassing CSRF validation
+
+    Entries are compiled, per method, into a trie of path segments plus a single
+    regular expression union for route templates which cannot be expressed by whole
+    segments, i.e. "/files/{name}.json". Lookups cost O(path length) regardless of the
+    number of exemptions. Prefixes match whole segments only: "/hooks" exempts
+    "/hooks" and "/hooks/github" but not "/hookshot".
+    """
+
+    def __init__(self) -> None:
+        self._entries: list[tuple[str, str, None | frozenset[str]]] = []
+        self._patterns: dict[str, Pattern[str]] = {}
+        self._tries: dict[str, _Node] = {}
+        self.compiled: bool = False
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _add(self, kind: str, value: str, methods: None | Iterable[str]) -> Exemptions:
+        self._entries.append(
+            (kind, value, None if methods is None else frozenset(methods))
+        )
+        self.compiled = False
+        return self
+
+    def add_path(self, path: str, methods: None | Iterable[str] = None) -> Exemptions:
+        """
+        Exempt one exact path, i.e. "/health"
+
+        ---
+        :param path: exact request path to be exempted
+        :type path: str
+        :param methods: (Optional) methods to be exempted, all methods when None
+        :type methods: (Iterable[str] | None) Defaults to None.
+        """
+        return self._add("path", path, methods)
+
+    def add_prefix(
+        self, prefix: str, methods: None | Iterable[str] = None
+    ) -> Exemptions:
+        """
+        Exempt every path below given prefix, i.e. "/webhooks"
+
+        ---
+        :param prefix: path prefix, matched segment by segment
+        :type prefix: str
+        :param methods: (Optional) methods to be exempted, all methods when None
+        :type methods: (Iterable[str] | None) Defaults to None.
+        """
+        return self._add("prefix", prefix.rstrip("/"), methods)
+
+    def add_route(self, name: str, methods: None | Iterable[str] = None) -> Exemptions:
+        """
+        Exempt the route registered under given name, resolved by `compile`
+
+        ---
+        :param name: name of a route of the application, i.e. "oauth_callback"
+        :type name: str
+        :param methods: (Optional) methods to be exempted, methods of the route when None
+        :type methods: (Iterable[str] | None) Defaults to None.
+        """
+        return self._add("route", name, methods)
+
+    def compile(self, routes: Iterable[Any] = ()) -> Exemptions:
+        """
+        Build lookup structures, resolving route names against application routes
+
+        ---
+        :param routes: routes of the application, i.e. `app.routes`
+        :type routes: Iterable[starlette.routing.BaseRoute]
+        :raises ValueError: when an exempted route name is not found among routes
+        """
+        templates: dict[str, list[tuple[str, None | frozenset[str]]]] = {}
+        for name, path, methods in _walk(routes):
+            if name is not None:
+                templates.setdefault(name, []).append((path, methods))
+        tries: dict[str, _Node] = {}
+        alternatives: dict[str, list[str]] = {}
+
+        def insert(template: str, kind: str, methods: None | frozenset[str]) -> None:
+            segments: list[None | str] = []
+            expression: None | str = None
+            for segment in template.split("/"):
+                parameter = PARAMETER.fullmatch(segment)
+                if parameter is None and "{" not in segment:
+                    segments.append(segment)
+                elif parameter is not None and parameter.group(2) == "path":
+                    kind = "rest"  # matches the remaining path
+                    break
+                elif parameter is not None:
+                    segments.append(None)
+                else:
+                    expression = _template_expression(template)
+                    break
+            for method in methods or (ANY_METHOD,):
+                if expression is not None:
+                    alternatives.setdefault(method, []).append(expression)
+                    continue
+                if method not in tries:
+                    tries[method] = _Node()
+                tries[method].insert(segments, kind)
+
+        for kind, value, methods in self._entries:
+            if kind != "route":
+                insert(value, "exact" if kind == "path" else "prefix", methods)
+                continue
+            if value not in templates:
+                raise ValueError(f'Exempted route "{value}" is not found')
+            for path, route_methods in templates[value]:
+                insert(path, "exact", methods or route_methods)
+        self._tries = tries
+        self._patterns = {
+            method: compile("|".join(f"(?:{item})" for item in items))
+            for method, items in alternatives.items()
+        }
+        self.compiled = True
+        return self
+
+    def is_exempt(self, method: str, path: str) -> bool:
+        """
+        Check whether a request is exempt from CSRF validation
+
+        ---
+        :param method: request method, i.e. "POST"
+        :type method: str
+        :param path: request path, i.e. "/webhooks/github"
+        :type path: str
+        """
+        if not self.compiled:
+            self.compile()
+        segments: None | list[str] = None
+        for key in (method, ANY_METHOD):
+            trie: None | _Node = self._tries.get(key)
+            if trie is not None:
+                if segments is None:
+                    segments = path.split("/")
+                if trie.match(segments, 0):
+                    return True
+            pattern: None | Pattern[str] = self._patterns.get(key)
+            if pattern is not None and pattern.fullmatch(path) is not None:
+                return True
+        return False
+
+
+def _template_expression(template: str) -> str:
+    """Translate route template into regular expression, i.e. "/files/{name}.json" """
+    expression: list[str] = []
+    position: int = 0
+    for parameter in PARAMETER.finditer(template):
+        expression.append(escape(template[position : parameter.start()]))
+        expression.append(".*" if parameter.group(2) == "path" else "[^/]+")
+        position = parameter.end()
+    expression.append(escape(template[position:]))
+    return "".join(expression)
+
+
+def _walk(
+    routes: Iterable[Any], prefix: str = ""
+) -> Iterator[tuple[None | str, str, None | frozenset[str]]]:
+    """Yield name, full path template and methods of every route, including mounts"""
+    for route in routes:
+        contexts: Any = getattr(route, "effective_route_contexts", None)
+        if callable(contexts):  # routers included by recent FastAPI versions
+            yield from _walk(contexts(), prefix)
+            continue
+        path: None | str = getattr(route, "path", None)
+        if path is None:
+            continue
+        nested: None | list[Any] = getattr(route, "routes", None)
+        if nested:
+            yield from _walk(nested, prefix + path)
+            continue
+        methods: None | set[str] = getattr(route, "methods", None)
+        yield (
+            getattr(route, "name", None),
+            prefix + path,
+            None if methods is None else frozenset(methods),
+        )
+
+
+__all__: tuple[str, ...] = ("Exemptions",)
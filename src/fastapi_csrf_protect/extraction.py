@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2020-2026 All rights reserved.
+# FILENAME:    ~~/src/fastapi_csrf_protect/extraction.py
+# VERSION:     1.0.7
+# CREATED:     2026-10-17 20:40
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+"""Immutable plan for extracting submitted CSRF tokens, chosen once per profile"""
+
+### Standard library ###
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING, NamedTuple
+
+### Third-party packages ###
+from starlette.requests import Request
+from starlette.types import Receive
+
+### Local modules ###
+from fastapi_csrf_protect.metrics import Meter
+
+if TYPE_CHECKING:
+    from fastapi_csrf_protect.core import CsrfProtect
+
+
+async def extract_header(
+    csrf_protect: CsrfProtect, request: Request, meter: Meter
+) -> str:
+    meter.enter("extract_header")
+    return csrf_protect.get_csrf_from_headers(request.headers)
+
+
+async def extract_body(
+    csrf_protect: CsrfProtect, request: Request, meter: Meter
+) -> str:
+    return await csrf_protect._get_csrf_from_request_body(request, meter)
+
+
+async def extract_scope_header(
+    csrf_protect: CsrfProtect,
+    raw_headers: list[tuple[bytes, bytes]],
+    receive: Receive,
+    meter: Meter,
+) -> tuple[str, Receive]:
+    meter.enter("extract_header")
+    plan = csrf_protect.profile.header_plan
+    return csrf_protect._parse_csrf_header(plan.find(raw_headers)), receive
+
+
+async def extract_scope_body(
+    csrf_protect: CsrfProtect,
+    raw_headers: list[tuple[bytes, bytes]],
+    receive: Receive,
+    meter: Meter,
+) -> tuple[str, Receive]:
+    return await csrf_protect._receive_body_token(raw_headers, receive, meter)
+
+
+class ExtractionPlan(NamedTuple):
+    in_header: bool
+    request: Callable[[CsrfProtect, Request, Meter], Awaitable[str]]
+    scope: Callable[
+        [CsrfProtect, list[tuple[bytes, bytes]], Receive, Meter],
+        Awaitable[tuple[str, Receive]],
+    ]
+
+    @classmethod
+    def compile(cls, token_location: str) -> ExtractionPlan:
+        """
+        Bind token extractors for configured location so requests skip the branch
+
+        ---
+        :param token_location: either "header" or "body"
+        :type token_location: str
+        """
+        if token_location == "header":
+            return cls(True, extract_header, extract_scope_header)
+        return cls(False, extract_body, extract_scope_body)
+
+
+__all__: tuple[str, ...] = (
+    "ExtractionPlan",
+    "extract_body",
+    "extract_header",
+    "extract_scope_body",
+    "extract_scope_header",
+)
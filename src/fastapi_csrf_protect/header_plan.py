@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2020-2026 All rights reserved.
+# FILENAME:    ~~/src/fastapi_csrf_protect/header_plan.py
+# VERSION:     1.0.7
+# CREATED:     2026-10-17 13:10
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+"""Immutable plan for parsing the CSRF token header, precomputed at `load_config`"""
+
+### Standard library ###
+from __future__ import annotations
+
+from re import Pattern, compile, escape
+from typing import NamedTuple
+
+
+class HeaderPlan(NamedTuple):
+    name: str
+    raw_name: bytes
+    header_type: None | str
+    parts: int
+    pattern: Pattern[str]
+
+    @classmethod
+    def compile(cls, header_name: str, header_type: None | str) -> HeaderPlan:
+        """
+        Precompute lookup name and token matcher for configured header
+
+        ---
+        :param header_name: name of the header carrying submitted CSRF token
+        :type header_name: str
+        :param header_type: (Optional) type prefixing the token, i.e. "Bearer"
+        :type header_type: str | None
+        """
+        if not header_type:
+            # <HeaderName>: <Token>
+            return cls(
+                header_name,
+                header_name.lower().encode("latin-1"),
+                None,
+                1,
+                compile(r"\s*(\S+)\s*"),
+            )
+        # <HeaderName>: <HeaderType> <Token>
+        return cls(
+            header_name,
+            header_name.lower().encode("latin-1"),
+            header_type,
+            2,
+            compile(escape(header_type) + r"\s+(\S+)\s*"),
+        )
+
+    @property
+    def expected(self) -> str:
+        """Format of header value expected by this plan, used in error messages"""
+        return "<Token>" if self.parts == 1 else f"{self.header_type} <Token>"
+
+    def find(self, raw_headers: list[tuple[bytes, bytes]]) -> None | str:
+        """
+        Look up header value among raw headers with a single pass
+
+        ---
+        :param raw_headers: list of lowercased header name and value pairs
+        :type raw_headers: list[tuple[bytes, bytes]]
+        """
+        raw_name: bytes = self.raw_name
+        for name, value in raw_headers:
+            if name == raw_name:
+                return value.decode("latin-1")
+        return None
+
+    def parse(self, value: str) -> None | str:
+        """
+        Extract token from header value, returning None when malformed
+
+        ---
+        :param value: value of the header carrying submitted CSRF token
+        :type value: str
+        """
+        matched = self.pattern.fullmatch(value)
+        return None if matched is None else matched.group(1)
+
+
+__all__: tuple[str, ...] = ("HeaderPlan",)
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2020-2026 All rights reserved.
+# FILENAME:    ~~/src/fastapi_csrf_protect/key_ring.py
+# VERSION:     1.0.7
+# CREATED:     2026-10-17 15:05
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+"""Ordered secret keys addressed by the key id embedded in signed tokens"""
+
+### Standard library ###
+from collections import Counter
+from threading import Lock
+
+KEY_ID_SEPARATOR: str = ":"
+LEGACY_KEY_ID: str = ""
+
+
+class KeyRing(object):
+    """
+    Secret keys ordered newest first, each addressed by a short key id
+
+    Signed tokens are issued as `<key_id>:<signed>` with the newest key, so that
+    verification looks up the signing key directly rather than trying every key.
+    Tokens signed before key ids were introduced carry none, and are verified with
+    the legacy key, if any, counting their validations under `LEGACY_KEY_ID`.
+
+    ---
+    :param secret_keys: mapping of key id to secret key, newest first
+    :type secret_keys: dict[str, str]
+    :param legacy_key: (Optional) secret key verifying tokens without key id
+    :type legacy_key: (str | None) Defaults to None.
+    """
+
+    def __init__(
+        self, secret_keys: dict[str, str], legacy_key: None | str = None
+    ) -> None:
+        if not secret_keys:
+            raise ValueError("KeyRing must hold at least one secret key")
+        self.legacy_key: None | str = legacy_key
+        self.secret_keys: dict[str, str] = dict(secret_keys)
+        self.key_id, self.secret_key = next(iter(self.secret_keys.items()))
+        self.validations: Counter[str] = Counter()
+        self._lock: Lock = Lock()
+
+    def record(self, key_id: str) -> None:
+        """
+        Count one successful validation of a token signed with given key
+
+        ---
+        :param key_id: id of the key which signed the validated token
+        :type key_id: str
+        """
+        with self._lock:
+            self.validations[key_id] += 1
+
+    def resolve(self, signed_token: str) -> None | tuple[str, str, str]:
+        """
+        Split key id off a signed token and look up the key which signed it
+
+        ---
+        :param signed_token: signed token taken from request cookies
+        :type signed_token: str
+        :return: tuple of key id, secret key and signed token without key id, or
+          None when the token carries no key id known to this ring
+        :rtype: tuple[str, str, str] | None
+        """
+        key_id, separator, signed = signed_token.partition(KEY_ID_SEPARATOR)
+        if not separator and self.legacy_key is not None:
+            return LEGACY_KEY_ID, self.legacy_key, signed_token
+        secret_key: None | str = self.secret_keys.get(key_id) if separator else None
+        if secret_key is None:
+            return None
+        return key_id, secret_key, signed
+
+
+__all__: tuple[str, ...] = ("KEY_ID_SEPARATOR", "LEGACY_KEY_ID", "KeyRing")
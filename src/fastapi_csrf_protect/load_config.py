@@ -12,21 +12,28 @@
 
 ### Standard library ###
 from __future__ import annotations
+from re import fullmatch
 from typing import Literal
 
 ### Third-party packages ###
 from pydantic import (
     BaseModel,
+    InstanceOf,
     StrictBool,
+    StrictFloat,
     StrictInt,
     StrictStr,
     model_validator,
 )
 
+### Local modules ###
+from fastapi_csrf_protect.tenancy import TenantResolver
+
 
 class LoadConfig(BaseModel):
     cookie_key: None | StrictStr = "fastapi-csrf-token"
     cookie_path: None | StrictStr = "/"
+    cookie_refresh_fraction: None | StrictFloat = None
     cookie_domain: None | StrictStr = None
     cookie_samesite: Literal["lax", "none", "strict"] | None = "lax"
     cookie_secure: None | StrictBool = False
@@ -37,10 +44,21 @@ class LoadConfig(BaseModel):
     methods: None | set[Literal["DELETE", "GET", "OPTIONS", "PATCH", "POST", "PUT"]] = (
         None
     )
+    origin_policy: Literal["allow_same_origin", "reject_cross_site"] | None = None
     salt: None | StrictStr = None
     secret_key: None | StrictStr = None
+    secret_keys: None | dict[StrictStr, StrictStr] = None
+    tenant_resolver: None | InstanceOf[TenantResolver] = None
     token_location: Literal["body", "header"] | None = "header"
+    token_format: Literal["compact", "itsdangerous"] | None = "itsdangerous"
     token_key: None | StrictStr = None
+    token_pool_freshness: None | StrictInt = None
+    token_pool_low_water: None | StrictInt = None
+    token_pool_size: None | StrictInt = None
+    trusted_origins: None | set[StrictStr] = None
+    verification_cache_size: None | StrictInt = None
+    verification_cache_ttl: None | StrictInt = None
+    websocket_query_token: None | StrictBool = None
 
     @model_validator(mode="after")
     def validate_cookie_samesite_none_secure(self) -> LoadConfig:
@@ -50,6 +68,46 @@ class LoadConfig(BaseModel):
             )
         return self
 
+    @model_validator(mode="after")
+    def validate_cookie_refresh_fraction(self) -> LoadConfig:
+        if self.cookie_refresh_fraction is not None and not (
+            0 <= self.cookie_refresh_fraction < 1
+        ):
+            raise ValueError(
+                'The "cookie_refresh_fraction" must be at least 0 and less than 1'
+            )
+        return self
+
+    @model_validator(mode="after")
+    def validate_origin_policy(self) -> LoadConfig:
+        if self.trusted_origins is None:
+            return self
+        if self.origin_policy is None:
+            raise ValueError(
+                'The "trusted_origins" cannot be set without an "origin_policy"'
+            )
+        for origin in self.trusted_origins:
+            if fullmatch(r"[A-Za-z][0-9A-Za-z+.-]*://[^/?#\s]+/?", origin) is None:
+                raise ValueError(
+                    f'Origin "{origin}" in "trusted_origins" must be of form '
+                    '"<scheme>://<host>[:<port>]", i.e. "https://example.com"'
+                )
+        return self
+
+    @model_validator(mode="after")
+    def validate_secret_keys(self) -> LoadConfig:
+        if self.secret_keys is None:
+            return self
+        if not self.secret_keys:
+            raise ValueError('The "secret_keys" must hold at least one secret key')
+        for key_id in self.secret_keys:
+            if fullmatch(r"[0-9A-Za-z_-]{1,16}", key_id) is None:
+                raise ValueError(
+                    f'Key id "{key_id}" in "secret_keys" must be 1 to 16 characters '
+                    "of letters, digits, hyphens or underscores"
+                )
+        return self
+
     @model_validator(mode="after")
     def validate_token_key(self) -> LoadConfig:
         token_location: str = (
@@ -62,5 +120,37 @@ class LoadConfig(BaseModel):
                 )
         return self
 
+    @model_validator(mode="after")
+    def validate_token_pool(self) -> LoadConfig:
+        if self.token_pool_size is None:
+            return self
+        if self.token_pool_size < 1:
+            raise ValueError('The "token_pool_size" must be a positive integer')
+        if self.token_pool_low_water is not None and not (
+            0 <= self.token_pool_low_water <= self.token_pool_size
+        ):
+            raise ValueError(
+                'The "token_pool_low_water" must be between 0 and "token_pool_size"'
+            )
+        max_age: int = self.max_age or 3600
+        if self.token_pool_freshness is not None and not (
+            0 < self.token_pool_freshness < max_age
+        ):
+            raise ValueError(
+                'The "token_pool_freshness" must be positive and less than "max_age"'
+            )
+        return self
+
+    @model_validator(mode="after")
+    def validate_verification_cache(self) -> LoadConfig:
+        if (
+            self.verification_cache_size is not None
+            and self.verification_cache_size < 1
+        ):
+            raise ValueError('The "verification_cache_size" must be a positive integer')
+        if self.verification_cache_ttl is not None and self.verification_cache_ttl < 1:
+            raise ValueError('The "verification_cache_ttl" must be a positive integer')
+        return self
+
 
 __all__: tuple[str, ...] = ("LoadConfig",)
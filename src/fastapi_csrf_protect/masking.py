@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2020-2026 All rights reserved.
+# FILENAME:    ~~/src/fastapi_csrf_protect/masking.py
+# VERSION:     1.0.7
+# CREATED:     2026-10-17 23:00
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+"""One-time-pad masking of CSRF tokens, so rendered form values change per response
+
+Masked tokens are the hexadecimal pad followed by the hexadecimal token XOR-ed with the
+pad, 80 characters for the 40-character tokens issued by CsrfProtect.
+"""
+
+### Standard library ###
+from os import urandom
+
+
+def _xor(left: bytes, right: bytes) -> bytes:
+    """XOR two byte strings of equal length without branching on their contents"""
+    return (int.from_bytes(left, "big") ^ int.from_bytes(right, "big")).to_bytes(
+        len(left), "big"
+    )
+
+
+def mask_token(token: str) -> str:
+    """
+    Mask hexadecimal token with a fresh one-time pad
+
+    ---
+    :param token: unsigned token as returned by `generate_csrf_tokens`
+    :type token: str
+    :raises ValueError: when the token is not hexadecimal
+    """
+    raw: bytes = bytes.fromhex(token)
+    pad: bytes = urandom(len(raw))
+    return pad.hex() + _xor(pad, raw).hex()
+
+
+def unmask_token(masked: bytes) -> bytes:
+    """
+    Recover token from masked token, in time independent of the token itself
+
+    ---
+    :param masked: masked token produced by `mask_token`, encoded in ASCII
+    :type masked: bytes
+    :return: unmasked token encoded in ASCII, empty when malformed
+    :rtype: bytes
+    """
+    half: int = len(masked) // 2
+    try:
+        pad: bytes = bytes.fromhex(masked[:half].decode("ascii"))
+        raw: bytes = bytes.fromhex(masked[half:].decode("ascii"))
+    except ValueError:
+        return b""
+    if len(pad) != len(raw):
+        return b""
+    return _xor(pad, raw).hex().encode("ascii")
+
+
+__all__: tuple[str, ...] = ("mask_token", "unmask_token")
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2020-2026 All rights reserved.
+# FILENAME:    ~~/src/fastapi_csrf_protect/metrics.py
+# VERSION:     1.0.7
+# CREATED:     2026-10-17 16:15
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+"""Instrumentation hooks reporting validation phase timings and outcome reasons
+
+Phases are "origin", "cookie", "extract_header", "extract_json", "extract_form",
+"extract_body", "extract_websocket" and "verify". Outcome reasons are "ok",
+"same_origin" when the token check was skipped by the origin policy, or the `reason` of
+the raised error, i.e. "cross_site", "missing_cookie", "missing_header",
+"malformed_header", "missing_body_token", "missing_websocket_token",
+"invalid_form_token", "unknown_key", "expired", "invalid_signature" and
+"token_mismatch".
+"""
+
+### Standard library ###
+from bisect import bisect_left
+from collections.abc import Sequence
+from threading import Lock
+from time import perf_counter
+from typing import Protocol
+
+
+class MetricsSink(Protocol):
+    """Receiver of measurements taken while validating CSRF tokens"""
+
+    def observe_phase(self, phase: str, seconds: float) -> None:
+        """
+        Receive time spent in one phase of a validation
+
+        ---
+        :param phase: name of the phase, i.e. "verify"
+        :type phase: str
+        :param seconds: duration of the phase in seconds
+        :type seconds: float
+        """
+        ...
+
+    def count_outcome(self, reason: str) -> None:
+        """
+        Receive outcome of a validation
+
+        ---
+        :param reason: "ok" or stable reason code of the raised error
+        :type reason: str
+        """
+        ...
+
+
+class Meter(object):
+    """
+    Per-validation stopwatch forwarding phase timings and outcome to metrics sinks
+
+    ---
+    :param sinks: metrics sinks receiving measurements
+    :type sinks: Sequence[MetricsSink]
+    """
+
+    __slots__ = ("_phase", "_sinks", "_started")
+
+    def __init__(self, sinks: Sequence[MetricsSink]) -> None:
+        self._phase: None | str = None
+        self._sinks: Sequence[MetricsSink] = sinks
+        self._started: float = 0.0
+
+    def _close(self, now: float) -> None:
+        if self._phase is not None:
+            for sink in self._sinks:
+                sink.observe_phase(self._phase, now - self._started)
+
+    def enter(self, phase: str) -> None:
+        """
+        End current phase, if any, and start timing the next one
+
+        ---
+        :param phase: name of the phase being started
+        :type phase: str
+        """
+        now: float = perf_counter()
+        self._close(now)
+        self._phase = phase
+        self._started = now
+
+    def finish(self, reason: str) -> None:
+        """
+        End current phase and report the outcome of the validation
+
+        ---
+        :param reason: "ok" or stable reason code of the raised error
+        :type reason: str
+        """
+        self._close(perf_counter())
+        self._phase = None
+        for sink in self._sinks:
+            sink.count_outcome(reason)
+
+
+class NullMeter(Meter):
+    """Meter used when no sinks are attached, doing nothing at all"""
+
+    __slots__ = ()
+
+    def enter(self, phase: str) -> None:
+        pass
+
+    def finish(self, reason: str) -> None:
+        pass
+
+
+NULL_METER: Meter = NullMeter(())
+
+
+def start_meter(sinks: Sequence[MetricsSink]) -> Meter:
+    """
+    Get meter for one validation, shared no-op meter when no sinks are attached
+
+    ---
+    :param sinks: metrics sinks receiving measurements
+    :type sinks: Sequence[MetricsSink]
+    """
+    return Meter(sinks) if sinks else NULL_METER
+
+
+class PrometheusMetrics(object):
+    """
+    In-memory MetricsSink keeping Prometheus-style outcome counters and phase histograms
+
+    ---
+    :param namespace: (Optional) prefix of rendered metric names
+    :type namespace: (str) Defaults to "fastapi_csrf".
+    :param buckets: (Optional) ascending upper bounds in seconds of histogram buckets
+    :type buckets: (Sequence[float]) Defaults to 10 microseconds up to 10 milliseconds.
+    """
+
+    def __init__(
+        self,
+        namespace: str = "fastapi_csrf",
+        buckets: Sequence[float] = (
+            0.00001,
+            0.000025,
+            0.00005,
+            0.0001,
+            0.00025,
+            0.0005,
+            0.001,
+            0.0025,
+            0.005,
+            0.01,
+        ),
+    ) -> None:
+        self.buckets: tuple[float, ...] = tuple(sorted(buckets))
+        self.namespace: str = namespace
+        self.outcomes: dict[str, int] = {}
+        self.phases: dict[str, tuple[list[int], list[float]]] = {}
+        self._lock: Lock = Lock()
+
+    def observe_phase(self, phase: str, seconds: float) -> None:
+        with self._lock:
+            histogram: None | tuple[list[int], list[float]] = self.phases.get(phase)
+            if histogram is None:
+                histogram = ([0] * (len(self.buckets) + 1), [0.0])
+                self.phases[phase] = histogram
+            histogram[0][bisect_left(self.buckets, seconds)] += 1
+            histogram[1][0] += seconds
+
+    def count_outcome(self, reason: str) -> None:
+        with self._lock:
+            self.outcomes[reason] = self.outcomes.get(reason, 0) + 1
+
+    def render(self) -> str:
+        """Render metrics in Prometheus text exposition format"""
+        outcomes: str = f"{self.namespace}_validations_total"
+        phases: str = f"{self.namespace}_phase_seconds"
+        lines: list[str] = [
+            f"# HELP {outcomes} CSRF validations by outcome reason.",
+            f"# TYPE {outcomes} counter",
+        ]
+        with self._lock:
+            for reason, count in sorted(self.outcomes.items()):
+                lines.append(f'{outcomes}{{reason="{reason}"}} {count}')
+            lines.append(f"# HELP {phases} Time spent per CSRF validation phase.")
+            lines.append(f"# TYPE {phases} histogram")
+            for phase, (counts, total) in sorted(self.phases.items()):
+                cumulative: int = 0
+                for bound, count in zip((*self.buckets, "+Inf"), counts):
+                    cumulative += count
+                    lines.append(
+                        f'{phases}_bucket{{phase="{phase}",le="{bound}"}} {cumulative}'
+                    )
+                lines.append(f'{phases}_sum{{phase="{phase}"}} {total[0]}')
+                lines.append(f'{phases}_count{{phase="{phase}"}} {cumulative}')
+        return "\n".join(lines) + "\n"
+
+
+__all__: tuple[str, ...] = (
+    "NULL_METER",
+    "Meter",
+    "MetricsSink",
+    "NullMeter",
+    "PrometheusMetrics",
+    "start_meter",
+)
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2020-2026 All rights reserved.
+# FILENAME:    ~~/src/fastapi_csrf_protect/middleware.py
+# VERSION:     1.0.7
+# CREATED:     2026-10-17 10:05
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+"""Pure ASGI middleware enforcing CSRF Protection on configured `methods`"""
+
+### Third-party packages ###
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+### Local modules ###
+from fastapi_csrf_protect.core import CsrfProtect
+from fastapi_csrf_protect.exceptions import CsrfProtectError
+from fastapi_csrf_protect.exemptions import Exemptions
+from fastapi_csrf_protect.flexible import CsrfProtect as FlexibleCsrfProtect
+from fastapi_csrf_protect.profile import CsrfProfile
+
+
+class CsrfProtectMiddleware(object):
+    """
+    Validate CSRF tokens on every http request using one of the configured `methods`
+
+    Requests with safe methods are passed downstream untouched, without building
+    a Request instance nor reading the request body.
+
+    ---
+    :param app: downstream ASGI application
+    :type app: starlette.types.ASGIApp
+    :param csrf_protect: (Optional) CsrfProtect class holding loaded configurations,
+      i.e. `fastapi_csrf_protect.flexible.CsrfProtect` to accept tokens from either
+      header or body
+    :type csrf_protect: (type[CsrfProtect]) Defaults to `CsrfProtect`.
+    :param profile: (Optional) settings to enforce instead of those loaded on
+      `csrf_protect` via `load_config`, i.e. to protect mounts with different settings
+    :type profile: (CsrfProfile | None) Defaults to None.
+    :param exempt: (Optional) paths, prefixes and route names to be passed downstream
+      without validation, i.e. webhooks, compiled against application routes on startup
+      so that unknown route names fail the lifespan startup
+    :type exempt: (Exemptions | None) Defaults to None.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        csrf_protect: type[CsrfProtect] | type[FlexibleCsrfProtect] = CsrfProtect,
+        profile: None | CsrfProfile = None,
+        exempt: None | Exemptions = None,
+    ) -> None:
+        self.app = app
+        self.csrf_protect = csrf_protect
+        self.exempt = exempt
+        self.profile = profile
+        self._compile_error: None | ValueError = None
+
+    def _compile_exemptions(self, exempt: Exemptions, scope: Scope) -> None:
+        """
+        Compile exemptions against application routes once, keeping the error, if any,
+        instead of compiling again on every request
+
+        ---
+        :param exempt: exemptions not compiled yet
+        :type exempt: fastapi_csrf_protect.exemptions.Exemptions
+        :param scope: ASGI connection scope carrying the application
+        :type scope: starlette.types.Scope
+        :raises ValueError: when an exempted route name is not found among routes
+        """
+        if self._compile_error is None:
+            try:
+                exempt.compile(getattr(scope.get("app"), "routes", ()))
+                return
+            except ValueError as error:
+                self._compile_error = error
+        raise self._compile_error
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        exempt: None | Exemptions = self.exempt
+        if exempt is not None and not exempt.compiled:
+            if scope["type"] == "lifespan":
+                try:
+                    self._compile_exemptions(exempt, scope)
+                except ValueError as error:
+                    await receive()  # lifespan.startup
+                    await send(
+                        {"type": "lifespan.startup.failed", "message": str(error)}
+                    )
+                    raise
+            else:  # servers running without lifespan
+                self._compile_exemptions(exempt, scope)
+        profile: CsrfProfile = self.profile or self.csrf_protect._loaded_profile
+        if scope["type"] != "http" or scope["method"] not in profile.methods:
+            await self.app(scope, receive, send)
+            return
+        if exempt is not None and exempt.is_exempt(scope["method"], scope["path"]):
+            await self.app(scope, receive, send)
+            return
+        csrf_protect = self.csrf_protect.from_profile(profile)
+        try:
+            receive = await csrf_protect.validate_csrf_scope(scope, receive)
+        except CsrfProtectError as error:
+            response: JSONResponse = JSONResponse(
+                status_code=error.status_code, content={"detail": error.message}
+            )
+            await response(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
+
+
+__all__: tuple[str, ...] = ("CsrfProtectMiddleware",)
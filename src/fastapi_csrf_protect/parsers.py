@@ -0,0 +1,537 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2020-2026 All rights reserved.
+# FILENAME:    ~~/src/fastapi_csrf_protect/parsers.py
+# VERSION:     1.0.7
+# CREATED:     2026-10-17 11:02
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+"""Incremental scanners locating submitted CSRF tokens inside request bodies"""
+
+### Standard library ###
+from json import JSONDecodeError, JSONDecoder, loads
+from json.decoder import scanstring
+from re import IGNORECASE, Match, Pattern, compile, escape
+from typing import Any
+from urllib.parse import unquote_to_bytes
+
+### Third-party packages ###
+from starlette.types import Message, Receive
+
+PARAMETER: Pattern[str] = compile(
+    r';\s*([^\s=;]+)\s*=\s*(?:"((?:[^"\\]|\\.)*)"|([^\s;]*))'
+)
+MULTIPART: Pattern[str] = compile(r"\s*multipart/form-data\s*(;.*)?", IGNORECASE)
+JSON: Pattern[str] = compile(r"\s*application/(?:[^;\s]+\+)?json\s*(;.*)?", IGNORECASE)
+JSON_WHITESPACE: Pattern[str] = compile(r"[ \t\n\r]*")
+
+_json_decoder: JSONDecoder = JSONDecoder()
+
+
+def _header_parameters(value: str) -> dict[str, str]:
+    """
+    Parse parameters of a header value, i.e. `form-data; name="csrf-token"`
+
+    ---
+    :param value: value of a header such as Content-Type or Content-Disposition
+    :type value: str
+    """
+    return {
+        found.group(1).lower(): (
+            found.group(3)
+            if found.group(2) is None
+            else found.group(2).replace('\\"', '"').replace("\\\\", "\\")
+        )
+        for found in PARAMETER.finditer(value)
+    }
+
+
+def multipart_boundary(content_type: None | str) -> None | bytes:
+    """
+    Get boundary of `multipart/form-data` content type, None for any other content type
+
+    ---
+    :param content_type: value of the Content-Type header of the request, if any
+    :type content_type: str | None
+    """
+    if content_type is None:
+        return None
+    matched: None | Match[str] = MULTIPART.fullmatch(content_type)
+    if matched is None:
+        return None
+    boundary: None | str = _header_parameters(matched.group(1) or "").get("boundary")
+    return boundary.encode("latin-1") if boundary else None
+
+
+def is_json(content_type: None | str) -> bool:
+    """
+    Check whether content type is `application/json` or any `application/*+json`
+
+    ---
+    :param content_type: value of the Content-Type header of the request, if any
+    :type content_type: str | None
+    """
+    return content_type is not None and JSON.fullmatch(content_type) is not None
+
+
+def _unquote_plus(data: bytes | bytearray) -> bytes:
+    return unquote_to_bytes(bytes(data).replace(b"+", b" "))
+
+
+def _compile_field_pattern(token_key: str) -> Pattern[bytes]:
+    """
+    Compile pattern matching `&<token_key>=` with any legal percent-encoding of the name
+
+    ---
+    :param token_key: field name of the submitted CSRF token
+    :type token_key: str
+    """
+    alternatives: list[bytes] = []
+    for byte in token_key.encode("utf-8"):
+        high, low = b"%X" % (byte >> 4), b"%X" % (byte & 0xF)
+        encoded: bytes = b"%%[%s%s][%s%s]" % (high, high.lower(), low, low.lower())
+        if byte == 0x20:
+            alternatives.append(b"(?:\\+|" + encoded + b")")
+        elif byte == 0x2B:
+            alternatives.append(encoded)
+        else:
+            alternatives.append(b"(?:" + escape(bytes((byte,))) + b"|" + encoded + b")")
+    return compile(b"&" + b"".join(alternatives) + b"=")
+
+
+class UrlencodedTokenScanner(object):
+    """
+    Scan `application/x-www-form-urlencoded` chunks for the value of `token_key`
+
+    Chunks are searched for the field name with one compiled pattern; only a short
+    tail spanning chunk boundaries and the matched value are ever buffered, and
+    scanning stops at the first match.
+
+    ---
+    :param token_key: field name of the submitted CSRF token
+    :type token_key: str
+    :param max_value_size: (Optional) largest token value in bytes worth buffering
+    :type max_value_size: (int) Defaults to 4096.
+    """
+
+    __slots__ = (
+        "_max_value_size",
+        "_pattern",
+        "_tail",
+        "_tail_size",
+        "_value",
+        "token",
+    )
+
+    def __init__(self, token_key: str, max_value_size: int = 4096) -> None:
+        self._max_value_size: int = max_value_size
+        self._pattern: Pattern[bytes] = _compile_field_pattern(token_key)
+        self._tail: None | bytes = b"&"  # stream start is a field boundary
+        self._tail_size: int = len(token_key.encode("utf-8")) * 3 + 1
+        self._value: None | bytearray = None
+        self.token: None | str = None
+
+    def _collect(self, data: bytes, start: int) -> None | str:
+        value: bytearray = self._value  # type: ignore[assignment]
+        separator: int = data.find(b"&", start)
+        value += data[start : len(data) if separator == -1 else separator]
+        if separator != -1:
+            self.token = _unquote_plus(value).decode("utf-8", "replace")
+        elif len(value) > self._max_value_size:
+            self._value = None  # give up on oversized values
+            self._tail = None
+        return self.token
+
+    @property
+    def done(self) -> bool:
+        """Whether scanning has ended, either with a token or by giving up on one"""
+        return self.token is not None or (self._tail is None and self._value is None)
+
+    def feed(self, chunk: bytes) -> None | str:
+        """
+        Consume next chunk of request body
+
+        ---
+        :param chunk: next chunk of urlencoded request body
+        :type chunk: bytes
+        :return: value of `token_key` as soon as the complete field has been seen
+        :rtype: str | None
+        """
+        if self.token is not None or not chunk:
+            return self.token
+        if self._value is not None:
+            return self._collect(chunk, 0)
+        if self._tail is None:
+            return None
+        data: bytes = self._tail + chunk
+        found: None | Match[bytes] = self._pattern.search(data)
+        if found is None:
+            self._tail = data[-self._tail_size :]
+            return None
+        self._value = bytearray()
+        return self._collect(data, found.end())
+
+    def close(self) -> None | str:
+        """
+        Signal end of request body, completing any value still being collected
+
+        ---
+        :return: value of `token_key` when found anywhere in the request body
+        :rtype: str | None
+        """
+        if self.token is None and self._value is not None:
+            self.token = _unquote_plus(self._value).decode("utf-8", "replace")
+        self._value = None
+        return self.token
+
+
+def find_urlencoded_token(data: bytes, token_key: str) -> None | str:
+    """
+    Find value of `token_key` within complete urlencoded request body
+
+    ---
+    :param data: urlencoded request body
+    :type data: bytes
+    :param token_key: field name of the submitted CSRF token
+    :type token_key: str
+    """
+    scanner: UrlencodedTokenScanner = UrlencodedTokenScanner(token_key)
+    return scanner.feed(data) or scanner.close()
+
+
+async def receive_urlencoded_token(
+    receive: Receive, token_key: str
+) -> tuple[None | str, list[Message]]:
+    """
+    Consume urlencoded body messages from receive channel until `token_key` is found
+
+    ---
+    :param receive: ASGI receive channel of the current request
+    :type receive: starlette.types.Receive
+    :param token_key: field name of the submitted CSRF token
+    :type token_key: str
+    :return: token value, if any, and the messages consumed to be replayed
+    :rtype: tuple[str | None, list[starlette.types.Message]]
+    """
+    return await receive_body_token(receive, UrlencodedTokenScanner(token_key))
+
+
+class MultipartTokenScanner(object):
+    """
+    Scan `multipart/form-data` chunks for the value of the `token_key` field
+
+    Part headers are parsed incrementally and scanning stops as soon as the field has
+    been read. Other fields are skipped while only buffering a tail as long as the
+    boundary delimiter. Scanning also stops, without a token, at the first file part,
+    so that uploads are neither read nor retained for replay; the token field must
+    therefore precede any file in the form.
+
+    ---
+    :param boundary: boundary parameter of the request's Content-Type header
+    :type boundary: bytes
+    :param token_key: field name of the submitted CSRF token
+    :type token_key: str
+    :param max_value_size: (Optional) largest token value in bytes worth buffering
+    :type max_value_size: (int) Defaults to 4096.
+    :param max_header_size: (Optional) largest part header block in bytes to parse
+    :type max_header_size: (int) Defaults to 16384.
+    """
+
+    __slots__ = (
+        "_buffer",
+        "_delimiter",
+        "_max_header_size",
+        "_max_value_size",
+        "_state",
+        "_token_key",
+        "token",
+    )
+
+    def __init__(
+        self,
+        boundary: bytes,
+        token_key: str,
+        max_value_size: int = 4096,
+        max_header_size: int = 16384,
+    ) -> None:
+        self._buffer: bytes = b"\r\n"  # stream start is a line start for the delimiter
+        self._delimiter: bytes = b"\r\n--" + boundary
+        self._max_header_size: int = max_header_size
+        self._max_value_size: int = max_value_size
+        self._state: str = "skip"  # skip, boundary, headers, value or done
+        self._token_key: str = token_key
+        self.token: None | str = None
+
+    def _skip(self, data: bytes) -> bytes:
+        found: int = data.find(self._delimiter)
+        if found == -1:
+            return data[-len(self._delimiter) + 1 :]
+        self._state = "boundary"
+        return data[found + len(self._delimiter) :]
+
+    def _boundary(self, data: bytes) -> bytes:
+        if data[:2] == b"--":
+            self._state = "done"  # close delimiter
+            return b""
+        line_end: int = data.find(b"\r\n")
+        if line_end == -1:
+            if len(data) > self._max_header_size:
+                self._state = "done"
+            return data
+        self._state = "headers"
+        return b"\r\n" + data[line_end + 2 :]  # part without headers starts with CRLF
+
+    def _headers(self, data: bytes) -> bytes:
+        headers_end: int = data.find(b"\r\n\r\n")
+        if headers_end == -1:
+            if len(data) > self._max_header_size:
+                self._state = "done"
+            return data
+        disposition: dict[str, str] = {}
+        for line in data[2:headers_end].split(b"\r\n"):
+            name, _, value = line.partition(b":")
+            if name.strip().lower() == b"content-disposition":
+                disposition = _header_parameters(value.decode("utf-8", "replace"))
+        if "filename" in disposition or "filename*" in disposition:
+            self._state = "done"  # token must precede files, never buffer uploads
+            return b""
+        self._state = "value" if disposition.get("name") == self._token_key else "skip"
+        return data[headers_end + 4 :]
+
+    def _value(self, data: bytes) -> bytes:
+        found: int = data.find(self._delimiter)
+        if found != -1:
+            self.token = data[:found].decode("utf-8", "replace")
+            self._state = "done"
+            return b""
+        if len(data) > self._max_value_size + len(self._delimiter):
+            self._state = "skip"  # give up on oversized values
+            return data[-len(self._delimiter) + 1 :]
+        return data
+
+    @property
+    def done(self) -> bool:
+        """Whether scanning has ended, either with a token or at the first file part"""
+        return self._state == "done"
+
+    def feed(self, chunk: bytes) -> None | str:
+        """
+        Consume next chunk of request body
+
+        ---
+        :param chunk: next chunk of multipart request body
+        :type chunk: bytes
+        :return: value of `token_key` as soon as the complete field has been seen
+        :rtype: str | None
+        """
+        if self._state == "done" or not chunk:
+            return self.token
+        data: bytes = self._buffer + chunk
+        while self._state != "done":
+            state: str = self._state
+            if state == "skip":
+                data = self._skip(data)
+            elif state == "boundary":
+                data = self._boundary(data)
+            elif state == "headers":
+                data = self._headers(data)
+            else:
+                data = self._value(data)
+            if self._state == state:
+                break  # current state needs more data
+        self._buffer = data
+        return self.token
+
+    def close(self) -> None | str:
+        """
+        Signal end of request body
+
+        ---
+        :return: value of `token_key` when found anywhere in the request body
+        :rtype: str | None
+        """
+        self._buffer = b""
+        self._state = "done"
+        return self.token
+
+
+def find_multipart_token(data: bytes, boundary: bytes, token_key: str) -> None | str:
+    """
+    Find value of `token_key` field within complete multipart request body
+
+    ---
+    :param data: multipart request body
+    :type data: bytes
+    :param boundary: boundary parameter of the request's Content-Type header
+    :type boundary: bytes
+    :param token_key: field name of the submitted CSRF token
+    :type token_key: str
+    """
+    scanner: MultipartTokenScanner = MultipartTokenScanner(boundary, token_key)
+    return scanner.feed(data) or scanner.close()
+
+
+def find_json_token(data: bytes, token_key: str) -> tuple[None | str, Any]:
+    """
+    Find string value of top-level `token_key` in JSON request body
+
+    Members of the top-level object are decoded one at a time and scanning stops at
+    the first `token_key`, leaving the rest of the document unparsed and unvalidated;
+    endpoints reading the body reject malformed documents with their own parse. Only
+    when the whole document had to be read anyway, or cannot be scanned as UTF-8 text,
+    is the parsed document returned, so that callers may cache it instead of parsing
+    again. Unlike `json.loads`, the first of duplicate `token_key` members wins.
+
+    ---
+    :param data: JSON request body
+    :type data: bytes
+    :param token_key: top-level member name of the submitted CSRF token
+    :type token_key: str
+    :return: token value, if any, and the parsed document, unless scanning stopped early
+    :rtype: tuple[str | None, Any]
+    """
+    try:
+        text: str = data.decode("utf-8")
+    except UnicodeDecodeError:
+        text = ""
+    match = JSON_WHITESPACE.match
+    index: int = match(text).end()
+    if text[index : index + 1] != "{":
+        try:  # other encodings and top-level values are left to the json module
+            document: Any = loads(data)
+        except (JSONDecodeError, UnicodeDecodeError):
+            return None, None
+        value: Any = document.get(token_key) if isinstance(document, dict) else None
+        return (value if isinstance(value, str) else None), document
+    members: dict[str, Any] = {}
+    try:
+        index = match(text, index + 1).end()
+        if text[index] == "}":
+            index += 1
+        else:
+            while True:
+                if text[index] != '"':
+                    return None, None
+                key, index = scanstring(text, index + 1)
+                index = match(text, index).end()
+                if text[index] != ":":
+                    return None, None
+                value, index = _json_decoder.raw_decode(
+                    text, match(text, index + 1).end()
+                )
+                members[key] = value
+                if key == token_key:
+                    token: None | str = value if isinstance(value, str) else None
+                    index = match(text, index).end()
+                    if text[index : index + 1] == "}" and match(
+                        text, index + 1
+                    ).end() == len(text):
+                        return token, members  # token was the last member anyway
+                    return token, None
+                index = match(text, index).end()
+                if text[index] == "}":
+                    index += 1
+                    break
+                if text[index] != ",":
+                    return None, None
+                index = match(text, index + 1).end()
+    except (IndexError, JSONDecodeError):
+        return None, None
+    if match(text, index).end() != len(text):
+        return None, None  # trailing data
+    return None, members
+
+
+class JsonTokenScanner(object):
+    """
+    Collect JSON request body chunks, finding top-level `token_key` once complete
+
+    ---
+    :param token_key: top-level member name of the submitted CSRF token
+    :type token_key: str
+    """
+
+    __slots__ = ("_chunks", "_token_key", "document", "token")
+
+    def __init__(self, token_key: str) -> None:
+        self._chunks: list[bytes] = []
+        self._token_key: str = token_key
+        self.document: Any = None
+        self.token: None | str = None
+
+    @property
+    def done(self) -> bool:
+        """Whether scanning has ended, never before the whole body was collected"""
+        return False
+
+    def feed(self, chunk: bytes) -> None | str:
+        """
+        Consume next chunk of request body, finding nothing until body is complete
+
+        ---
+        :param chunk: next chunk of JSON request body
+        :type chunk: bytes
+        """
+        self._chunks.append(chunk)
+        return None
+
+    def close(self) -> None | str:
+        """
+        Signal end of request body
+
+        ---
+        :return: value of top-level `token_key` when found in the request body
+        :rtype: str | None
+        """
+        if self._chunks:
+            self.token, self.document = find_json_token(
+                b"".join(self._chunks), self._token_key
+            )
+            self._chunks = []
+        return self.token
+
+
+async def receive_body_token(
+    receive: Receive,
+    scanner: UrlencodedTokenScanner | MultipartTokenScanner | JsonTokenScanner,
+) -> tuple[None | str, list[Message]]:
+    """
+    Consume body messages from receive channel until given scanner finds the token,
+    or gives up on finding one
+
+    ---
+    :param receive: ASGI receive channel of the current request
+    :type receive: starlette.types.Receive
+    :param scanner: scanner matching the content type of the request body
+    :type scanner: UrlencodedTokenScanner | MultipartTokenScanner | JsonTokenScanner
+    :return: token value, if any, and the messages consumed to be replayed
+    :rtype: tuple[str | None, list[starlette.types.Message]]
+    """
+    messages: list[Message] = []
+    while True:
+        message: Message = await receive()
+        messages.append(message)
+        if message["type"] != "http.request":
+            return None, messages
+        token: None | str = scanner.feed(message.get("body", b""))
+        if token is not None or scanner.done:
+            return token, messages
+        if not message.get("more_body", False):
+            return scanner.close(), messages
+
+
+__all__: tuple[str, ...] = (
+    "JsonTokenScanner",
+    "MultipartTokenScanner",
+    "UrlencodedTokenScanner",
+    "find_json_token",
+    "find_multipart_token",
+    "find_urlencoded_token",
+    "is_json",
+    "multipart_boundary",
+    "receive_body_token",
+    "receive_urlencoded_token",
+)
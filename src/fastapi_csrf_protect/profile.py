@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2020-2026 All rights reserved.
+# FILENAME:    ~~/src/fastapi_csrf_protect/profile.py
+# VERSION:     1.0.7
+# CREATED:     2026-10-17 17:30
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+"""Immutable configuration profiles which CsrfProtect instances are bound to"""
+
+### Standard library ###
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Sequence
+from typing import Any, Literal
+
+### Third-party packages ###
+from pydantic_settings import BaseSettings
+
+### Local modules ###
+from fastapi_csrf_protect.compact import CompactSerializer
+from fastapi_csrf_protect.cookie_plan import CookiePlan
+from fastapi_csrf_protect.extraction import ExtractionPlan
+from fastapi_csrf_protect.header_plan import HeaderPlan
+from fastapi_csrf_protect.key_ring import KeyRing
+from fastapi_csrf_protect.load_config import LoadConfig
+from fastapi_csrf_protect.origin_policy import OriginPolicy
+from fastapi_csrf_protect.refresh import CookieRefresh
+from fastapi_csrf_protect.serializer_cache import CachedSerializer, serializer_cache
+from fastapi_csrf_protect.tenancy import TenantResolver
+from fastapi_csrf_protect.token_pool import TokenPool
+from fastapi_csrf_protect.verification_cache import VerificationCache
+
+Method = Literal["DELETE", "GET", "OPTIONS", "PATCH", "POST", "PUT"]
+
+
+class CsrfProfile(object):
+    """
+    Frozen set of CsrfProtect settings with everything derived from them built once
+
+    Profiles precompute cookie attributes, Set-Cookie bytes, cookie refresh policy,
+    extraction plan, header plan, key ring, origin policy, serializer, token pool and
+    verification cache.
+    Arguments are trusted as given; use `load_config` or `from_config` to have settings
+    validated by `LoadConfig` first.
+    """
+
+    __slots__ = (
+        "cookie_domain",
+        "cookie_key",
+        "cookie_path",
+        "cookie_plan",
+        "cookie_refresh",
+        "cookie_samesite",
+        "cookie_secure",
+        "extraction_plan",
+        "header_name",
+        "header_plan",
+        "header_type",
+        "httponly",
+        "key_ring",
+        "max_age",
+        "methods",
+        "origin_policy",
+        "salt",
+        "secret_key",
+        "serializer",
+        "tenant_resolver",
+        "token_format",
+        "token_key",
+        "token_location",
+        "token_pool",
+        "verification_cache",
+        "websocket_query_token",
+    )
+
+    cookie_domain: None | str
+    cookie_key: str
+    cookie_path: str
+    cookie_plan: CookiePlan
+    cookie_refresh: CookieRefresh
+    cookie_samesite: Literal["lax", "strict", "none"] | None
+    cookie_secure: bool
+    extraction_plan: ExtractionPlan
+    header_name: str
+    header_plan: HeaderPlan
+    header_type: None | str
+    httponly: bool
+    key_ring: None | KeyRing
+    max_age: int
+    methods: frozenset[Method]
+    origin_policy: None | OriginPolicy
+    salt: str
+    secret_key: None | str
+    serializer: None | CachedSerializer | CompactSerializer
+    tenant_resolver: None | TenantResolver
+    token_format: Literal["compact", "itsdangerous"]
+    token_key: str
+    token_location: str
+    token_pool: None | TokenPool
+    verification_cache: None | VerificationCache
+    websocket_query_token: bool
+
+    def __init__(
+        self,
+        *,
+        cookie_domain: None | str = None,
+        cookie_key: str = "fastapi-csrf-token",
+        cookie_path: str = "/",
+        cookie_refresh_fraction: float = 0.5,
+        cookie_samesite: Literal["lax", "strict", "none"] | None = None,
+        cookie_secure: bool = False,
+        header_name: str = "X-CSRF-Token",
+        header_type: None | str = None,
+        httponly: bool = True,
+        max_age: int = 3600,
+        methods: Sequence[Method] | set[Method] = ("DELETE", "PATCH", "POST", "PUT"),
+        origin_policy: Literal["allow_same_origin", "reject_cross_site"] | None = None,
+        salt: str = "fastapi-csrf-token",
+        secret_key: None | str = None,
+        secret_keys: None | dict[str, str] = None,
+        tenant_resolver: None | TenantResolver = None,
+        token_format: Literal["compact", "itsdangerous"] = "itsdangerous",
+        token_key: str = "csrf-token",
+        token_location: str = "header",
+        token_pool_freshness: None | int = None,
+        token_pool_low_water: None | int = None,
+        token_pool_size: None | int = None,
+        trusted_origins: Iterable[str] = (),
+        verification_cache_size: None | int = None,
+        verification_cache_ttl: None | int = None,
+        websocket_query_token: bool = False,
+    ) -> None:
+        key_ring: None | KeyRing = (
+            None if secret_keys is None else KeyRing(secret_keys, secret_key)
+        )
+        if key_ring is not None:
+            secret_key = key_ring.secret_key
+        assign: Callable[[str, Any], None] = super().__setattr__
+        assign("cookie_domain", cookie_domain)
+        assign("cookie_key", cookie_key)
+        assign("cookie_path", cookie_path)
+        assign(
+            "cookie_plan",
+            CookiePlan.compile(
+                cookie_key,
+                max_age,
+                cookie_path,
+                cookie_domain,
+                cookie_secure,
+                httponly,
+                cookie_samesite,
+            ),
+        )
+        assign("cookie_refresh", CookieRefresh(max_age, cookie_refresh_fraction))
+        assign("cookie_samesite", cookie_samesite)
+        assign("cookie_secure", cookie_secure)
+        assign("extraction_plan", ExtractionPlan.compile(token_location))
+        assign("header_name", header_name)
+        assign("header_plan", HeaderPlan.compile(header_name, header_type))
+        assign("header_type", header_type)
+        assign("httponly", httponly)
+        assign("key_ring", key_ring)
+        assign("max_age", max_age)
+        assign("methods", frozenset(methods))
+        assign(
+            "origin_policy",
+            None
+            if origin_policy is None
+            else OriginPolicy.compile(origin_policy, trusted_origins),
+        )
+        assign("salt", salt)
+        assign("secret_key", secret_key)
+        assign(
+            "serializer",
+            None
+            if secret_key is None
+            else serializer_cache.get(secret_key, salt, token_format),
+        )
+        assign("tenant_resolver", tenant_resolver)
+        assign("token_format", token_format)
+        assign("token_key", token_key)
+        assign("token_location", token_location)
+        assign(
+            "token_pool",
+            None
+            if not token_pool_size or secret_key is None
+            else TokenPool(
+                secret_key,
+                salt,
+                size=token_pool_size,
+                low_water=(
+                    token_pool_size // 2
+                    if token_pool_low_water is None
+                    else token_pool_low_water
+                ),
+                freshness=token_pool_freshness or max(1, min(60, max_age // 2)),
+                key_id=None if key_ring is None else key_ring.key_id,
+                algorithm=token_format,
+            ),
+        )
+        assign(
+            "verification_cache",
+            None
+            if verification_cache_size is None
+            else VerificationCache(
+                verification_cache_size, ttl=verification_cache_ttl or max_age
+            ),
+        )
+        assign("websocket_query_token", websocket_query_token)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"Cannot assign to `{name}` of immutable CsrfProfile")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"Cannot delete `{name}` of immutable CsrfProfile")
+
+    @classmethod
+    def from_config(
+        cls, config: LoadConfig, base: None | CsrfProfile = None
+    ) -> CsrfProfile:
+        """
+        Build profile from validated settings
+
+        ---
+        :param config: validated settings
+        :type config: fastapi_csrf_protect.load_config.LoadConfig
+        :param base: (Optional) profile providing values for settings left unset
+        :type base: (CsrfProfile | None) Defaults to None.
+        """
+        base = base or cls()
+        return cls(
+            cookie_domain=config.cookie_domain,
+            cookie_key=config.cookie_key or base.cookie_key,
+            cookie_path=config.cookie_path or base.cookie_path,
+            cookie_refresh_fraction=0.5
+            if config.cookie_refresh_fraction is None
+            else config.cookie_refresh_fraction,
+            cookie_samesite=config.cookie_samesite,
+            cookie_secure=False
+            if config.cookie_secure is None
+            else config.cookie_secure,
+            header_name=config.header_name or base.header_name,
+            header_type=config.header_type,
+            httponly=True if config.httponly is None else config.httponly,
+            max_age=config.max_age or base.max_age,
+            methods=config.methods or base.methods,
+            origin_policy=config.origin_policy,
+            salt=config.salt or base.salt,
+            secret_key=config.secret_key,
+            secret_keys=config.secret_keys,
+            tenant_resolver=config.tenant_resolver,
+            token_format=config.token_format or "itsdangerous",
+            token_key=config.token_key or base.token_key,
+            token_location=config.token_location or base.token_location,
+            token_pool_freshness=config.token_pool_freshness,
+            token_pool_low_water=config.token_pool_low_water,
+            token_pool_size=config.token_pool_size,
+            trusted_origins=config.trusted_origins or (),
+            verification_cache_size=config.verification_cache_size,
+            verification_cache_ttl=config.verification_cache_ttl,
+            websocket_query_token=bool(config.websocket_query_token),
+        )
+
+    @classmethod
+    def load_config(
+        cls, settings: Callable[..., Sequence[tuple[str, Any]] | BaseSettings]
+    ) -> CsrfProfile:
+        """Build profile via decorated method, independent of `CsrfProtect.load_config`
+
+        ---
+        :param settings: callable returning either sequence of key-value tuples or pydantic BaseSettings
+        :type settings: Callable[..., BaseSettings | Sequence[tuple, Any]]
+        :raises pydantic_core.ValidationError: in case of settings' attribute type mismatched
+        """
+        config = LoadConfig(**{key.lower(): value for key, value in settings()})
+        return cls.from_config(config)
+
+    def close(self) -> None:
+        """Stop background work owned by this profile, i.e. token pool refills"""
+        if self.token_pool is not None:
+            self.token_pool.close()
+
+
+__all__: tuple[str, ...] = ("CsrfProfile",)
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2020-2026 All rights reserved.
+# FILENAME:    ~~/src/fastapi_csrf_protect/refresh.py
+# VERSION:     1.0.7
+# CREATED:     2026-10-17 23:30
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+"""Sliding refresh policy deciding whether an incoming CSRF cookie is kept or re-issued"""
+
+### Standard library ###
+from threading import Lock
+
+
+class CookieRefresh(object):
+    """
+    Policy keeping valid cookies until only a fraction of `max_age` is left, counting
+    how many tokens were issued and how many were reused
+
+    ---
+    :param max_age: number of seconds that signed tokens are valid
+    :type max_age: int
+    :param fraction: (Optional) fraction of `max_age` left below which cookies are
+      re-issued, i.e. 0.5 re-issues cookies past half their lifetime
+    :type fraction: (float) Defaults to 0.5.
+    """
+
+    def __init__(self, max_age: int, fraction: float = 0.5) -> None:
+        if not 0 <= fraction < 1:
+            raise ValueError("CookieRefresh fraction must be at least 0 and below 1")
+        self.fraction: float = fraction
+        self.issued: int = 0
+        self.max_age: int = max_age
+        self.reused: int = 0
+        self.threshold: float = max_age * fraction
+        self._lock: Lock = Lock()
+
+    def keep(self, issued_at: int, now: float) -> bool:
+        """
+        Tell whether a verified cookie has enough lifetime left to be reused
+
+        ---
+        :param issued_at: timestamp embedded in the signed cookie
+        :type issued_at: int
+        :param now: current time in seconds since epoch
+        :type now: float
+        """
+        return issued_at + self.max_age - now > self.threshold
+
+    def record(self, reused: bool) -> None:
+        """
+        Count one token either reused from the incoming cookie or newly issued
+
+        ---
+        :param reused: whether the incoming cookie was kept
+        :type reused: bool
+        """
+        with self._lock:
+            if reused:
+                self.reused += 1
+            else:
+                self.issued += 1
+
+
+__all__: tuple[str, ...] = ("CookieRefresh",)
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2020-2026 All rights reserved.
+# FILENAME:    ~~/src/fastapi_csrf_protect/serializer_cache.py
+# VERSION:     1.0.7
+# CREATED:     2026-10-17 09:12
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+"""Bounded, thread-safe cache of ready-to-use token serializers"""
+
+### Standard library ###
+from collections import OrderedDict
+from threading import Lock
+
+### Third-party packages ###
+from itsdangerous import TimestampSigner, URLSafeTimedSerializer
+
+### Local modules ###
+from fastapi_csrf_protect.compact import CompactSerializer
+
+
+class DerivedKeySigner(TimestampSigner):
+    """TimestampSigner which derives its signing keys only once per secret"""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._derived_keys: dict[None | bytes, bytes] = {}
+
+    def derive_key(self, secret_key: None | str | bytes = None) -> bytes:
+        """
+        Derive signing key from given secret and memoize the result
+
+        ---
+        :param secret_key: (Optional) specific secret key to derive from
+        :type secret_key: (bytes | str | None) Defaults to None.
+        """
+        lookup: None | bytes = (
+            secret_key.encode("utf-8") if isinstance(secret_key, str) else secret_key
+        )
+        derived: None | bytes = self._derived_keys.get(lookup)
+        if derived is None:
+            derived = super().derive_key(lookup)
+            self._derived_keys[lookup] = derived
+        return derived
+
+
+class CachedSerializer(URLSafeTimedSerializer):
+    """URLSafeTimedSerializer reusing one signer instead of creating one per call"""
+
+    default_signer = DerivedKeySigner
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._signer: TimestampSigner = super().make_signer()
+
+    def make_signer(self, salt: None | str | bytes = None) -> TimestampSigner:
+        """
+        Return the memoized signer when salt matches the serializer's own salt
+
+        ---
+        :param salt: (Optional) salt to be used by the signer
+        :type salt: (bytes | str | None) Defaults to None.
+        """
+        if salt is None or salt == self.salt:
+            return self._signer
+        if isinstance(salt, str) and salt.encode("utf-8") == self.salt:
+            return self._signer
+        return super().make_signer(salt)
+
+
+class SerializerCache(object):
+    """Least-recently-used mapping of (secret_key, salt, algorithm) to serializers"""
+
+    def __init__(self, maxsize: int = 128) -> None:
+        if maxsize < 1:
+            raise ValueError("SerializerCache must be able to hold at least one entry")
+        self.maxsize: int = maxsize
+        self.hits: int = 0
+        self.misses: int = 0
+        self._entries: OrderedDict[
+            tuple[str, str, str], CachedSerializer | CompactSerializer
+        ] = OrderedDict()
+        self._lock: Lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Drop all cached serializers, i.e. when configurations are reloaded"""
+        with self._lock:
+            self._entries.clear()
+
+    def get(
+        self, secret_key: str, salt: str, algorithm: str = "itsdangerous"
+    ) -> CachedSerializer | CompactSerializer:
+        """
+        Get a ready-to-use serializer, building and caching one on first use
+
+        ---
+        :param secret_key: secret key used to sign and verify tokens
+        :type secret_key: str
+        :param salt: salt namespacing signatures made with given secret key
+        :type salt: str
+        :param algorithm: (Optional) token format produced by the serializer, either
+          "itsdangerous" or "compact"
+        :type algorithm: (str) Defaults to "itsdangerous".
+        """
+        if algorithm not in {"compact", "itsdangerous"}:
+            raise ValueError(f'Unknown token serializer algorithm "{algorithm}"')
+        key: tuple[str, str, str] = (secret_key, salt, algorithm)
+        with self._lock:
+            serializer: None | CachedSerializer | CompactSerializer = self._entries.get(
+                key
+            )
+            if serializer is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return serializer
+            self.misses += 1
+        serializer = (
+            CompactSerializer(secret_key, salt)
+            if algorithm == "compact"
+            else CachedSerializer(secret_key, salt=salt)
+        )
+        with self._lock:
+            self._entries[key] = serializer
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return serializer
+
+
+serializer_cache: SerializerCache = SerializerCache()
+
+
+__all__: tuple[str, ...] = (
+    "CachedSerializer",
+    "DerivedKeySigner",
+    "SerializerCache",
+    "serializer_cache",
+)
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2020-2026 All rights reserved.
+# FILENAME:    ~~/src/fastapi_csrf_protect/tenancy.py
+# VERSION:     1.0.7
+# CREATED:     2026-10-17 18:10
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+"""Per-tenant secret key resolution with bounded cache of tenants' serializers"""
+
+### Standard library ###
+from collections import OrderedDict
+from collections.abc import Callable
+from threading import Lock
+
+### Third-party packages ###
+from starlette.types import Scope
+
+### Local modules ###
+from fastapi_csrf_protect.compact import CompactSerializer
+from fastapi_csrf_protect.serializer_cache import CachedSerializer
+
+Serializer = CachedSerializer | CompactSerializer
+
+
+def tenant_from_host(scope: Scope) -> None | str:
+    """
+    Use lower-cased host of the request, without port, as tenant key
+
+    ---
+    :param scope: ASGI connection scope of the incoming request
+    :type scope: starlette.types.Scope
+    """
+    for name, value in scope["headers"]:
+        if name == b"host":
+            host: str = value.decode("latin-1").lower()
+            return (
+                host.rpartition(":")[0] if host[-1:].isdigit() and ":" in host else host
+            )
+    return None
+
+
+def tenant_from_path_prefix(scope: Scope) -> None | str:
+    """
+    Use first segment of the request path, i.e. "acme" of "/acme/orders", as tenant key
+
+    ---
+    :param scope: ASGI connection scope of the incoming request
+    :type scope: starlette.types.Scope
+    """
+    return scope["path"].lstrip("/").partition("/")[0] or None
+
+
+class TenantResolver(object):
+    """
+    Resolve secret key of the tenant owning a request, caching one serializer per tenant
+
+    Serializers are kept in least-recently-used order and rebuilt only when a tenant is
+    evicted, or its secret key, salt or token format changes.
+
+    ---
+    :param tenant_of: callable returning tenant key of an ASGI scope, or None
+    :type tenant_of: Callable[[starlette.types.Scope], str | None]
+    :param secret_of: callable returning secret key of a tenant key, or None for unknown
+      tenants, i.e. `dict.get` of a mapping of tenant keys to secret keys
+    :type secret_of: Callable[[str], str | None]
+    :param maxsize: (Optional) largest number of tenants' serializers held at once
+    :type maxsize: (int) Defaults to 1024.
+    """
+
+    def __init__(
+        self,
+        tenant_of: Callable[[Scope], None | str],
+        secret_of: Callable[[str], None | str],
+        maxsize: int = 1024,
+    ) -> None:
+        if maxsize < 1:
+            raise ValueError("TenantResolver must be able to hold at least one entry")
+        self.tenant_of: Callable[[Scope], None | str] = tenant_of
+        self.secret_of: Callable[[str], None | str] = secret_of
+        self.maxsize: int = maxsize
+        self.evictions: int = 0
+        self.hits: int = 0
+        self.misses: int = 0
+        self.unresolved: int = 0
+        self._entries: OrderedDict[str, tuple[str, str, str, Serializer]] = (
+            OrderedDict()
+        )
+        self._lock: Lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Drop all cached serializers, i.e. after tenants' secret keys were rotated"""
+        with self._lock:
+            self._entries.clear()
+
+    def resolve(
+        self, scope: Scope, salt: str, algorithm: str = "itsdangerous"
+    ) -> None | tuple[str, Serializer]:
+        """
+        Get secret key and ready-to-use serializer of the tenant owning the request
+
+        ---
+        :param scope: ASGI connection scope of the incoming request
+        :type scope: starlette.types.Scope
+        :param salt: salt namespacing signatures made with the tenant's secret key
+        :type salt: str
+        :param algorithm: (Optional) token format, either "itsdangerous" or "compact"
+        :type algorithm: (str) Defaults to "itsdangerous".
+        :return: tuple of secret key and serializer, None when tenant is unknown
+        :rtype: tuple[str, CachedSerializer | CompactSerializer] | None
+        """
+        tenant: None | str = self.tenant_of(scope)
+        secret_key: None | str = None if tenant is None else self.secret_of(tenant)
+        if tenant is None or secret_key is None:
+            with self._lock:
+                self.unresolved += 1
+            return None
+        with self._lock:
+            entry: None | tuple[str, str, str, Serializer] = self._entries.get(tenant)
+            if entry is not None and entry[:3] == (secret_key, salt, algorithm):
+                self._entries.move_to_end(tenant)
+                self.hits += 1
+                return secret_key, entry[3]
+            self.misses += 1
+        if algorithm not in {"compact", "itsdangerous"}:
+            raise ValueError(f'Unknown token serializer algorithm "{algorithm}"')
+        serializer: Serializer = (
+            CompactSerializer(secret_key, salt)
+            if algorithm == "compact"
+            else CachedSerializer(secret_key, salt=salt)
+        )
+        with self._lock:
+            self._entries[tenant] = (secret_key, salt, algorithm, serializer)
+            self._entries.move_to_end(tenant)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return secret_key, serializer
+
+
+__all__: tuple[str, ...] = (
+    "TenantResolver",
+    "tenant_from_host",
+    "tenant_from_path_prefix",
+)
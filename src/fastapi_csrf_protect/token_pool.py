@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2020-2026 All rights reserved.
+# FILENAME:    ~~/src/fastapi_csrf_protect/token_pool.py
+# VERSION:     1.0.7
+# CREATED:     2026-10-17 13:40
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+"""Pool of pre-signed CSRF tokens refilled by a background thread"""
+
+### Standard library ###
+from collections import deque
+from hashlib import sha1
+from os import urandom
+from threading import Event, Lock, Thread
+from time import time
+
+### Local modules ###
+from fastapi_csrf_protect.compact import CompactSerializer
+from fastapi_csrf_protect.key_ring import KEY_ID_SEPARATOR
+from fastapi_csrf_protect.serializer_cache import CachedSerializer, serializer_cache
+
+
+def issue_tokens(
+    secret_key: str,
+    salt: str,
+    key_id: None | str = None,
+    algorithm: str = "itsdangerous",
+) -> tuple[str, str]:
+    """
+    Generate a CSRF token and its signed counterpart to be stored in cookie
+
+    ---
+    :param secret_key: the secret key used when signing the token
+    :type secret_key: str
+    :param salt: salt used when signing the token
+    :type salt: str
+    :param key_id: (Optional) id of the signing key to be prefixed to the signed token
+    :type key_id: (str | None) Defaults to None.
+    :param algorithm: (Optional) signed token format, either "itsdangerous" or "compact"
+    :type algorithm: (str) Defaults to "itsdangerous".
+    """
+    return sign_tokens(serializer_cache.get(secret_key, salt, algorithm), key_id)
+
+
+def sign_tokens(
+    serializer: CachedSerializer | CompactSerializer, key_id: None | str = None
+) -> tuple[str, str]:
+    """
+    Generate a CSRF token and its signed counterpart using a ready-to-use serializer
+
+    ---
+    :param serializer: serializer signing the token, i.e. one of a tenant
+    :type serializer: CachedSerializer | CompactSerializer
+    :param key_id: (Optional) id of the signing key to be prefixed to the signed token
+    :type key_id: (str | None) Defaults to None.
+    """
+    token: str = sha1(urandom(64)).hexdigest()
+    signed: str = serializer.dumps(token)
+    if key_id is not None:
+        signed = key_id + KEY_ID_SEPARATOR + signed
+    return token, signed
+
+
+class TokenPool(object):
+    """
+    Bounded pool of pre-signed (token, signed) pairs for burst issuance
+
+    Pairs are popped in O(1) from the head of a deque while a daemon thread, started
+    on first use, appends fresh pairs whenever the pool drops below `low_water`.
+    Pairs signed more than `freshness` seconds ago are never handed out, so that
+    timestamps embedded by the serializer stay close to the moment of issuance.
+
+    ---
+    :param secret_key: the secret key used when signing pooled tokens
+    :type secret_key: str
+    :param salt: salt used when signing pooled tokens
+    :type salt: str
+    :param size: number of pairs held when the pool is full
+    :type size: int
+    :param low_water: number of pairs below which the pool is refilled
+    :type low_water: int
+    :param freshness: largest age in seconds of a pair handed out from the pool
+    :type freshness: int
+    :param key_id: (Optional) id of the signing key to be prefixed to signed tokens
+    :type key_id: (str | None) Defaults to None.
+    :param algorithm: (Optional) signed token format, either "itsdangerous" or "compact"
+    :type algorithm: (str) Defaults to "itsdangerous".
+    """
+
+    def __init__(
+        self,
+        secret_key: str,
+        salt: str,
+        size: int,
+        low_water: int,
+        freshness: int,
+        key_id: None | str = None,
+        algorithm: str = "itsdangerous",
+    ) -> None:
+        self.algorithm: str = algorithm
+        self.freshness: int = freshness
+        self.key_id: None | str = key_id
+        self.low_water: int = low_water
+        self.salt: str = salt
+        self.secret_key: str = secret_key
+        self.size: int = size
+        self._closed: bool = False
+        self._entries: deque[tuple[float, str, str]] = deque()
+        self._lock: Lock = Lock()
+        self._refill: Event = Event()
+        self._thread: None | Thread = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def pop(self) -> None | tuple[str, str]:
+        """
+        Take a fresh pre-signed pair, or None when the pool has run dry
+
+        ---
+        :return: tuple of token and signed token when available
+        :rtype: tuple[str, str] | None
+        """
+        oldest: float = time() - self.freshness
+        entries: deque[tuple[float, str, str]] = self._entries
+        while True:
+            try:
+                issued_at, token, signed = entries.popleft()
+            except IndexError:
+                self._wake()
+                return None
+            if issued_at >= oldest:
+                break
+        if len(entries) < self.low_water:
+            self._wake()
+        return token, signed
+
+    def fill(self) -> None:
+        """Discard stale pairs and sign new ones until the pool is full"""
+        oldest: float = time() - self.freshness
+        entries: deque[tuple[float, str, str]] = self._entries
+        try:
+            while entries[0][0] < oldest:
+                entries.popleft()
+        except IndexError:  # emptied, possibly by concurrent pops
+            pass
+        while not self._closed and len(entries) < self.size:
+            issued_at: float = time()
+            token, signed = issue_tokens(
+                self.secret_key, self.salt, self.key_id, self.algorithm
+            )
+            entries.append((issued_at, token, signed))
+
+    def close(self) -> None:
+        """Stop background refills and drop every pooled pair"""
+        self._closed = True
+        self._refill.set()
+        self._entries.clear()
+
+    def _wake(self) -> None:
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None and not self._closed:
+                    self._thread = Thread(
+                        target=self._run, name="csrf-token-pool", daemon=True
+                    )
+                    self._thread.start()
+        self._refill.set()
+
+    def _run(self) -> None:
+        while not self._closed:
+            # also wake up periodically so that idle pools never go stale
+            self._refill.wait(self.freshness / 2)
+            self._refill.clear()
+            self.fill()
+
+
+__all__: tuple[str, ...] = ("TokenPool", "issue_tokens", "sign_tokens")
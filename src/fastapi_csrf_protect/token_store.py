@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2020-2026 All rights reserved.
+# FILENAME:    ~~/src/fastapi_csrf_protect/token_store.py
+# VERSION:     1.0.7
+# CREATED:     2026-10-17 15:40
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+"""Server-side storage of token pairs per session for the synchronizer token pattern"""
+
+### Standard library ###
+from collections import OrderedDict
+from collections.abc import Callable
+from time import monotonic
+from typing import Any, Protocol
+
+Issuer = Callable[[], tuple[str, str]]
+
+RECORD_SEPARATOR: str = " "
+
+
+class TokenStore(Protocol):
+    """Storage keeping one pair of token and signed token per session"""
+
+    async def get_or_issue(self, session_id: str) -> tuple[str, str]:
+        """
+        Get token pair stored for session, issuing and storing a new one when absent
+
+        ---
+        :param session_id: identifier of the session owning the token pair
+        :type session_id: str
+        :return: tuple of token and signed token
+        :rtype: tuple[str, str]
+        """
+        ...
+
+    async def discard(self, session_id: str) -> None:
+        """
+        Forget token pair stored for session, i.e. to prevent token reuse
+
+        ---
+        :param session_id: identifier of the session owning the token pair
+        :type session_id: str
+        """
+        ...
+
+
+class KeyValueBackend(Protocol):
+    """Async key-value client such as `cachette.Cachette`"""
+
+    async def fetch(self, key: str) -> Any: ...
+
+    async def put(self, key: str, value: Any, ttl: None | int = None) -> None: ...
+
+    async def pop(self, key: str) -> Any: ...
+
+
+class MemoryTokenStore(object):
+    """
+    In-process TokenStore evicting least-recently-used and expired sessions
+
+    ---
+    :param issue: callable issuing new token pairs, i.e. `CsrfProtect().generate_csrf_tokens`
+    :type issue: Callable[[], tuple[str, str]]
+    :param maxsize: (Optional) largest number of sessions held at once
+    :type maxsize: (int) Defaults to 1024.
+    :param ttl: (Optional) number of seconds a token pair is kept, at most `max_age`
+    :type ttl: (int) Defaults to 3600.
+    """
+
+    def __init__(self, issue: Issuer, maxsize: int = 1024, ttl: int = 3600) -> None:
+        if maxsize < 1:
+            raise ValueError("MemoryTokenStore must be able to hold at least one entry")
+        self.issue: Issuer = issue
+        self.maxsize: int = maxsize
+        self.ttl: int = ttl
+        self._entries: OrderedDict[str, tuple[float, str, str]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get_or_issue(self, session_id: str) -> tuple[str, str]:
+        entry: None | tuple[float, str, str] = self._entries.get(session_id)
+        if entry is not None and entry[0] > monotonic():
+            self._entries.move_to_end(session_id)
+            return entry[1], entry[2]
+        token, signed = self.issue()
+        self._entries[session_id] = (monotonic() + self.ttl, token, signed)
+        self._entries.move_to_end(session_id)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return token, signed
+
+    async def discard(self, session_id: str) -> None:
+        self._entries.pop(session_id, None)
+
+
+class KeyValueTokenStore(object):
+    """
+    TokenStore keeping each token pair as a single record in an async key-value backend
+
+    ---
+    :param backend: async key-value client with `fetch`, `put` and `pop` coroutines
+    :type backend: KeyValueBackend
+    :param issue: callable issuing new token pairs, i.e. `CsrfProtect().generate_csrf_tokens`
+    :type issue: Callable[[], tuple[str, str]]
+    :param prefix: (Optional) prefix namespacing record keys within the backend
+    :type prefix: (str) Defaults to "csrf-tokens:".
+    :param ttl: (Optional) number of seconds a record is kept, at most `max_age`
+    :type ttl: (int | None) Defaults to None.
+    """
+
+    def __init__(
+        self,
+        backend: KeyValueBackend,
+        issue: Issuer,
+        prefix: str = "csrf-tokens:",
+        ttl: None | int = None,
+    ) -> None:
+        self.backend: KeyValueBackend = backend
+        self.issue: Issuer = issue
+        self.prefix: str = prefix
+        self.ttl: None | int = ttl
+
+    async def get_or_issue(self, session_id: str) -> tuple[str, str]:
+        key: str = self.prefix + session_id
+        record: Any = await self.backend.fetch(key)
+        if isinstance(record, bytes):
+            record = record.decode("utf-8")
+        if isinstance(record, str):
+            token, separator, signed = record.partition(RECORD_SEPARATOR)
+            if separator and token and signed:
+                return token, signed
+        token, signed = self.issue()
+        await self.backend.put(key, token + RECORD_SEPARATOR + signed, self.ttl)
+        return token, signed
+
+    async def discard(self, session_id: str) -> None:
+        await self.backend.pop(self.prefix + session_id)
+
+
+__all__: tuple[str, ...] = (
+    "KeyValueBackend",
+    "KeyValueTokenStore",
+    "MemoryTokenStore",
+    "TokenStore",
+)
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2020-2026 All rights reserved.
+# FILENAME:    ~~/src/fastapi_csrf_protect/verification_cache.py
+# VERSION:     1.0.7
+# CREATED:     2026-10-17 14:25
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+"""Bounded cache of signed cookies already verified, with their unsigned tokens"""
+
+### Standard library ###
+from collections import OrderedDict
+from hashlib import sha256
+from threading import Lock
+from time import monotonic
+
+
+class VerificationCache(object):
+    """
+    Least-recently-used mapping of signed cookie digests to token and issue timestamp
+
+    Entries are keyed by a digest of secret key, salt and signed cookie, so that
+    neither full cookies are retained nor entries verified under a previous secret
+    are ever matched. Only cookies whose signature was verified are stored.
+
+    ---
+    :param maxsize: (Optional) largest number of entries held at once
+    :type maxsize: (int) Defaults to 1024.
+    :param ttl: (Optional) number of seconds an entry is kept after being stored
+    :type ttl: (int) Defaults to 3600.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: int = 3600) -> None:
+        if maxsize < 1:
+            raise ValueError(
+                "VerificationCache must be able to hold at least one entry"
+            )
+        self.maxsize: int = maxsize
+        self.ttl: int = ttl
+        self.evictions: int = 0
+        self.hits: int = 0
+        self.misses: int = 0
+        self._entries: OrderedDict[bytes, tuple[float, str, int]] = OrderedDict()
+        self._lock: Lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _digest(secret_key: str, salt: str, signed_token: str) -> bytes:
+        return sha256(
+            b"\0".join(
+                (
+                    secret_key.encode("utf-8"),
+                    salt.encode("utf-8"),
+                    signed_token.encode("utf-8"),
+                )
+            )
+        ).digest()
+
+    def clear(self) -> None:
+        """Drop all cached entries, i.e. when configurations are reloaded"""
+        with self._lock:
+            self._entries.clear()
+
+    def get(
+        self, secret_key: str, salt: str, signed_token: str
+    ) -> None | tuple[str, int]:
+        """
+        Look up unsigned token and issue timestamp of an already verified cookie
+
+        ---
+        :param secret_key: secret key the cookie was verified with
+        :type secret_key: str
+        :param salt: salt the cookie was verified with
+        :type salt: str
+        :param signed_token: signed token taken from request cookies
+        :type signed_token: str
+        :return: tuple of unsigned token and issue timestamp in seconds since epoch
+        :rtype: tuple[str, int] | None
+        """
+        key: bytes = self._digest(secret_key, salt, signed_token)
+        with self._lock:
+            entry: None | tuple[float, str, int] = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            if entry[0] <= monotonic():
+                del self._entries[key]
+                self.evictions += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return entry[1], entry[2]
+
+    def put(
+        self, secret_key: str, salt: str, signed_token: str, token: str, issued_at: int
+    ) -> None:
+        """
+        Remember unsigned token and issue timestamp of a freshly verified cookie
+
+        ---
+        :param secret_key: secret key the cookie was verified with
+        :type secret_key: str
+        :param salt: salt the cookie was verified with
+        :type salt: str
+        :param signed_token: signed token taken from request cookies
+        :type signed_token: str
+        :param token: unsigned token carried by the signed cookie
+        :type token: str
+        :param issued_at: timestamp embedded in the signed cookie
+        :type issued_at: int
+        """
+        key: bytes = self._digest(secret_key, salt, signed_token)
+        with self._lock:
+            self._entries[key] = (monotonic() + self.ttl, token, issued_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+
+__all__: tuple[str, ...] = ("VerificationCache",)
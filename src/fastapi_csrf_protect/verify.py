@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2020-2026 All rights reserved.
+# FILENAME:    ~~/src/fastapi_csrf_protect/verify.py
+# VERSION:     1.0.7
+# CREATED:     2026-10-17 21:00
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+"""Outcome of verifying a signed cookie against a submitted token, without any request"""
+
+### Standard library ###
+from hmac import compare_digest
+from typing import Literal, NamedTuple
+
+### Third-party packages ###
+from itsdangerous import BadData
+
+### Local modules ###
+from fastapi_csrf_protect.masking import unmask_token
+from fastapi_csrf_protect.serializer_cache import serializer_cache
+
+OK: str = "ok"
+EXPIRED: str = "expired"
+INVALID_SIGNATURE: str = "invalid_signature"
+TOKEN_MISMATCH: str = "token_mismatch"
+UNKNOWN_KEY: str = "unknown_key"
+WEBSOCKET_STATE_KEY: str = "csrf_protect"  # connection state holding handshake result
+
+MESSAGES: dict[str, str] = {
+    EXPIRED: "The CSRF token has expired.",
+    INVALID_SIGNATURE: "The CSRF token is invalid.",
+    TOKEN_MISMATCH: "The CSRF signatures submitted do not match.",
+    UNKNOWN_KEY: "The CSRF token is invalid.",
+}
+
+
+class VerifyResult(NamedTuple):
+    """
+    Outcome of `CsrfProtect.verify`, truthy only when tokens were verified
+
+    ---
+    :param ok: whether the signed cookie is authentic, fresh and matches submitted token
+    :type ok: bool
+    :param reason: stable code, either "ok", "expired", "invalid_signature",
+      "token_mismatch" or "unknown_key", same as `TokenValidationError.reason`
+    :type reason: str
+    :param issued_at: (Optional) timestamp embedded in the signed cookie, when authentic
+    :type issued_at: (int | None) Defaults to None.
+    """
+
+    ok: bool
+    reason: str
+    issued_at: None | int = None
+
+    def __bool__(self) -> bool:
+        return self.ok
+
+
+def match_token(signature: str, submitted: str | bytes) -> bool:
+    """
+    Compare token carried by a signed cookie with submitted token, masked or not
+
+    ---
+    :param signature: unsigned token carried by the signed cookie
+    :type signature: str
+    :param submitted: token submitted via header or body
+    :type submitted: str | bytes
+    """
+    expected: bytes = signature.encode("utf-8")
+    given: bytes = (
+        submitted if isinstance(submitted, bytes) else submitted.encode("utf-8")
+    )
+    if len(given) == 2 * len(expected):
+        given = unmask_token(given)
+    return compare_digest(given, expected)
+
+
+def verify_chunk(
+    secret_key: str,
+    salt: str,
+    token_format: Literal["compact", "itsdangerous"],
+    now: float,
+    time_limit: int,
+    chunk: list[tuple[str | bytes, str | bytes]],
+) -> list[VerifyResult]:
+    """
+    Verify pairs of signed cookie and submitted token all signed with one secret key
+
+    Defined at module level with picklable arguments only, so that `validate_many` can
+    hand chunks to any executor, including `concurrent.futures.ProcessPoolExecutor`.
+
+    ---
+    :param secret_key: secret key used to decrypt the signed tokens
+    :type secret_key: str
+    :param salt: salt the signed tokens were signed with
+    :type salt: str
+    :param token_format: format of the signed tokens
+    :type token_format: Literal["compact", "itsdangerous"]
+    :param now: current time in seconds since epoch
+    :type now: float
+    :param time_limit: number of seconds that the tokens are valid
+    :type time_limit: int
+    :param chunk: signed cookie, without key id, and submitted token pairs
+    :type chunk: list[tuple[str | bytes, str | bytes]]
+    :return: one outcome per pair, in the order pairs were given
+    :rtype: list[VerifyResult]
+    """
+    serializer = serializer_cache.get(secret_key, salt, token_format)
+    results: list[VerifyResult] = []
+    for signed_cookie, submitted in chunk:
+        try:
+            signature, signed_at = serializer.loads(
+                signed_cookie.decode("latin-1")
+                if isinstance(signed_cookie, bytes)
+                else signed_cookie,
+                return_timestamp=True,
+            )
+        except BadData:
+            results.append(VerifyResult(False, INVALID_SIGNATURE))
+            continue
+        issued_at: int = int(signed_at.timestamp())
+        age: int = int(now) - issued_at
+        if age > time_limit or age < 0:
+            results.append(VerifyResult(False, EXPIRED, issued_at))
+        elif not match_token(signature, submitted):
+            results.append(VerifyResult(False, TOKEN_MISMATCH, issued_at))
+        else:
+            results.append(VerifyResult(True, OK, issued_at))
+    return results
+
+
+__all__: tuple[str, ...] = (
+    "EXPIRED",
+    "INVALID_SIGNATURE",
+    "MESSAGES",
+    "OK",
+    "TOKEN_MISMATCH",
+    "UNKNOWN_KEY",
+    "WEBSOCKET_STATE_KEY",
+    "VerifyResult",
+    "match_token",
+    "verify_chunk",
+)
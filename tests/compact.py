@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2020-2026 All rights reserved.
+# FILENAME:    ~~/tests/compact.py
+# VERSION:     1.0.7
+# CREATED:     2026-10-17 16:50
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+
+### Standard library ###
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from time import time
+
+### Third-party packages ###
+from fastapi.testclient import TestClient
+from httpx import Response
+from itsdangerous import BadSignature, SignatureExpired
+from pytest import MonkeyPatch, mark, raises
+
+### Local modules ###
+from fastapi_csrf_protect import CsrfProtect
+from fastapi_csrf_protect.compact import CompactSerializer
+from tests import test_client
+
+TOKEN: str = "0123456789abcdef0123456789abcdef01234567"
+
+
+def test_compact_serializer_roundtrip() -> None:
+    serializer: CompactSerializer = CompactSerializer("secret", "salt")
+    signed: str = serializer.dumps(TOKEN)
+    assert len(signed) == 55
+    assert serializer.loads(signed, max_age=60) == TOKEN
+    token, signed_at = serializer.loads(signed, max_age=60, return_timestamp=True)
+    assert token == TOKEN
+    assert abs(signed_at.timestamp() - time()) < 2
+
+
+def test_compact_serializer_rejects_non_token_payloads() -> None:
+    with raises(ValueError):
+        CompactSerializer("secret", "salt").dumps("not-hexadecimal")
+    with raises(ValueError):
+        CompactSerializer("secret", "salt").dumps("abcdef")
+
+
+@mark.parametrize(
+    "tamper",
+    (
+        lambda data: data[:-1] + bytes((data[-1] ^ 1,)),  # signature
+        lambda data: data[:10] + bytes((data[10] ^ 1,)) + data[11:],  # token
+        lambda data: bytes((2,)) + data[1:],  # version
+        lambda data: data[:-1],  # length
+    ),
+    ids=["signature", "token", "version", "length"],
+)
+def test_compact_serializer_rejects_tampered_tokens(tamper) -> None:
+    serializer: CompactSerializer = CompactSerializer("secret", "salt")
+    data: bytes = urlsafe_b64decode(serializer.dumps(TOKEN) + "=")
+    with raises(BadSignature):
+        serializer.loads(urlsafe_b64encode(tamper(data)).decode().rstrip("="))
+
+
+def test_compact_serializer_rejects_foreign_keys() -> None:
+    signed: str = CompactSerializer("secret", "salt").dumps(TOKEN)
+    with raises(BadSignature):
+        CompactSerializer("terces", "salt").loads(signed)
+    with raises(BadSignature):
+        CompactSerializer("secret", "pepper").loads(signed)
+    with raises(BadSignature):
+        CompactSerializer("secret", "salt").loads("!" * 55)
+
+
+def test_compact_serializer_expiry(monkeypatch: MonkeyPatch) -> None:
+    serializer: CompactSerializer = CompactSerializer("secret", "salt")
+    signed: str = serializer.dumps(TOKEN)
+    monkeypatch.setattr("fastapi_csrf_protect.compact.time", lambda: time() + 61)
+    assert serializer.loads(signed) == TOKEN
+    with raises(SignatureExpired):
+        serializer.loads(signed, max_age=60)
+
+
+def test_validate_compact_tokens(test_client: TestClient) -> None:
+    ### Loads config ###
+    @CsrfProtect.load_config
+    def _() -> tuple[tuple[str, dict[str, str] | set[str] | str], ...]:
+        return (
+            ("methods", {"DELETE", "PATCH", "POST", "PUT"}),
+            ("secret_keys", {"k1": "secret"}),
+            ("token_format", "compact"),
+            ("token_location", "header"),
+        )
+
+    ### Generate token ###
+    response: Response = test_client.get("/gen-token")
+    signed_token: str = test_client.cookies["fastapi-csrf-token"]
+    assert signed_token.startswith("k1:") and len(signed_token) == 58
+
+    ### Post to protected endpoint ###
+    csrf_token: str = response.json()["csrf_token"]
+    response = test_client.post("/protected", headers={"X-CSRF-Token": csrf_token})
+    assert response.status_code == 200
+    assert response.json() == {"detail": "OK"}
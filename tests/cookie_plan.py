@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2020-2026 All rights reserved.
+# FILENAME:    ~~/tests/cookie_plan.py
+# VERSION:     1.0.7
+# CREATED:     2026-10-17 18:40
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+
+### Standard library ###
+from asyncio import run
+from re import sub
+from typing import Any
+
+### Third-party packages ###
+from pytest import mark
+from starlette.responses import Response
+from starlette.types import Message
+
+### Local modules ###
+from fastapi_csrf_protect import CsrfProtect
+from fastapi_csrf_protect.cookie_plan import CookiePlan
+
+
+@mark.parametrize(
+    "options",
+    (
+        {
+            "path": "/",
+            "domain": None,
+            "secure": False,
+            "httponly": True,
+            "samesite": "lax",
+        },
+        {
+            "path": "/app",
+            "domain": "example.com",
+            "secure": True,
+            "httponly": False,
+            "samesite": None,
+        },
+        {
+            "path": None,
+            "domain": None,
+            "secure": True,
+            "httponly": True,
+            "samesite": "none",
+        },
+    ),
+    ids=["default", "domain-secure", "no-path"],
+)
+@mark.parametrize("value", ("2026a:abc.def-_", 'needs "quoting"; here'))
+def test_cookie_plan_matches_starlette(options: dict[str, Any], value: str) -> None:
+    plan: CookiePlan = CookiePlan.compile("csrf", 3600, *options.values())
+    response: Response = Response()
+    response.set_cookie("csrf", value, max_age=3600, **options)
+    assert plan.set_cookie(value) == response.raw_headers[-1]
+
+    ### Deletion only differs by its fixed expiry date in the past ###
+    response.delete_cookie("csrf", **options)
+    expires: bytes = b"expires=Thu, 01 Jan 1970 00:00:00 GMT"
+    assert plan.unset_cookie() == (
+        b"set-cookie",
+        sub(rb"expires=[^;]+", expires, response.raw_headers[-1][1]),
+    )
+
+
+def test_set_csrf_cookie_send() -> None:
+    @CsrfProtect.load_config
+    def _() -> tuple[tuple[str, Any], ...]:
+        return (("secret_key", "secret"), ("cookie_samesite", "strict"))
+
+    messages: list[Message] = []
+
+    async def send(message: Message) -> None:
+        messages.append(message)
+
+    async def stream() -> None:
+        csrf_protect: CsrfProtect = CsrfProtect()
+        wrapped = csrf_protect.set_csrf_cookie_send("signed", send)
+        wrapped = csrf_protect.unset_csrf_cookie_send(wrapped)
+        await wrapped({"type": "http.response.start", "status": 200, "headers": []})
+        await wrapped({"type": "http.response.body", "body": b"chunk"})
+
+    run(stream())
+    assert [value for _, value in messages[0]["headers"]] == [
+        (
+            b'fastapi-csrf-token=""; expires=Thu, 01 Jan 1970 00:00:00 GMT; HttpOnly; '
+            b"Max-Age=0; Path=/; SameSite=strict"
+        ),
+        b"fastapi-csrf-token=signed; HttpOnly; Max-Age=3600; Path=/; SameSite=strict",
+    ]
+    assert messages[1] == {"type": "http.response.body", "body": b"chunk"}
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2020-2026 All rights reserved.
+# FILENAME:    ~~/tests/delivery.py
+# VERSION:     1.0.7
+# CREATED:     2026-10-17 23:50
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+
+### Standard library ###
+from time import time
+from typing import Any
+
+### Third-party packages ###
+from fastapi import Depends, FastAPI, Request
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+from pytest import MonkeyPatch, mark
+
+### Local modules ###
+from fastapi_csrf_protect import CsrfProtect
+from fastapi_csrf_protect.delivery import entity_tag, etag_matches
+from fastapi_csrf_protect.flexible import CsrfProtect as FlexibleCsrfProtect
+
+
+def test_etag_matches() -> None:
+    etag: str = entity_tag("signed")
+    assert etag.startswith('"') and etag.endswith('"') and len(etag) == 34
+    assert etag_matches(etag, etag)
+    assert etag_matches(f'"other", W/{etag}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches(None, etag)
+    assert not etag_matches(entity_tag("other"), etag)
+
+
+@mark.parametrize("csrf_protect_class", (CsrfProtect, FlexibleCsrfProtect))
+def test_token_delivery_router(
+    csrf_protect_class: type[CsrfProtect] | type[FlexibleCsrfProtect],
+    monkeypatch: MonkeyPatch,
+) -> None:
+    @csrf_protect_class.load_config
+    def _() -> tuple[tuple[str, Any], ...]:
+        return (("max_age", 60), ("secret_key", "secret"))
+
+    app: FastAPI = FastAPI()
+    app.mount("/csrf", csrf_protect_class.router())
+
+    @app.post("/protected", response_class=JSONResponse)
+    async def update_resource(
+        request: Request, csrf_protect: Any = Depends(csrf_protect_class)
+    ) -> JSONResponse:
+        await csrf_protect.validate_csrf(request)
+        return JSONResponse(content={"detail": "OK"})
+
+    with TestClient(app) as client:
+        ### First call issues cookie and token ###
+        first = client.get("/csrf/token")
+        assert first.status_code == 200
+        assert "set-cookie" in first.headers
+        assert first.headers["cache-control"] == "private, no-cache"
+        csrf_token: str = first.json()["csrf_token"]
+        assert first.headers["x-csrf-token"] == csrf_token
+        etag: str = first.headers["etag"]
+        assert etag == entity_tag(client.cookies["fastapi-csrf-token"])
+
+        ### Repeat calls are revalidated without a body nor a new cookie ###
+        second = client.get("/csrf/token", headers={"if-none-match": etag})
+        assert second.status_code == 304
+        assert second.headers["etag"] == etag
+        assert "set-cookie" not in second.headers
+        assert not second.content
+        third = client.get("/csrf/token")
+        assert third.status_code == 200
+        assert third.json() == {"csrf_token": csrf_token}
+        assert "set-cookie" not in third.headers
+        response = client.post("/protected", headers={"X-CSRF-Token": csrf_token})
+        assert response.status_code == 200
+
+        ### Cookies near expiry are refreshed despite a matching ETag ###
+        monkeypatch.setattr("fastapi_csrf_protect.base.time", lambda: time() + 31)
+        fourth = client.get("/csrf/token", headers={"if-none-match": etag})
+        assert fourth.status_code == 200
+        assert "set-cookie" in fourth.headers
+        assert fourth.headers["etag"] != etag
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2020-2026 All rights reserved.
+# FILENAME:    ~~/tests/exemptions.py
+# VERSION:     1.0.7
+# CREATED:     2026-10-17 20:30
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+
+### Standard library ###
+from typing import Any
+
+### Third-party packages ###
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+from pytest import MonkeyPatch, mark, raises
+
+### Local modules ###
+from fastapi_csrf_protect import CsrfProtect, CsrfProtectMiddleware
+from fastapi_csrf_protect.exemptions import Exemptions
+
+
+def make_app() -> FastAPI:
+    app: FastAPI = FastAPI()
+    oauth: APIRouter = APIRouter(prefix="/oauth")
+
+    @app.post("/hooks/{provider}", name="webhook")
+    def webhook(provider: str) -> dict[str, str]:
+        return {"provider": provider}
+
+    @app.post("/exports/{name}.json", name="export")
+    def export(name: str) -> dict[str, str]:
+        return {"name": name}
+
+    @app.post("/orders")
+    def create_order() -> dict[str, str]:
+        return {"detail": "OK"}
+
+    @oauth.post("/callback/{rest:path}", name="oauth_callback")
+    def oauth_callback(rest: str) -> dict[str, str]:
+        return {"rest": rest}
+
+    app.include_router(oauth, prefix="/v1")
+    return app
+
+
+@mark.parametrize(
+    "method, path, expected",
+    (
+        ("POST", "/health", True),
+        ("POST", "/health/", False),
+        ("POST", "/status", True),
+        ("POST", "/status/live", True),
+        ("POST", "/statuses", False),
+        ("PUT", "/status", False),
+        ("POST", "/hooks/github", True),
+        ("POST", "/hooks/", False),
+        ("POST", "/hooks/github/extra", False),
+        ("PUT", "/hooks/github", False),
+        ("POST", "/exports/report.json", True),
+        ("POST", "/exports/report.csv", False),
+        ("POST", "/v1/oauth/callback/google", True),
+        ("POST", "/v1/oauth/callback", False),
+        ("POST", "/orders", False),
+    ),
+)
+def test_exemptions_match(method: str, path: str, expected: bool) -> None:
+    exemptions: Exemptions = (
+        Exemptions()
+        .add_path("/health")
+        .add_prefix("/status/", methods={"POST"})
+        .add_route("webhook")
+        .add_route("export")
+        .add_route("oauth_callback")
+    )
+    exemptions.compile(make_app().routes)
+    assert exemptions.is_exempt(method, path) is expected
+
+
+def test_exemptions_reject_unknown_route_names() -> None:
+    with raises(ValueError):
+        Exemptions().add_route("missing").compile(make_app().routes)
+
+
+def test_middleware_bypasses_exempt_routes() -> None:
+    @CsrfProtect.load_config
+    def _() -> tuple[tuple[str, Any], ...]:
+        return (
+            ("methods", {"DELETE", "PATCH", "POST", "PUT"}),
+            ("secret_key", "secret"),
+        )
+
+    app: FastAPI = make_app()
+    exemptions: Exemptions = Exemptions().add_route("webhook")
+    app.add_middleware(CsrfProtectMiddleware, exempt=exemptions)
+    with TestClient(app) as client:
+        assert exemptions.compiled
+        assert client.post("/hooks/github").json() == {"provider": "github"}
+        assert client.post("/orders").status_code == 400
+
+
+def test_middleware_fails_startup_on_unknown_route_names(
+    monkeypatch: MonkeyPatch,
+) -> None:
+    compilations: list[str] = []
+    compile_exemptions = Exemptions.compile
+
+    def counting_compile(self: Exemptions, *args: Any) -> Exemptions:
+        compilations.append("compile")
+        return compile_exemptions(self, *args)
+
+    monkeypatch.setattr(Exemptions, "compile", counting_compile)
+
+    def make_misconfigured_app() -> FastAPI:
+        app: FastAPI = make_app()
+        app.add_middleware(
+            CsrfProtectMiddleware, exempt=Exemptions().add_route("missing")
+        )
+        return app
+
+    ### Lifespan startup fails loudly ###
+    with (
+        raises(ValueError, match='Exempted route "missing" is not found'),
+        TestClient(make_misconfigured_app()),
+    ):
+        pass
+    assert compilations == ["compile"]
+
+    ### Without lifespan, routes are compiled once rather than on every request ###
+    client: TestClient = TestClient(
+        make_misconfigured_app(), raise_server_exceptions=False
+    )
+    for _ in range(3):
+        assert client.post("/orders").status_code == 500
+    assert compilations == ["compile", "compile"]
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2020-2026 All rights reserved.
+# FILENAME:    ~~/tests/flexible/metrics.py
+# VERSION:     1.0.7
+# CREATED:     2026-10-17 16:15
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+
+### Third-party packages ###
+from fastapi.testclient import TestClient
+from httpx import Response
+
+### Local modules ###
+from fastapi_csrf_protect.flexible import CsrfProtect
+from fastapi_csrf_protect.metrics import PrometheusMetrics
+from tests.flexible import flexible_client
+
+
+def test_metrics_sink_receives_fallback_phases(flexible_client: TestClient) -> None:
+    ### Loads config ###
+    @CsrfProtect.load_config
+    def _() -> tuple[tuple[str, set[str] | str], ...]:
+        return (
+            ("methods", {"DELETE", "PATCH", "POST", "PUT"}),
+            ("secret_key", "secret"),
+            ("token_key", "csrf-token"),
+        )
+
+    metrics: PrometheusMetrics = PrometheusMetrics()
+    CsrfProtect.add_metrics_sink(metrics)
+    try:
+        response: Response = flexible_client.get("/gen-token")
+        csrf_token: str = response.json()["csrf_token"]
+        flexible_client.post(
+            "/protected",
+            content=f"csrf-token={csrf_token}",
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+        )
+        flexible_client.get("/gen-token")
+        flexible_client.post(
+            "/protected",
+            content="email=user%40example.com",
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+        )
+    finally:
+        CsrfProtect.remove_metrics_sink(metrics)
+
+    ### Assertions ###
+    assert metrics.outcomes == {"missing_body_token": 1, "ok": 1}
+    assert {phase: sum(counts) for phase, (counts, _) in metrics.phases.items()} == {
+        "cookie": 2,
+        "extract_body": 2,
+        "extract_header": 2,
+        "verify": 1,
+    }
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2020-2026 All rights reserved.
+# FILENAME:    ~~/tests/header_plan.py
+# VERSION:     1.0.7
+# CREATED:     2026-10-17 13:10
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+
+### Third-party packages ###
+from fastapi.testclient import TestClient
+from httpx import Response
+from pytest import mark
+
+### Local modules ###
+from fastapi_csrf_protect import CsrfProtect
+from fastapi_csrf_protect.header_plan import HeaderPlan
+from tests import test_client
+
+
+@mark.parametrize(
+    "header_type, value, expected",
+    (
+        (None, "token", "token"),
+        (None, " token ", "token"),
+        (None, "two tokens", None),
+        (None, "", None),
+        ("Bearer", "Bearer token", "token"),
+        ("Bearer", "Bearer   token ", "token"),
+        ("Bearer", "Bearer", None),
+        ("Bearer", "Bearertoken", None),
+        ("Bearer", "Basic token", None),
+        ("Bearer", "Bearer two tokens", None),
+        ("Bearer+", "Bearer+ token", "token"),
+        ("Bearer+", "Bearerr token", None),
+        ("Token.*", "Token.* token", "token"),
+        ("Token.*", "Tokens token", None),
+    ),
+)
+def test_header_plan_parse(
+    header_type: None | str, value: str, expected: None | str
+) -> None:
+    plan: HeaderPlan = HeaderPlan.compile("X-CSRF-Token", header_type)
+    assert plan.parse(value) == expected
+
+
+def test_header_plan_find() -> None:
+    plan: HeaderPlan = HeaderPlan.compile("X-CSRF-Token", None)
+    assert plan.raw_name == b"x-csrf-token"
+    assert plan.find([(b"accept", b"*/*"), (b"x-csrf-token", b"token")]) == "token"
+    assert plan.find([(b"accept", b"*/*")]) is None
+
+
+def test_submit_csrf_token_with_header_type(test_client: TestClient) -> None:
+    ### Load config ###
+    @CsrfProtect.load_config
+    def _() -> tuple[tuple[str, str], ...]:
+        return (("header_type", "Bearer+"), ("secret_key", "secret"))
+
+    ### Generate token ###
+    response: Response = test_client.get("/gen-token")
+    csrf_token: str = response.json()["csrf_token"]
+
+    ### Post with header type which would have matched as an unescaped pattern ###
+    response = test_client.post(
+        "/protected", headers={"X-CSRF-Token": f"Bearerr {csrf_token}"}
+    )
+
+    ### Assertions ###
+    assert response.status_code == 422
+    assert response.json() == {
+        "detail": 'Bad X-CSRF-Token header. Expected value "Bearer+ <Token>"'
+    }
+
+    ### Post with configured header type ###
+    response = test_client.post(
+        "/protected", headers={"X-CSRF-Token": f"Bearer+ {csrf_token}"}
+    )
+
+    ### Assertions ###
+    assert response.status_code == 200
+    assert response.json() == {"detail": "OK"}
+
+    ### Reset header type ###
+    @CsrfProtect.load_config
+    def _() -> tuple[tuple[str, str], ...]:
+        return (("secret_key", "secret"),)
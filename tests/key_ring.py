@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2020-2026 All rights reserved.
+# FILENAME:    ~~/tests/key_ring.py
+# VERSION:     1.0.7
+# CREATED:     2026-10-17 15:05
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+
+### Standard library ###
+from typing import Any
+
+### Third-party packages ###
+from fastapi.testclient import TestClient
+from httpx import Response
+from pydantic import ValidationError
+from pytest import mark, raises
+
+### Local modules ###
+from fastapi_csrf_protect import CsrfProtect
+from fastapi_csrf_protect.key_ring import LEGACY_KEY_ID, KeyRing
+from tests import test_client
+
+
+def load_key_ring(secret_keys: dict[str, str], *settings: tuple[str, Any]) -> None:
+    @CsrfProtect.load_config
+    def _() -> tuple[tuple[str, Any], ...]:
+        return (
+            ("methods", {"DELETE", "PATCH", "POST", "PUT"}),
+            ("secret_keys", secret_keys),
+            ("token_location", "header"),
+            *settings,
+        )
+
+
+def post_protected(test_client: TestClient, signed: str, token: str) -> Response:
+    test_client.cookies.set("fastapi-csrf-token", signed)
+    return test_client.post("/protected", headers={"X-CSRF-Token": token})
+
+
+def test_key_ring_resolves_key_ids() -> None:
+    key_ring: KeyRing = KeyRing({"2026b": "newest", "2026a": "oldest"})
+    assert (key_ring.key_id, key_ring.secret_key) == ("2026b", "newest")
+    assert key_ring.resolve("2026a:signed") == ("2026a", "oldest", "signed")
+    assert key_ring.resolve("2025z:signed") is None
+    assert key_ring.resolve("signed") is None
+    legacy: KeyRing = KeyRing({"2026a": "newest"}, legacy_key="legacy")
+    assert legacy.resolve("signed") == (LEGACY_KEY_ID, "legacy", "signed")
+    assert legacy.resolve("2025z:signed") is None
+
+
+def test_rotate_secret_keys(test_client: TestClient) -> None:
+    ### Issue token with the only key ###
+    load_key_ring({"2026a": "oldest"})
+    csrf_token, signed_token = CsrfProtect().generate_csrf_tokens()
+    assert signed_token.startswith("2026a:")
+
+    ### Rotate keys: new tokens use newest key, old tokens remain valid ###
+    load_key_ring({"2026b": "newest", "2026a": "oldest"})
+    response: Response = test_client.get("/gen-token")
+    assert test_client.cookies["fastapi-csrf-token"].startswith("2026b:")
+    response = post_protected(
+        test_client,
+        test_client.cookies["fastapi-csrf-token"],
+        response.json()["csrf_token"],
+    )
+    assert response.status_code == 200
+    response = post_protected(test_client, signed_token, csrf_token)
+    assert response.status_code == 200
+    key_ring: None | KeyRing = CsrfProtect().profile.key_ring
+    assert key_ring is not None
+    assert key_ring.validations == {"2026a": 1, "2026b": 1}
+
+    ### Retire oldest key ###
+    load_key_ring({"2026b": "newest"})
+    response = post_protected(test_client, signed_token, csrf_token)
+    assert response.status_code == 401
+    assert response.json() == {"detail": "The CSRF token is invalid."}
+
+    ### Key id must match the key which signed the token ###
+    response = post_protected(
+        test_client, "2026b:" + signed_token.partition(":")[2], csrf_token
+    )
+    assert response.status_code == 401
+    assert response.json() == {"detail": "The CSRF token is invalid."}
+
+
+def test_migrate_secret_key_to_secret_keys(test_client: TestClient) -> None:
+    ### Issue unprefixed token with a single secret key ###
+    @CsrfProtect.load_config
+    def _() -> tuple[tuple[str, Any], ...]:
+        return (
+            ("methods", {"DELETE", "PATCH", "POST", "PUT"}),
+            ("secret_key", "legacy"),
+            ("token_location", "header"),
+        )
+
+    csrf_token, signed_token = CsrfProtect().generate_csrf_tokens()
+    assert ":" not in signed_token
+
+    ### Keys without legacy key reject unprefixed tokens ###
+    load_key_ring({"2026a": "newest"})
+    response: Response = post_protected(test_client, signed_token, csrf_token)
+    assert response.status_code == 401
+    assert response.json() == {"detail": "The CSRF token is invalid."}
+
+    ### Legacy key kept alongside keys verifies unprefixed tokens ###
+    load_key_ring({"2026a": "newest"}, ("secret_key", "legacy"))
+    response = post_protected(test_client, signed_token, csrf_token)
+    assert response.status_code == 200
+    test_client.cookies.clear()
+    response = test_client.get("/gen-token")
+    assert test_client.cookies["fastapi-csrf-token"].startswith("2026a:")
+    response = post_protected(
+        test_client,
+        test_client.cookies["fastapi-csrf-token"],
+        response.json()["csrf_token"],
+    )
+    assert response.status_code == 200
+    key_ring: None | KeyRing = CsrfProtect().profile.key_ring
+    assert key_ring is not None
+    assert key_ring.validations == {LEGACY_KEY_ID: 1, "2026a": 1}
+
+    ### Unprefixed tokens signed with another key remain invalid ###
+    load_key_ring({"2026a": "newest"}, ("secret_key", "other"))
+    response = post_protected(test_client, signed_token, csrf_token)
+    assert response.status_code == 401
+
+
+@mark.parametrize(
+    "csrf_settings",
+    (
+        (("secret_keys", {}),),
+        (("secret_keys", {"a:b": "secret"}),),
+        (("secret_keys", {"a" * 17: "secret"}),),
+    ),
+    ids=["empty", "key-id-with-separator", "key-id-too-long"],
+)
+def test_load_config_with_invalid_secret_keys(csrf_settings: tuple) -> None:
+    with raises(ValidationError):
+
+        @CsrfProtect.load_config
+        def _() -> tuple[tuple[str, Any], ...]:
+            return csrf_settings
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2020-2026 All rights reserved.
+# FILENAME:    ~~/tests/masking.py
+# VERSION:     1.0.7
+# CREATED:     2026-10-17 23:00
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+
+### Standard library ###
+from typing import Any
+
+### Third-party packages ###
+from fastapi import Depends, FastAPI, Request
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+from pytest import mark
+
+### Local modules ###
+from fastapi_csrf_protect import CsrfProtect
+from fastapi_csrf_protect.exceptions import CsrfProtectError
+from fastapi_csrf_protect.flexible import CsrfProtect as FlexibleCsrfProtect
+from fastapi_csrf_protect.masking import mask_token, unmask_token
+
+TOKEN: str = "0123456789abcdef0123456789abcdef01234567"
+
+
+def test_mask_token_roundtrip() -> None:
+    masked: set[str] = {mask_token(TOKEN) for _ in range(8)}
+    assert len(masked) == 8
+    for value in masked:
+        assert len(value) == 80
+        assert unmask_token(value.encode()) == TOKEN.encode()
+    assert unmask_token(b"zz" * 40) == b""
+    assert unmask_token(b"00 " * 27) == b""
+
+
+@mark.parametrize("csrf_protect_class", (CsrfProtect, FlexibleCsrfProtect))
+def test_masked_tokens_in_forms(
+    csrf_protect_class: type[CsrfProtect] | type[FlexibleCsrfProtect],
+) -> None:
+    @csrf_protect_class.load_config
+    def _() -> tuple[tuple[str, Any], ...]:
+        return (
+            ("secret_key", "secret"),
+            ("token_key", "csrf-token"),
+            ("token_location", "body"),
+        )
+
+    app: FastAPI = FastAPI()
+
+    @app.get("/form", response_class=JSONResponse)
+    def render_form(
+        request: Request, csrf_protect: Any = Depends(csrf_protect_class)
+    ) -> JSONResponse:
+        signed_token: None | str = request.cookies.get("fastapi-csrf-token")
+        masked: None | str = (
+            None
+            if signed_token is None
+            else csrf_protect.mask_signed_token(signed_token)
+        )
+        if masked is not None:
+            return JSONResponse(content={"csrf_token": masked})
+        csrf_token, signed_token = csrf_protect.generate_csrf_tokens()
+        response: JSONResponse = JSONResponse(
+            content={"csrf_token": mask_token(csrf_token)}
+        )
+        csrf_protect.set_csrf_cookie(signed_token, response)
+        return response
+
+    @app.post("/protected", response_class=JSONResponse)
+    async def update_resource(
+        request: Request, csrf_protect: Any = Depends(csrf_protect_class)
+    ) -> JSONResponse:
+        await csrf_protect.validate_csrf(request)
+        return JSONResponse(content={"detail": "OK"})
+
+    @app.exception_handler(CsrfProtectError)
+    def csrf_protect_error_handler(
+        request: Request, exc: CsrfProtectError
+    ) -> JSONResponse:
+        return JSONResponse(
+            status_code=exc.status_code, content={"detail": exc.message}
+        )
+
+    with TestClient(app) as client:
+        first = client.get("/form")
+        assert "set-cookie" in first.headers
+        second = client.get("/form")
+        assert "set-cookie" not in second.headers  # cookie kept for its lifetime
+        masked: list[str] = [first.json()["csrf_token"], second.json()["csrf_token"]]
+        assert masked[0] != masked[1]
+        for csrf_token in masked:
+            response = client.post("/protected", data={"csrf-token": csrf_token})
+            assert response.status_code == 200
+
+        ### Tampered masked tokens are rejected ###
+        tampered: str = masked[0][:40] + masked[1][40:]
+        response = client.post("/protected", data={"csrf-token": tampered})
+        assert response.status_code == 401
+        assert response.json() == {
+            "detail": "The CSRF signatures submitted do not match."
+        }
+        client.cookies.set("fastapi-csrf-token", "invalid")
+        assert "set-cookie" in client.get("/form").headers
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2020-2026 All rights reserved.
+# FILENAME:    ~~/tests/metrics.py
+# VERSION:     1.0.7
+# CREATED:     2026-10-17 16:15
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+
+### Third-party packages ###
+from fastapi.testclient import TestClient
+from httpx import Response
+
+### Local modules ###
+from fastapi_csrf_protect import CsrfProtect
+from fastapi_csrf_protect.metrics import NULL_METER, PrometheusMetrics, start_meter
+from tests import test_client
+
+
+def test_start_meter_without_sinks() -> None:
+    assert start_meter(()) is NULL_METER
+
+
+def test_prometheus_metrics_render() -> None:
+    metrics: PrometheusMetrics = PrometheusMetrics(buckets=(0.001, 0.01))
+    metrics.observe_phase("verify", 0.0005)
+    metrics.observe_phase("verify", 0.005)
+    metrics.observe_phase("verify", 0.5)
+    metrics.count_outcome("ok")
+    metrics.count_outcome("expired")
+    metrics.count_outcome("ok")
+    assert metrics.render().splitlines()[2:] == [
+        'fastapi_csrf_validations_total{reason="expired"} 1',
+        'fastapi_csrf_validations_total{reason="ok"} 2',
+        "# HELP fastapi_csrf_phase_seconds Time spent per CSRF validation phase.",
+        "# TYPE fastapi_csrf_phase_seconds histogram",
+        'fastapi_csrf_phase_seconds_bucket{phase="verify",le="0.001"} 1',
+        'fastapi_csrf_phase_seconds_bucket{phase="verify",le="0.01"} 2',
+        'fastapi_csrf_phase_seconds_bucket{phase="verify",le="+Inf"} 3',
+        'fastapi_csrf_phase_seconds_sum{phase="verify"} 0.5055',
+        'fastapi_csrf_phase_seconds_count{phase="verify"} 3',
+    ]
+
+
+def test_metrics_sink_receives_phases_and_reasons(test_client: TestClient) -> None:
+    ### Loads config ###
+    @CsrfProtect.load_config
+    def _() -> tuple[tuple[str, set[str] | str], ...]:
+        return (
+            ("methods", {"DELETE", "PATCH", "POST", "PUT"}),
+            ("secret_key", "secret"),
+            ("token_location", "header"),
+        )
+
+    metrics: PrometheusMetrics = PrometheusMetrics()
+    CsrfProtect.add_metrics_sink(metrics)
+    try:
+        response: Response = test_client.get("/gen-token")
+        csrf_token: str = response.json()["csrf_token"]
+        test_client.post("/protected", headers={"X-CSRF-Token": csrf_token})
+        test_client.get("/gen-token")
+        test_client.post("/protected", headers={"X-CSRF-Token": "mismatch"})
+        test_client.post("/protected", headers={"X-CSRF-Token": "Bearer malformed"})
+        test_client.post("/protected")
+        test_client.cookies.clear()
+        test_client.post("/protected", headers={"X-CSRF-Token": csrf_token})
+    finally:
+        CsrfProtect.remove_metrics_sink(metrics)
+
+    ### Assertions ###
+    assert metrics.outcomes == {
+        "malformed_header": 1,
+        "missing_cookie": 1,
+        "missing_header": 1,
+        "ok": 1,
+        "token_mismatch": 1,
+    }
+    assert {phase: sum(counts) for phase, (counts, _) in metrics.phases.items()} == {
+        "cookie": 5,
+        "extract_header": 4,
+        "verify": 2,
+    }
+    assert CsrfProtect._metrics_sinks == ()
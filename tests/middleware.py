@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2020-2026 All rights reserved.
+# FILENAME:    ~~/tests/middleware.py
+# VERSION:     1.0.7
+# CREATED:     2026-10-17 10:05
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+
+### Standard library ###
+from collections.abc import Generator
+
+### Third-party packages ###
+from fastapi import Depends, FastAPI, Request
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+from httpx import Response
+from pytest import fixture, mark
+
+### Local modules ###
+from fastapi_csrf_protect import CsrfProtect, CsrfProtectMiddleware
+from fastapi_csrf_protect.flexible import CsrfProtect as FlexibleCsrfProtect
+
+UNSAFE_METHODS: set[str] = {"DELETE", "PATCH", "POST", "PUT"}
+
+
+@fixture(params=(CsrfProtect, FlexibleCsrfProtect), ids=("normal", "flexible"))
+def middleware_client(request) -> Generator[TestClient, None, None]:
+    """
+    Sets up a FastAPI TestClient wrapped around an application enforcing CSRF
+    Protection via middleware instead of per-route dependencies
+
+    ---
+    :return: test client fixture used for local testing
+    :rtype: fastapi.testclient.TestClient
+    """
+    csrf_protect_class = request.param
+    app: FastAPI = FastAPI()
+    app.add_middleware(CsrfProtectMiddleware, csrf_protect=csrf_protect_class)
+
+    @app.get("/gen-token", response_class=JSONResponse)
+    def read_resource(
+        csrf_protect: csrf_protect_class = Depends(csrf_protect_class),
+    ) -> JSONResponse:
+        csrf_token, signed_token = csrf_protect.generate_csrf_tokens()
+        response: JSONResponse = JSONResponse(
+            status_code=200, content={"detail": "OK", "csrf_token": csrf_token}
+        )
+        csrf_protect.set_csrf_cookie(signed_token, response)
+        return response
+
+    @app.api_route("/protected", methods=["PATCH", "POST", "PUT"])
+    async def update_resource(request: Request) -> JSONResponse:
+        body: bytes = await request.body()
+        return JSONResponse(
+            status_code=200, content={"detail": "OK", "body": body.decode("utf-8")}
+        )
+
+    with TestClient(app) as client:
+        client.csrf_protect_class = csrf_protect_class  # type: ignore[attr-defined]
+        yield client
+
+
+def test_middleware_skips_safe_methods(middleware_client: TestClient) -> None:
+    ### Load config ###
+    @middleware_client.csrf_protect_class.load_config  # type: ignore[attr-defined]
+    def _() -> tuple[tuple[str, object], ...]:
+        return (("methods", UNSAFE_METHODS), ("secret_key", "secret"))
+
+    ### Safe method without any tokens ###
+    response: Response = middleware_client.get("/gen-token")
+
+    ### Assertions ###
+    assert response.status_code == 200
+
+
+def test_middleware_validates_header(middleware_client: TestClient) -> None:
+    ### Load config ###
+    @middleware_client.csrf_protect_class.load_config  # type: ignore[attr-defined]
+    def _() -> tuple[tuple[str, object], ...]:
+        return (("methods", UNSAFE_METHODS), ("secret_key", "secret"))
+
+    ### Generate token ###
+    response: Response = middleware_client.get("/gen-token")
+    csrf_token: str = response.json()["csrf_token"]
+
+    ### Post to protected endpoint ###
+    response = middleware_client.post(
+        "/protected", headers={"X-CSRF-Token": csrf_token}
+    )
+
+    ### Assertions ###
+    assert response.status_code == 200
+    assert response.json() == {"detail": "OK", "body": ""}
+
+    ### Post with mismatched token ###
+    response = middleware_client.post("/protected", headers={"X-CSRF-Token": "bad"})
+
+    ### Assertions ###
+    assert response.status_code == 401
+    assert response.json() == {"detail": "The CSRF signatures submitted do not match."}
+
+
+def test_middleware_validates_body_and_replays_it(
+    middleware_client: TestClient,
+) -> None:
+    ### Load config ###
+    @middleware_client.csrf_protect_class.load_config  # type: ignore[attr-defined]
+    def _() -> tuple[tuple[str, object], ...]:
+        return (
+            ("methods", UNSAFE_METHODS),
+            ("secret_key", "secret"),
+            ("token_key", "csrf-token"),
+            ("token_location", "body"),
+        )
+
+    ### Generate token ###
+    response: Response = middleware_client.get("/gen-token")
+    csrf_token: str = response.json()["csrf_token"]
+
+    ### Post to protected endpoint ###
+    response = middleware_client.post(
+        "/protected", data={"csrf-token": csrf_token, "name": "protect"}
+    )
+
+    ### Assertions ###
+    assert response.status_code == 200
+    assert response.json() == {
+        "detail": "OK",
+        "body": f"csrf-token={csrf_token}&name=protect",
+    }
+
+
+def test_middleware_missing_cookie(middleware_client: TestClient) -> None:
+    ### Load config ###
+    @middleware_client.csrf_protect_class.load_config  # type: ignore[attr-defined]
+    def _() -> tuple[tuple[str, object], ...]:
+        return (("methods", UNSAFE_METHODS), ("secret_key", "secret"))
+
+    ### Post to protected endpoint without generating tokens ###
+    response: Response = middleware_client.post(
+        "/protected", headers={"X-CSRF-Token": "token"}
+    )
+
+    ### Assertions ###
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Missing Cookie: `fastapi-csrf-token`."}
+
+
+@mark.parametrize("method", ("PATCH", "PUT"))
+def test_middleware_only_enforces_configured_methods(
+    method: str, middleware_client: TestClient
+) -> None:
+    ### Load config ###
+    @middleware_client.csrf_protect_class.load_config  # type: ignore[attr-defined]
+    def _() -> tuple[tuple[str, object], ...]:
+        return (("secret_key", "secret"), ("methods", {"POST"}))
+
+    ### Request without any tokens using a method outside of `methods` ###
+    response: Response = middleware_client.request(method, "/protected")
+
+    ### Assertions ###
+    assert response.status_code == 200
+
+    ### Request without any tokens using a configured method ###
+    response = middleware_client.post("/protected")
+
+    ### Assertions ###
+    assert response.status_code in {400, 422}
+
+    ### Restore default methods ###
+    @middleware_client.csrf_protect_class.load_config  # type: ignore[attr-defined]
+    def _() -> tuple[tuple[str, object], ...]:
+        return (
+            ("secret_key", "secret"),
+            ("methods", {"DELETE", "PATCH", "POST", "PUT"}),
+        )
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2020-2026 All rights reserved.
+# FILENAME:    ~~/tests/origin_policy.py
+# VERSION:     1.0.7
+# CREATED:     2026-10-17 22:30
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+
+### Standard library ###
+from typing import Any
+
+### Third-party packages ###
+from fastapi import Depends, FastAPI, Request
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+from pydantic import ValidationError
+from pytest import mark, raises
+
+### Local modules ###
+from fastapi_csrf_protect import CsrfProtect, CsrfProtectMiddleware
+from fastapi_csrf_protect.exceptions import CsrfProtectError
+from fastapi_csrf_protect.flexible import CsrfProtect as FlexibleCsrfProtect
+from fastapi_csrf_protect.origin_policy import OriginPolicy
+
+
+@mark.parametrize(
+    "headers, expected",
+    (
+        ({"sec-fetch-site": "same-origin"}, "same_origin"),
+        ({"sec-fetch-site": "cross-site"}, "cross_site"),
+        ({"sec-fetch-site": "same-site"}, "cross_site"),
+        ({"sec-fetch-site": "none"}, "unknown"),
+        ({"sec-fetch-site": "cross-site", "origin": "https://App.Test"}, "same_origin"),
+        ({"origin": "http://example.test"}, "same_origin"),
+        ({"origin": "http://example.test:80"}, "same_origin"),
+        ({"origin": "https://app.test:443"}, "same_origin"),
+        ({"origin": "https://example.test"}, "unknown"),  # i.e. behind TLS proxy
+        (
+            {"origin": "https://example.test", "sec-fetch-site": "cross-site"},
+            "cross_site",
+        ),
+        ({"origin": "null"}, "unknown"),
+        ({}, "unknown"),
+    ),
+)
+def test_origin_policy_classify(headers: dict[str, str], expected: str) -> None:
+    policy: OriginPolicy = OriginPolicy.compile(
+        "reject_cross_site", {"https://app.test/"}
+    )
+    scope: dict[str, Any] = {
+        "scheme": "http",
+        "headers": [(b"host", b"example.test")]
+        + [(name.encode(), value.encode()) for name, value in headers.items()],
+    }
+    assert policy.classify(scope) == expected
+
+
+@mark.parametrize(
+    "scheme, host, origin",
+    (
+        ("http", "example.test:80", "http://example.test"),
+        ("https", "example.test:443", "https://example.test"),
+        ("https", "example.test", "https://Example.Test:443"),
+        ("http", "example.test:8080", "http://example.test:8080"),
+    ),
+)
+def test_origin_policy_ignores_default_ports(
+    scheme: str, host: str, origin: str
+) -> None:
+    policy: OriginPolicy = OriginPolicy.compile("reject_cross_site")
+    scope: dict[str, Any] = {
+        "scheme": scheme,
+        "headers": [(b"host", host.encode()), (b"origin", origin.encode())],
+    }
+    assert policy.classify(scope) == "same_origin"
+
+
+@mark.parametrize(
+    "settings",
+    (
+        (("trusted_origins", {"https://app.test"}),),
+        (("origin_policy", "reject_cross_site"), ("trusted_origins", {"app.test"})),
+        (("origin_policy", "reject_cross_site"), ("trusted_origins", {"https://a/b"})),
+        (("origin_policy", "allow_all"),),
+    ),
+)
+def test_origin_policy_config_errors(settings: tuple[tuple[str, Any], ...]) -> None:
+    with raises(ValidationError):
+
+        @CsrfProtect.load_config
+        def _() -> tuple[tuple[str, Any], ...]:
+            return (("secret_key", "secret"), *settings)
+
+
+@mark.parametrize("csrf_protect_class", (CsrfProtect, FlexibleCsrfProtect))
+@mark.parametrize("middleware", (False, True), ids=("dependency", "middleware"))
+@mark.parametrize("mode", ("allow_same_origin", "reject_cross_site"))
+def test_origin_policy_precheck(
+    csrf_protect_class: type[CsrfProtect] | type[FlexibleCsrfProtect],
+    middleware: bool,
+    mode: str,
+) -> None:
+    @csrf_protect_class.load_config
+    def _() -> tuple[tuple[str, Any], ...]:
+        return (
+            ("methods", {"DELETE", "PATCH", "POST", "PUT"}),
+            ("origin_policy", mode),
+            ("secret_key", "secret"),
+            ("trusted_origins", {"https://app.test"}),
+        )
+
+    app: FastAPI = FastAPI()
+    if middleware:
+        app.add_middleware(CsrfProtectMiddleware, csrf_protect=csrf_protect_class)
+
+    @app.post("/protected", response_class=JSONResponse)
+    async def update_resource(
+        request: Request, csrf_protect: Any = Depends(csrf_protect_class)
+    ) -> JSONResponse:
+        if not middleware:
+            await csrf_protect.validate_csrf(request)
+        return JSONResponse(content={"detail": "OK"})
+
+    @app.exception_handler(CsrfProtectError)
+    def csrf_protect_error_handler(
+        request: Request, exc: CsrfProtectError
+    ) -> JSONResponse:
+        return JSONResponse(
+            status_code=exc.status_code, content={"detail": exc.message}
+        )
+
+    token, signed = csrf_protect_class().generate_csrf_tokens()
+    with TestClient(app) as client:
+        ### Cross-site requests are rejected before tokens are looked at ###
+        client.cookies.set("fastapi-csrf-token", signed)
+        for headers in (
+            {"Sec-Fetch-Site": "cross-site", "X-CSRF-Token": token},
+            {
+                "Origin": "https://evil.test",
+                "Sec-Fetch-Site": "cross-site",
+                "X-CSRF-Token": token,
+            },
+        ):
+            response = client.post("/protected", headers=headers)
+            assert response.status_code == 403
+            assert response.json() == {"detail": "Cross-site request rejected."}
+
+        ### Same-origin requests skip the token check only when allowed by policy ###
+        client.cookies.clear()
+        for headers in (
+            {"Sec-Fetch-Site": "same-origin"},
+            {"Origin": "http://testserver"},
+            {"Origin": "https://app.test"},
+        ):
+            response = client.post("/protected", headers=headers)
+            assert response.status_code == (200 if mode == "allow_same_origin" else 400)
+
+        ### Clients sending neither header fall back to the double-submit check ###
+        assert client.post("/protected").status_code == 400
+        client.cookies.set("fastapi-csrf-token", signed)
+        response = client.post("/protected", headers={"X-CSRF-Token": token})
+        assert response.status_code == 200
+
+        ### Other origins without Fetch Metadata, i.e. behind TLS proxy, too ###
+        headers = {"Origin": "https://testserver", "X-CSRF-Token": token}
+        assert client.post("/protected", headers=headers).status_code == 200
+        client.cookies.clear()
+        assert client.post("/protected", headers=headers).status_code == 400
@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2020-2026 All rights reserved.
+# FILENAME:    ~~/tests/parsers.py
+# VERSION:     1.0.7
+# CREATED:     2026-10-17 11:02
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+
+### Standard library ###
+from asyncio import run
+from typing import Any
+from urllib.parse import urlencode
+
+### Third-party packages ###
+from fastapi import Depends, FastAPI, Request
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+from httpx import Request as HttpxRequest
+from httpx import Response
+from pytest import mark
+from starlette.types import Message
+
+### Local modules ###
+from fastapi_csrf_protect import CsrfProtect, CsrfProtectMiddleware
+from fastapi_csrf_protect.exceptions import CsrfProtectError
+from fastapi_csrf_protect.parsers import (
+    MultipartTokenScanner,
+    UrlencodedTokenScanner,
+    find_json_token,
+    find_multipart_token,
+    find_urlencoded_token,
+    is_json,
+    multipart_boundary,
+    receive_body_token,
+    receive_urlencoded_token,
+)
+from tests import test_client
+
+
+@mark.parametrize(
+    "body, expected",
+    (
+        (b"csrf-token=abc", "abc"),
+        (b"name=protect&csrf-token=abc&email=a%40b.c", "abc"),
+        (b"csrf-token=a%2Bb%3Dc%26d", "a+b=c&d"),
+        (b"csrf-token=a+b", "a b"),
+        (b"csrf%2Dtoken=abc", "abc"),
+        (b"csrf-token=", ""),
+        (b"csrf-token", None),
+        (b"csrf-tokens=abc&csrf-token=def", "def"),
+        (b"name=protect", None),
+        (b"", None),
+    ),
+)
+def test_find_urlencoded_token(body: bytes, expected: None | str) -> None:
+    assert find_urlencoded_token(body, "csrf-token") == expected
+
+
+def test_scanner_handles_every_chunk_boundary() -> None:
+    body: bytes = urlencode(
+        {"name": "protect" * 8, "csrf-token": "0123456789abcdef", "email": "a@b.c"}
+    ).encode("utf-8")
+    for size in range(1, len(body) + 1):
+        scanner: UrlencodedTokenScanner = UrlencodedTokenScanner("csrf-token")
+        token: None | str = None
+        for offset in range(0, len(body), size):
+            token = scanner.feed(body[offset : offset + size])
+            if token is not None:
+                break
+        else:
+            token = scanner.close()
+        assert token == "0123456789abcdef"
+
+
+def test_scanner_skips_large_fields_without_buffering() -> None:
+    scanner: UrlencodedTokenScanner = UrlencodedTokenScanner("csrf-token")
+    assert scanner.feed(b"upload=") is None
+    for _ in range(64):
+        assert scanner.feed(b"x" * 65536) is None
+        assert scanner._value is None
+        assert len(scanner._tail or b"") <= 31
+    assert scanner.feed(b"&csrf-token=abc") is None
+    assert scanner.close() == "abc"
+
+
+def test_scanner_ignores_oversized_token_values() -> None:
+    scanner: UrlencodedTokenScanner = UrlencodedTokenScanner(
+        "csrf-token", max_value_size=8
+    )
+    assert scanner.feed(b"csrf-token=" + b"x" * 64) is None
+    assert scanner.close() is None
+
+
+def test_receive_urlencoded_token_stops_early() -> None:
+    messages: list[Message] = [
+        {"type": "http.request", "body": b"csrf-to", "more_body": True},
+        {"type": "http.request", "body": b"ken=abc&name=", "more_body": True},
+        {"type": "http.request", "body": b"protect", "more_body": False},
+    ]
+    pending: list[Message] = list(messages)
+
+    async def receive() -> Message:
+        return pending.pop(0)
+
+    token, consumed = run(receive_urlencoded_token(receive, "csrf-token"))
+    assert token == "abc"
+    assert consumed == messages[:2]
+    assert pending == messages[2:]
+
+
+def test_submit_percent_encoded_form_without_token(test_client: TestClient) -> None:
+    ### Load config ###
+    @CsrfProtect.load_config
+    def _() -> tuple[tuple[str, str], ...]:
+        return (
+            ("secret_key", "secret"),
+            ("token_key", "csrf-token"),
+            ("token_location", "body"),
+        )
+
+    ### Generate token ###
+    response: Response = test_client.get("/gen-token")
+    assert response.status_code == 200
+
+    ### Post to protected endpoint without a token ###
+    response = test_client.post("/protected", data={"email": "user@example.com"})
+
+    ### Assertions ###
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Missing `csrf-token` in request body."}
+
+
+def multipart(*fields: tuple[str, Any]) -> tuple[bytes, bytes]:
+    request: HttpxRequest = HttpxRequest("POST", "http://test/", files=list(fields))
+    return request.read(), multipart_boundary(request.headers["content-type"])  # type: ignore[return-value]
+
+
+@mark.parametrize(
+    "content_type, expected",
+    (
+        ("multipart/form-data; boundary=abc", b"abc"),
+        ('Multipart/Form-Data; charset=utf-8; boundary="a b"', b"a b"),
+        ("multipart/form-data", None),
+        ("application/x-www-form-urlencoded", None),
+        (None, None),
+    ),
+)
+def test_multipart_boundary(content_type: None | str, expected: None | bytes) -> None:
+    assert multipart_boundary(content_type) == expected
+
+
+def test_multipart_scanner_handles_every_chunk_boundary() -> None:
+    body, boundary = multipart(
+        ("name", (None, b"protect")),
+        ("csrf-token", (None, b"0123456789abcdef")),
+        ("upload", ("upload.bin", b"\r\n--" + b"-" * 32, "text/plain")),
+    )
+    for size in range(1, len(body) + 1):
+        scanner: MultipartTokenScanner = MultipartTokenScanner(boundary, "csrf-token")
+        token: None | str = None
+        for offset in range(0, len(body), size):
+            token = scanner.feed(body[offset : offset + size])
+            if token is not None:
+                break
+        else:
+            token = scanner.close()
+        assert token == "0123456789abcdef"
+
+
+def test_multipart_scanner_skips_fields_without_buffering() -> None:
+    body, boundary = multipart(
+        ("notes", (None, b"x" * 1_000_000)),
+        ("csrf-token", (None, b"abc")),
+        ("upload", ("upload.bin", b"x" * 1_000_000)),
+    )
+    scanner: MultipartTokenScanner = MultipartTokenScanner(boundary, "csrf-token")
+    token: None | str = None
+    for offset in range(0, len(body), 65536):
+        token = scanner.feed(body[offset : offset + 65536])
+        assert len(scanner._buffer) < 128
+        if token is not None:
+            break
+    assert token == "abc"
+    assert offset < 1_100_000  # stopped before reading the upload
+    assert find_multipart_token(body, boundary, "csrf-token") == "abc"
+    assert find_multipart_token(body, boundary, "missing") is None
+
+
+def test_multipart_scanner_stops_at_first_file() -> None:
+    body, boundary = multipart(
+        ("csrf-token", ("csrf-token.txt", b"file-is-not-a-token")),
+        ("csrf-token", (None, b"abc")),
+    )
+    assert find_multipart_token(body, boundary, "csrf-token") is None
+    body, boundary = multipart(
+        ("upload", ("upload.bin", b"x" * 10_000_000)),
+        ("csrf-token", (None, b"abc")),
+    )
+    chunks: list[bytes] = [
+        body[offset : offset + 65536] for offset in range(0, len(body), 65536)
+    ]
+    pending: list[Message] = [
+        {"type": "http.request", "body": chunk, "more_body": True} for chunk in chunks
+    ]
+    pending[-1]["more_body"] = False
+
+    async def receive() -> Message:
+        return pending.pop(0)
+
+    token, consumed = run(
+        receive_body_token(receive, MultipartTokenScanner(boundary, "csrf-token"))
+    )
+    assert token is None
+    assert len(consumed) == 1  # upload is neither read through nor retained
+
+
+@mark.parametrize("with_middleware", (False, True), ids=["dependency", "middleware"])
+def test_submit_multipart_form_replays_body(with_middleware: bool) -> None:
+    @CsrfProtect.load_config
+    def _() -> tuple[tuple[str, Any], ...]:
+        return (
+            ("methods", {"DELETE", "PATCH", "POST", "PUT"}),
+            ("secret_key", "secret"),
+            ("token_key", "csrf-token"),
+            ("token_location", "body"),
+        )
+
+    app: FastAPI = FastAPI()
+    if with_middleware:
+        app.add_middleware(CsrfProtectMiddleware)
+
+    @app.post("/upload", response_class=JSONResponse)
+    async def upload(
+        request: Request, csrf_protect: CsrfProtect = Depends()
+    ) -> JSONResponse:
+        if not with_middleware:
+            await csrf_protect.validate_csrf(request)
+        form = await request.form()
+        return JSONResponse(content={"size": len(await form["upload"].read())})  # type: ignore[union-attr]
+
+    token, signed = CsrfProtect().generate_csrf_tokens()
+    with TestClient(app) as client:
+        client.cookies.set("fastapi-csrf-token", signed)
+        response: Response = client.post(
+            "/upload",
+            data={"csrf-token": token},
+            files={"upload": ("upload.bin", b"x" * 100_000)},
+        )
+    assert response.status_code == 200
+    assert response.json() == {"size": 100_000}
+
+
+@mark.parametrize(
+    "body, expected",
+    (
+        (b'{"csrf-token": "abc", "rows": [{"csrf-token": "nested"}]}', ("abc", None)),
+        (b'{"csrf-token": "abc"} trailing', ("abc", None)),  # left to the endpoint
+        (b'{"csrf-token": "abc", "rows": [1,]}', ("abc", None)),
+        (
+            b'{"rows": [1], "csrf-token" : "abc"} ',
+            ("abc", {"rows": [1], "csrf-token": "abc"}),
+        ),
+        (b'{"rows": [1, 2]}', (None, {"rows": [1, 2]})),
+        (b'{"csrf-token": 1, "rows": []}', (None, None)),
+        (b"[1, 2]", (None, [1, 2])),
+        ('{"csrf-token": "abc"}'.encode("utf-16"), ("abc", {"csrf-token": "abc"})),
+        (b'{"rows": [1, 2],}', (None, None)),
+        (b'{"rows": [1, 2]} trailing', (None, None)),
+        (b"", (None, None)),
+    ),
+    ids=[
+        "first",
+        "first-trailing-data",
+        "first-malformed-rest",
+        "last",
+        "missing",
+        "not-a-string",
+        "array",
+        "utf-16",
+        "trailing-comma",
+        "trailing-data",
+        "empty",
+    ],
+)
+def test_find_json_token(body: bytes, expected: tuple[None | str, Any]) -> None:
+    assert find_json_token(body, "csrf-token") == expected
+
+
+@mark.parametrize(
+    "content_type, expected",
+    (
+        ("application/json", True),
+        ("Application/JSON; charset=utf-8", True),
+        ("application/vnd.api+json", True),
+        ("application/jsonl", False),
+        ("text/plain", False),
+        (None, False),
+    ),
+)
+def test_is_json(content_type: None | str, expected: bool) -> None:
+    assert is_json(content_type) == expected
+
+
+@mark.parametrize("token_first", (True, False), ids=["token-first", "token-last"])
+@mark.parametrize("with_middleware", (False, True), ids=["dependency", "middleware"])
+def test_submit_json_body(token_first: bool, with_middleware: bool) -> None:
+    @CsrfProtect.load_config
+    def _() -> tuple[tuple[str, Any], ...]:
+        return (
+            ("methods", {"DELETE", "PATCH", "POST", "PUT"}),
+            ("secret_key", "secret"),
+            ("token_key", "csrf-token"),
+            ("token_location", "body"),
+        )
+
+    app: FastAPI = FastAPI()
+    if with_middleware:
+        app.add_middleware(CsrfProtectMiddleware)
+
+    @app.post("/import", response_class=JSONResponse)
+    async def bulk_import(
+        request: Request, csrf_protect: CsrfProtect = Depends()
+    ) -> JSONResponse:
+        if not with_middleware:
+            await csrf_protect.validate_csrf(request)
+        cached: bool = hasattr(request, "_json")
+        rows: list[int] = (await request.json())["rows"]
+        return JSONResponse(content={"cached": cached, "rows": len(rows)})
+
+    @app.exception_handler(CsrfProtectError)
+    def csrf_protect_error_handler(
+        request: Request, exc: CsrfProtectError
+    ) -> JSONResponse:
+        return JSONResponse(
+            status_code=exc.status_code, content={"detail": exc.message}
+        )
+
+    token, signed = CsrfProtect().generate_csrf_tokens()
+    payload: dict[str, Any] = {"rows": list(range(1000))}
+    payload = (
+        {"csrf-token": token, **payload}
+        if token_first
+        else {**payload, "csrf-token": token}
+    )
+    with TestClient(app) as client:
+        client.cookies.set("fastapi-csrf-token", signed)
+        response: Response = client.post("/import", json=payload)
+        assert response.status_code == 200
+        assert response.json() == {
+            "cached": not (token_first or with_middleware),
+            "rows": 1000,
+        }
+
+        ### Missing token ###
+        response = client.post("/import", json={"rows": []})
+        assert response.status_code == 400
+        assert response.json() == {"detail": "Missing `csrf-token` in request body."}
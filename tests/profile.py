@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2020-2026 All rights reserved.
+# FILENAME:    ~~/tests/profile.py
+# VERSION:     1.0.7
+# CREATED:     2026-10-17 17:30
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+
+### Standard library ###
+from typing import Any
+
+### Third-party packages ###
+from fastapi import Depends, FastAPI
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+from httpx import Response
+from pytest import raises
+
+### Local modules ###
+from fastapi_csrf_protect import CsrfProfile, CsrfProtect, CsrfProtectMiddleware
+from fastapi_csrf_protect.exceptions import TokenValidationError
+from fastapi_csrf_protect.extraction import (
+    extract_body,
+    extract_header,
+    extract_scope_body,
+    extract_scope_header,
+)
+from fastapi_csrf_protect.flexible import CsrfProtect as FlexibleCsrfProtect
+
+
+@CsrfProfile.load_config
+def admin_profile() -> tuple[tuple[str, Any], ...]:
+    return (
+        ("cookie_key", "admin-csrf-token"),
+        ("header_name", "X-Admin-CSRF-Token"),
+        ("secret_key", "admin-secret"),
+    )
+
+
+@CsrfProfile.load_config
+def shop_profile() -> tuple[tuple[str, Any], ...]:
+    return (
+        ("cookie_key", "shop-csrf-token"),
+        ("methods", {"POST"}),
+        ("secret_key", "shop-secret"),
+    )
+
+
+def test_profile_is_immutable() -> None:
+    with raises(AttributeError):
+        admin_profile.secret_key = "changed"  # type: ignore[misc]
+    with raises(AttributeError):
+        del admin_profile.secret_key  # type: ignore[misc]
+    with raises(AttributeError):
+        admin_profile.unknown = "value"  # type: ignore[attr-defined]
+    assert admin_profile.header_plan.raw_name == b"x-admin-csrf-token"
+    assert admin_profile.cookie_samesite == "lax"
+
+
+def test_profile_binds_extraction_plan() -> None:
+    assert admin_profile.extraction_plan == (
+        True,
+        extract_header,
+        extract_scope_header,
+    )
+    body_profile: CsrfProfile = CsrfProfile(token_location="body")
+    assert body_profile.extraction_plan == (False, extract_body, extract_scope_body)
+    assert not CsrfProtect.from_profile(body_profile)._token_in_header(None)  # type: ignore[arg-type]
+
+
+def test_instances_keep_profile_across_load_config() -> None:
+    ### Loads config ###
+    @CsrfProtect.load_config
+    def _() -> tuple[tuple[str, str], ...]:
+        return (("secret_key", "secret"),)
+
+    csrf_protect: CsrfProtect = CsrfProtect()
+    token, signed = csrf_protect.generate_csrf_tokens()
+
+    ### Reload while instance is in flight ###
+    @CsrfProtect.load_config
+    def _() -> tuple[tuple[str, str], ...]:
+        return (("secret_key", "terces"),)
+
+    assert csrf_protect._profile.secret_key == "secret"
+    csrf_protect._verify_tokens(signed, token, "secret", 60)
+    with raises(TokenValidationError):
+        CsrfProtect()._verify_tokens(signed, token, "terces", 60)
+
+
+def test_profiles_side_by_side() -> None:
+    admin_app: FastAPI = FastAPI()
+    admin_app.add_middleware(CsrfProtectMiddleware, profile=admin_profile)
+
+    @admin_app.get("/gen-token")
+    def generate(
+        csrf_protect: CsrfProtect = Depends(
+            lambda: CsrfProtect.from_profile(admin_profile)
+        ),
+    ) -> JSONResponse:
+        token, signed = csrf_protect.generate_csrf_tokens()
+        response: JSONResponse = JSONResponse({"csrf_token": token})
+        csrf_protect.set_csrf_cookie(signed, response)
+        return response
+
+    shop_app: FastAPI = FastAPI()
+    shop_app.add_middleware(
+        CsrfProtectMiddleware, csrf_protect=FlexibleCsrfProtect, profile=shop_profile
+    )
+
+    for app in (admin_app, shop_app):
+
+        @app.api_route("/protected", methods=["DELETE", "POST"])
+        def protected() -> dict[str, str]:
+            return {"detail": "OK"}
+
+    with TestClient(admin_app) as admin, TestClient(shop_app) as shop:
+        ### Admin settings: own cookie and header names ###
+        response: Response = admin.get("/gen-token")
+        assert "admin-csrf-token" in admin.cookies
+        headers: dict[str, str] = {"X-Admin-CSRF-Token": response.json()["csrf_token"]}
+        assert admin.post("/protected", headers=headers).status_code == 200
+        assert admin.delete("/protected").status_code == 422  # header missing
+
+        ### Shop settings: only POST is protected, admin tokens are not accepted ###
+        assert shop.delete("/protected").status_code == 200
+        shop.cookies.set("admin-csrf-token", admin.cookies["admin-csrf-token"])
+        assert shop.post("/protected", headers=headers).status_code == 400
+        token, signed = FlexibleCsrfProtect.from_profile(
+            shop_profile
+        ).generate_csrf_tokens()
+        shop.cookies.set("shop-csrf-token", signed)
+        response = shop.post("/protected", headers={"X-CSRF-Token": token})
+        assert response.status_code == 200
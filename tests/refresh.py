@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2020-2026 All rights reserved.
+# FILENAME:    ~~/tests/refresh.py
+# VERSION:     1.0.7
+# CREATED:     2026-10-17 23:30
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+
+### Standard library ###
+from time import time
+from typing import Any
+
+### Third-party packages ###
+from fastapi import Depends, FastAPI, Request, Response
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+from pydantic import ValidationError
+from pytest import MonkeyPatch, mark, raises
+
+### Local modules ###
+from fastapi_csrf_protect import CsrfProtect
+from fastapi_csrf_protect.flexible import CsrfProtect as FlexibleCsrfProtect
+from fastapi_csrf_protect.refresh import CookieRefresh
+
+
+def test_cookie_refresh_keeps_cookies_with_enough_lifetime_left() -> None:
+    refresh: CookieRefresh = CookieRefresh(100, 0.25)
+    assert refresh.keep(1_000, 1_074)
+    assert not refresh.keep(1_000, 1_075)
+    refresh.record(True)
+    refresh.record(False)
+    refresh.record(True)
+    assert (refresh.issued, refresh.reused) == (1, 2)
+    with raises(ValueError):
+        CookieRefresh(100, 1.0)
+
+
+def test_cookie_refresh_fraction_validation() -> None:
+    with raises(ValidationError, match="cookie_refresh_fraction"):
+
+        @CsrfProtect.load_config
+        def _() -> tuple[tuple[str, Any], ...]:
+            return (("secret_key", "secret"), ("cookie_refresh_fraction", 1.5))
+
+
+@mark.parametrize("csrf_protect_class", (CsrfProtect, FlexibleCsrfProtect))
+def test_ensure_csrf_cookie(
+    csrf_protect_class: type[CsrfProtect] | type[FlexibleCsrfProtect],
+    monkeypatch: MonkeyPatch,
+) -> None:
+    @csrf_protect_class.load_config
+    def _() -> tuple[tuple[str, Any], ...]:
+        return (
+            ("cookie_refresh_fraction", 0.5),
+            ("max_age", 60),
+            ("secret_key", "secret"),
+        )
+
+    refresh: CookieRefresh = csrf_protect_class().profile.cookie_refresh
+    app: FastAPI = FastAPI()
+
+    @app.get("/form")
+    def render_form(
+        request: Request,
+        response: Response,
+        csrf_protect: Any = Depends(csrf_protect_class),
+    ) -> dict[str, str]:
+        return {"csrf_token": csrf_protect.ensure_csrf_cookie(request, response)}
+
+    @app.post("/protected", response_class=JSONResponse)
+    async def update_resource(
+        request: Request, csrf_protect: Any = Depends(csrf_protect_class)
+    ) -> JSONResponse:
+        await csrf_protect.validate_csrf(request)
+        return JSONResponse(content={"detail": "OK"})
+
+    with TestClient(app) as client:
+        first = client.get("/form")
+        assert "set-cookie" in first.headers
+        second = client.get("/form")
+        assert "set-cookie" not in second.headers
+        assert first.json() == second.json()
+        assert (refresh.issued, refresh.reused) == (1, 1)
+        headers: dict[str, str] = {"X-CSRF-Token": second.json()["csrf_token"]}
+        assert client.post("/protected", headers=headers).status_code == 200
+
+        ### Cookies past the configured fraction of their lifetime are re-issued ###
+        monkeypatch.setattr("fastapi_csrf_protect.base.time", lambda: time() + 31)
+        third = client.get("/form")
+        assert "set-cookie" in third.headers
+        assert third.json() != second.json()
+        monkeypatch.undo()
+
+        ### Invalid cookies are replaced ###
+        client.cookies.set("fastapi-csrf-token", "invalid")
+        assert "set-cookie" in client.get("/form").headers
+        assert (refresh.issued, refresh.reused) == (3, 1)
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2020-2026 All rights reserved.
+# FILENAME:    ~~/tests/serializer_cache.py
+# VERSION:     1.0.7
+# CREATED:     2026-10-17 09:12
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+
+### Standard library ###
+from concurrent.futures import ThreadPoolExecutor
+
+### Third-party packages ###
+from itsdangerous import URLSafeTimedSerializer
+from pytest import raises
+
+### Local modules ###
+from fastapi_csrf_protect import CsrfProtect
+from fastapi_csrf_protect.serializer_cache import SerializerCache, serializer_cache
+
+
+def test_serializer_cache_reuses_serializers() -> None:
+    cache: SerializerCache = SerializerCache(maxsize=4)
+    serializer = cache.get("secret", "salt")
+    assert cache.get("secret", "salt") is serializer
+    assert cache.get("secret", "pepper") is not serializer
+    assert cache.get("terces", "salt") is not serializer
+    assert (cache.hits, cache.misses) == (1, 3)
+
+
+def test_serializer_cache_is_bounded() -> None:
+    cache: SerializerCache = SerializerCache(maxsize=2)
+    first = cache.get("first", "salt")
+    cache.get("second", "salt")
+    cache.get("first", "salt")
+    cache.get("third", "salt")
+    assert len(cache) == 2
+    assert cache.get("first", "salt") is first
+    assert cache.misses == 3
+
+
+def test_serializer_cache_rejects_unknown_algorithm() -> None:
+    with raises(ValueError):
+        SerializerCache().get("secret", "salt", algorithm="unknown")
+
+
+def test_cached_serializer_compatible_with_itsdangerous() -> None:
+    cached = SerializerCache().get("secret", "salt")
+    plain: URLSafeTimedSerializer = URLSafeTimedSerializer("secret", salt="salt")
+    assert plain.loads(cached.dumps("token"), max_age=60) == "token"
+    assert cached.loads(plain.dumps("token"), max_age=60) == "token"
+
+
+def test_cached_serializer_thread_safety() -> None:
+    cache: SerializerCache = SerializerCache(maxsize=8)
+
+    def roundtrip(index: int) -> str:
+        serializer = cache.get(f"secret-{index % 16}", "salt")
+        return serializer.loads(serializer.dumps(f"token-{index}"), max_age=60)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results: list[str] = list(executor.map(roundtrip, range(256)))
+    assert results == [f"token-{index}" for index in range(256)]
+    assert len(cache) <= 8
+
+
+def test_load_config_invalidates_serializer_cache() -> None:
+    ### Loads config ###
+    @CsrfProtect.load_config
+    def _() -> tuple[tuple[str, str], ...]:
+        return (("secret_key", "secret"),)
+
+    CsrfProtect().generate_csrf_tokens()
+    previous = serializer_cache.get("secret", CsrfProtect._salt)
+
+    ### Reloads config ###
+    @CsrfProtect.load_config
+    def _() -> tuple[tuple[str, str], ...]:
+        return (("secret_key", "terces"),)
+
+    assert len(serializer_cache) == 1  # only the serializer of the loaded profile
+    assert serializer_cache.get("secret", CsrfProtect._salt) is not previous
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2020-2026 All rights reserved.
+# FILENAME:    ~~/tests/tenancy.py
+# VERSION:     1.0.7
+# CREATED:     2026-10-17 18:10
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+
+### Standard library ###
+from typing import Any
+
+### Third-party packages ###
+from fastapi import Depends, FastAPI, Request
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+from httpx import Response
+from pytest import raises
+
+### Local modules ###
+from fastapi_csrf_protect import CsrfProtect, CsrfProtectMiddleware
+from fastapi_csrf_protect.exceptions import CsrfProtectError
+from fastapi_csrf_protect.metrics import PrometheusMetrics
+from fastapi_csrf_protect.tenancy import (
+    TenantResolver,
+    tenant_from_host,
+    tenant_from_path_prefix,
+)
+
+SECRETS: dict[str, str] = {"acme.test": "acme-secret", "globex.test": "globex-secret"}
+
+
+def scope(host: str, path: str = "/") -> dict[str, Any]:
+    return {"headers": [(b"host", host.encode())], "path": path}
+
+
+def test_tenant_keys_from_scope() -> None:
+    assert tenant_from_host(scope("Acme.Test:8000")) == "acme.test"
+    assert tenant_from_host(scope("[::1]")) == "[::1]"
+    assert tenant_from_host({"headers": []}) is None
+    assert tenant_from_path_prefix(scope("acme.test", "/acme/orders")) == "acme"
+    assert tenant_from_path_prefix(scope("acme.test", "/")) is None
+
+
+def test_tenant_resolver_caches_serializers() -> None:
+    resolver: TenantResolver = TenantResolver(tenant_from_host, SECRETS.get, maxsize=1)
+    secret_key, serializer = resolver.resolve(scope("acme.test"), "salt")  # type: ignore[misc]
+    assert secret_key == "acme-secret"
+    assert resolver.resolve(scope("acme.test"), "salt") == (secret_key, serializer)
+    assert (resolver.hits, resolver.misses) == (1, 1)
+
+    ### Least-recently-used tenant is evicted, unknown tenants are not cached ###
+    resolver.resolve(scope("globex.test"), "salt")
+    assert resolver.resolve(scope("initech.test"), "salt") is None
+    assert (len(resolver), resolver.evictions, resolver.unresolved) == (1, 1, 1)
+    assert resolver.resolve(scope("acme.test"), "salt")[1] is not serializer  # type: ignore[index]
+
+    ### Serializer is rebuilt when tenant's secret key changes ###
+    SECRETS["acme.test"] = "rotated-secret"
+    try:
+        assert resolver.resolve(scope("acme.test"), "salt")[0] == "rotated-secret"  # type: ignore[index]
+    finally:
+        SECRETS["acme.test"] = "acme-secret"
+
+
+def test_tokens_are_signed_with_tenant_secret_keys() -> None:
+    @CsrfProtect.load_config
+    def _() -> tuple[tuple[str, Any], ...]:
+        return (
+            ("methods", {"DELETE", "PATCH", "POST", "PUT"}),
+            ("secret_key", "fallback-secret"),
+            ("tenant_resolver", TenantResolver(tenant_from_host, SECRETS.get)),
+            ("token_location", "header"),
+        )
+
+    app: FastAPI = FastAPI()
+    app.add_middleware(CsrfProtectMiddleware, csrf_protect=CsrfProtect)
+
+    @app.get("/gen-token", response_class=JSONResponse)
+    def read_resource(
+        request: Request, csrf_protect: CsrfProtect = Depends()
+    ) -> JSONResponse:
+        csrf_token, signed_token = csrf_protect.generate_csrf_tokens(request=request)
+        response: JSONResponse = JSONResponse(content={"csrf_token": csrf_token})
+        csrf_protect.set_csrf_cookie(signed_token, response)
+        return response
+
+    @app.post("/protected", response_class=JSONResponse)
+    async def update_resource(
+        request: Request, csrf_protect: CsrfProtect = Depends()
+    ) -> JSONResponse:
+        await csrf_protect.validate_csrf(request)
+        return JSONResponse(content={"detail": "OK"})
+
+    @app.exception_handler(CsrfProtectError)
+    def csrf_protect_error_handler(
+        request: Request, exc: CsrfProtectError
+    ) -> JSONResponse:
+        return JSONResponse(
+            status_code=exc.status_code, content={"detail": exc.message}
+        )
+
+    def issue(client: TestClient, host: str) -> tuple[str, str]:
+        response: Response = client.get("/gen-token", headers={"Host": host})
+        client.cookies.clear()
+        return response.json()["csrf_token"], response.cookies["fastapi-csrf-token"]
+
+    def post(client: TestClient, host: str, signed: str, token: str) -> Response:
+        client.cookies.set("fastapi-csrf-token", signed)
+        response: Response = client.post(
+            "/protected", headers={"Host": host, "X-CSRF-Token": token}
+        )
+        client.cookies.clear()
+        return response
+
+    with TestClient(app) as client:
+        token, signed = issue(client, "acme.test")
+        assert post(client, "acme.test", signed, token).status_code == 200
+
+        ### Tokens of one tenant are rejected by another and by the fallback key ###
+        response: Response = post(client, "globex.test", signed, token)
+        assert response.status_code == 401
+        assert response.json() == {"detail": "The CSRF token is invalid."}
+        assert post(client, "initech.test", signed, token).status_code == 401
+
+        ### Unknown tenants fall back to configured secret key ###
+        token, signed = issue(client, "initech.test")
+        assert post(client, "initech.test", signed, token).status_code == 200
+
+
+def test_unknown_tenants_without_fallback_secret_key() -> None:
+    @CsrfProtect.load_config
+    def _() -> tuple[tuple[str, Any], ...]:
+        return (
+            ("methods", {"DELETE", "PATCH", "POST", "PUT"}),
+            ("tenant_resolver", TenantResolver(tenant_from_host, SECRETS.get)),
+            ("token_location", "header"),
+        )
+
+    app: FastAPI = FastAPI()
+    app.add_middleware(CsrfProtectMiddleware, csrf_protect=CsrfProtect)
+
+    @app.get("/gen-token", response_class=JSONResponse)
+    def read_resource(
+        request: Request, csrf_protect: CsrfProtect = Depends()
+    ) -> JSONResponse:
+        csrf_token, signed_token = csrf_protect.generate_csrf_tokens(request=request)
+        response: JSONResponse = JSONResponse(content={"csrf_token": csrf_token})
+        csrf_protect.set_csrf_cookie(signed_token, response)
+        return response
+
+    @app.post("/protected", response_class=JSONResponse)
+    def update_resource() -> JSONResponse:
+        return JSONResponse(content={"detail": "OK"})
+
+    @app.exception_handler(CsrfProtectError)
+    def csrf_protect_error_handler(
+        request: Request, exc: CsrfProtectError
+    ) -> JSONResponse:
+        return JSONResponse(
+            status_code=exc.status_code, content={"detail": exc.message}
+        )
+
+    with TestClient(app) as client:
+        ### Known tenants are served with their own secret keys ###
+        response: Response = client.get("/gen-token", headers={"Host": "acme.test"})
+        assert response.status_code == 200
+        headers: dict[str, str] = {
+            "Host": "acme.test",
+            "X-CSRF-Token": response.json()["csrf_token"],
+        }
+        assert client.post("/protected", headers=headers).status_code == 200
+
+        ### Unknown tenants are rejected rather than failing with server errors ###
+        response = client.get("/gen-token", headers={"Host": "initech.test"})
+        assert response.status_code == 400
+        assert response.json() == {
+            "detail": "The request does not belong to a known tenant."
+        }
+        headers["Host"] = "initech.test"
+        metrics: PrometheusMetrics = PrometheusMetrics()
+        CsrfProtect.add_metrics_sink(metrics)
+        try:
+            response = client.post("/protected", headers=headers)
+        finally:
+            CsrfProtect.remove_metrics_sink(metrics)
+        assert response.status_code == 400
+        assert response.json() == {
+            "detail": "The request does not belong to a known tenant."
+        }
+        assert metrics.outcomes == {"unknown_tenant": 1}
+
+    ### Tokens cannot be generated for a tenant without a request ###
+    with raises(ValueError):
+        CsrfProtect().generate_csrf_tokens()
+    assert CsrfProtect().generate_csrf_tokens("explicit-secret")
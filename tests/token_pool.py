@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2020-2026 All rights reserved.
+# FILENAME:    ~~/tests/token_pool.py
+# VERSION:     1.0.7
+# CREATED:     2026-10-17 13:40
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+
+### Standard library ###
+from time import sleep, time
+
+### Third-party packages ###
+from fastapi.testclient import TestClient
+from httpx import Response
+from pydantic import ValidationError
+from pytest import MonkeyPatch, mark, raises
+
+### Local modules ###
+from fastapi_csrf_protect import CsrfProtect
+from fastapi_csrf_protect.serializer_cache import serializer_cache
+from fastapi_csrf_protect.token_pool import TokenPool
+from tests import test_client
+
+
+def test_token_pool_pops_fresh_pairs() -> None:
+    pool: TokenPool = TokenPool("secret", "salt", size=4, low_water=0, freshness=60)
+    pool.fill()
+    assert len(pool) == 4
+    token, signed = pool.pop()  # type: ignore[misc]
+    assert serializer_cache.get("secret", "salt").loads(signed, max_age=60) == token
+    assert len(pool) == 3
+    pool.close()
+    assert len(pool) == 0
+
+
+def test_token_pool_discards_stale_pairs(monkeypatch: MonkeyPatch) -> None:
+    pool: TokenPool = TokenPool("secret", "salt", size=4, low_water=0, freshness=10)
+    pool.fill()
+    monkeypatch.setattr("fastapi_csrf_protect.token_pool.time", lambda: time() + 11)
+    assert pool.pop() is None
+    pool.close()
+
+
+def test_token_pool_refills_in_background() -> None:
+    pool: TokenPool = TokenPool("secret", "salt", size=8, low_water=4, freshness=60)
+    assert pool.pop() is None  # empty pool falls back and wakes the refill thread
+    for _ in range(100):
+        if len(pool) == 8:
+            break
+        sleep(0.01)
+    assert len(pool) == 8
+    pool.close()
+
+
+@mark.parametrize(
+    "csrf_settings",
+    (
+        (("token_pool_size", 0),),
+        (("token_pool_size", 4), ("token_pool_low_water", 5)),
+        (("token_pool_size", 4), ("token_pool_freshness", 0)),
+        (("token_pool_size", 4), ("max_age", 60), ("token_pool_freshness", 60)),
+    ),
+    ids=[
+        "pool-size-zero",
+        "low-water-above-size",
+        "freshness-zero",
+        "freshness-not-below-max-age",
+    ],
+)
+def test_load_config_with_invalid_token_pool(csrf_settings: tuple) -> None:
+    with raises(ValidationError):
+
+        @CsrfProtect.load_config
+        def _() -> tuple[tuple[str, int | str], ...]:
+            return (("secret_key", "secret"), *csrf_settings)
+
+
+def test_generate_csrf_tokens_from_pool(test_client: TestClient) -> None:
+    ### Loads config ###
+    @CsrfProtect.load_config
+    def _() -> tuple[tuple[str, int | set[str] | str], ...]:
+        return (
+            ("methods", {"DELETE", "PATCH", "POST", "PUT"}),
+            ("secret_key", "secret"),
+            ("token_location", "header"),
+            ("token_pool_low_water", 0),
+            ("token_pool_size", 2),
+        )
+
+    pool: None | TokenPool = CsrfProtect().profile.token_pool
+    assert pool is not None
+    pool.fill()
+
+    ### Generate token from the pool ###
+    response: Response = test_client.get("/gen-token")
+    assert response.status_code == 200
+    assert len(pool) == 1
+
+    ### Pooled tokens validate like inline ones ###
+    csrf_token: str = response.json()["csrf_token"]
+    response = test_client.post("/protected", headers={"X-CSRF-Token": csrf_token})
+    assert response.status_code == 200
+    assert response.json() == {"detail": "OK"}
+
+    ### Overriding secret key bypasses the pool ###
+    CsrfProtect().generate_csrf_tokens("terces")
+    assert len(pool) == 1
+
+    ### Reloading configurations stops the pool ###
+    @CsrfProtect.load_config
+    def _() -> tuple[tuple[str, str], ...]:
+        return (("secret_key", "secret"),)
+
+    assert CsrfProtect().profile.token_pool is None
+    assert len(pool) == 0
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2020-2026 All rights reserved.
+# FILENAME:    ~~/tests/token_store.py
+# VERSION:     1.0.7
+# CREATED:     2026-10-17 15:40
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+
+### Standard library ###
+from asyncio import run
+from time import monotonic
+from typing import Any
+
+### Third-party packages ###
+from pytest import MonkeyPatch
+
+### Local modules ###
+from fastapi_csrf_protect import CsrfProtect
+from fastapi_csrf_protect.token_store import KeyValueTokenStore, MemoryTokenStore
+
+
+class DictBackend(object):
+    """Async key-value backend counting round trips"""
+
+    def __init__(self) -> None:
+        self.records: dict[str, Any] = {}
+        self.round_trips: int = 0
+
+    async def fetch(self, key: str) -> Any:
+        self.round_trips += 1
+        return self.records.get(key)
+
+    async def put(self, key: str, value: Any, ttl: None | int = None) -> None:
+        self.round_trips += 1
+        self.records[key] = value
+
+    async def pop(self, key: str) -> Any:
+        self.round_trips += 1
+        return self.records.pop(key, None)
+
+
+def load() -> CsrfProtect:
+    @CsrfProtect.load_config
+    def _() -> tuple[tuple[str, str], ...]:
+        return (("secret_key", "secret"),)
+
+    return CsrfProtect()
+
+
+def test_memory_token_store_reuses_session_tokens(monkeypatch: MonkeyPatch) -> None:
+    store: MemoryTokenStore = MemoryTokenStore(
+        load().generate_csrf_tokens, maxsize=2, ttl=10
+    )
+    first: tuple[str, str] = run(store.get_or_issue("first"))
+    assert run(store.get_or_issue("first")) == first
+    run(store.get_or_issue("second"))
+    run(store.get_or_issue("third"))
+    assert len(store) == 2
+    assert run(store.get_or_issue("first")) != first  # evicted
+
+    ### Expired and discarded sessions are issued new tokens ###
+    third: tuple[str, str] = run(store.get_or_issue("third"))
+    monkeypatch.setattr(
+        "fastapi_csrf_protect.token_store.monotonic", lambda: monotonic() + 11
+    )
+    assert run(store.get_or_issue("third")) != third
+    second: tuple[str, str] = run(store.get_or_issue("second"))
+    run(store.discard("second"))
+    assert run(store.get_or_issue("second")) != second
+
+
+def test_key_value_token_store_single_round_trip() -> None:
+    backend: DictBackend = DictBackend()
+    store: KeyValueTokenStore = KeyValueTokenStore(backend, load().generate_csrf_tokens)
+    token, signed = run(store.get_or_issue("session"))
+    assert backend.records == {"csrf-tokens:session": f"{token} {signed}"}
+    backend.round_trips = 0
+    assert run(store.get_or_issue("session")) == (token, signed)
+    assert backend.round_trips == 1
+
+    ### Bytes records are decoded, malformed ones are replaced ###
+    backend.records["csrf-tokens:session"] = f"{token} {signed}".encode()
+    assert run(store.get_or_issue("session")) == (token, signed)
+    backend.records["csrf-tokens:session"] = token
+    assert run(store.get_or_issue("session"))[0] != token
+
+    run(store.discard("session"))
+    assert backend.records == {}
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2020-2026 All rights reserved.
+# FILENAME:    ~~/tests/validated_body.py
+# VERSION:     1.0.7
+# CREATED:     2026-10-17 20:00
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+
+### Standard library ###
+from collections.abc import Generator
+from typing import Any
+
+### Third-party packages ###
+from fastapi import Depends, FastAPI, Form, Request
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+from httpx import Response
+from pytest import fixture, mark
+
+### Local modules ###
+from fastapi_csrf_protect import CsrfProtect
+from fastapi_csrf_protect.body import ValidatedBody
+from fastapi_csrf_protect.exceptions import CsrfProtectError
+from fastapi_csrf_protect.flexible import CsrfProtect as FlexibleCsrfProtect
+
+
+@fixture(params=[CsrfProtect, FlexibleCsrfProtect], ids=["normal", "flexible"])
+def client(request: Any) -> Generator[tuple[TestClient, str], None, None]:
+    csrf_protect: type[CsrfProtect] = request.param
+
+    @csrf_protect.load_config
+    def _() -> tuple[tuple[str, Any], ...]:
+        return (
+            ("methods", {"DELETE", "PATCH", "POST", "PUT"}),
+            ("secret_key", "secret"),
+            ("token_key", "csrf-token"),
+            ("token_location", "body"),
+        )
+
+    app: FastAPI = FastAPI()
+
+    @app.post("/form", response_class=JSONResponse)
+    async def submit_form(
+        request: Request,
+        email: str = Form(),
+        body: ValidatedBody = Depends(csrf_protect.validated_body),
+    ) -> JSONResponse:
+        shared: bool = body.data is await request.form()
+        return JSONResponse(content={"email": email, "shared": shared})
+
+    @app.post("/json", response_class=JSONResponse)
+    async def submit_json(
+        request: Request, body: ValidatedBody = Depends(csrf_protect.validated_body)
+    ) -> JSONResponse:
+        shared: bool = body.data is await request.json()
+        return JSONResponse(content={"rows": len(body.data["rows"]), "shared": shared})
+
+    @app.exception_handler(CsrfProtectError)
+    def csrf_protect_error_handler(
+        request: Request, exc: CsrfProtectError
+    ) -> JSONResponse:
+        return JSONResponse(
+            status_code=exc.status_code, content={"detail": exc.message}
+        )
+
+    with TestClient(app) as test_client:
+        token, signed = csrf_protect().generate_csrf_tokens()
+        test_client.cookies.set("fastapi-csrf-token", signed)
+        yield test_client, token
+
+
+@mark.parametrize("multipart", (False, True), ids=["urlencoded", "multipart"])
+def test_validated_form_is_parsed_once(
+    client: tuple[TestClient, str], multipart: bool
+) -> None:
+    test_client, token = client
+    files: None | dict[str, Any] = {"upload": ("a.txt", b"a")} if multipart else None
+    response: Response = test_client.post(
+        "/form", data={"email": "a@b.c", "csrf-token": token}, files=files
+    )
+    assert response.status_code == 200
+    assert response.json() == {"email": "a@b.c", "shared": True}
+
+    ### Invalid token ###
+    response = test_client.post(
+        "/form", data={"email": "a@b.c", "csrf-token": "invalid"}
+    )
+    assert response.status_code == 401
+
+
+def test_validated_json_is_parsed_once(client: tuple[TestClient, str]) -> None:
+    test_client, token = client
+    response: Response = test_client.post(
+        "/json", json={"csrf-token": token, "rows": [1, 2, 3]}
+    )
+    assert response.status_code == 200
+    assert response.json() == {"rows": 3, "shared": True}
+
+    ### Token must be a top-level string ###
+    response = test_client.post("/json", json={"csrf-token": [token], "rows": []})
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Missing `csrf-token` in request body."}
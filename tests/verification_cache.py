@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2020-2026 All rights reserved.
+# FILENAME:    ~~/tests/verification_cache.py
+# VERSION:     1.0.7
+# CREATED:     2026-10-17 14:25
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+
+### Standard library ###
+from time import monotonic, time
+
+### Third-party packages ###
+from fastapi.testclient import TestClient
+from httpx import Response
+from pytest import MonkeyPatch, raises
+
+### Local modules ###
+from fastapi_csrf_protect import CsrfProtect
+from fastapi_csrf_protect.exceptions import TokenValidationError
+from fastapi_csrf_protect.verification_cache import VerificationCache
+from tests import test_client
+
+
+def test_verification_cache_hits_and_misses() -> None:
+    cache: VerificationCache = VerificationCache(maxsize=4, ttl=60)
+    assert cache.get("secret", "salt", "signed") is None
+    cache.put("secret", "salt", "signed", "token", 1_700_000_000)
+    assert cache.get("secret", "salt", "signed") == ("token", 1_700_000_000)
+    assert cache.get("terces", "salt", "signed") is None
+    assert cache.get("secret", "pepper", "signed") is None
+    assert (cache.hits, cache.misses) == (1, 3)
+
+
+def test_verification_cache_evicts_least_recently_used() -> None:
+    cache: VerificationCache = VerificationCache(maxsize=2, ttl=60)
+    cache.put("secret", "salt", "first", "1", 0)
+    cache.put("secret", "salt", "second", "2", 0)
+    cache.get("secret", "salt", "first")
+    cache.put("secret", "salt", "third", "3", 0)
+    assert len(cache) == 2
+    assert cache.get("secret", "salt", "second") is None
+    assert cache.get("secret", "salt", "first") == ("1", 0)
+    assert cache.evictions == 1
+
+
+def test_verification_cache_expires_entries(monkeypatch: MonkeyPatch) -> None:
+    cache: VerificationCache = VerificationCache(maxsize=2, ttl=10)
+    cache.put("secret", "salt", "signed", "token", 0)
+    monkeypatch.setattr(
+        "fastapi_csrf_protect.verification_cache.monotonic", lambda: monotonic() + 11
+    )
+    assert cache.get("secret", "salt", "signed") is None
+    assert (len(cache), cache.evictions) == (0, 1)
+
+
+def test_validate_csrf_with_verification_cache(
+    monkeypatch: MonkeyPatch, test_client: TestClient
+) -> None:
+    ### Loads config ###
+    @CsrfProtect.load_config
+    def _() -> tuple[tuple[str, int | set[str] | str], ...]:
+        return (
+            ("methods", {"DELETE", "PATCH", "POST", "PUT"}),
+            ("max_age", 60),
+            ("secret_key", "secret"),
+            ("token_location", "header"),
+            ("verification_cache_size", 16),
+        )
+
+    cache: None | VerificationCache = CsrfProtect().profile.verification_cache
+    assert cache is not None
+    csrf_protect: CsrfProtect = CsrfProtect()
+    token, signed = csrf_protect.generate_csrf_tokens()
+
+    ### First validation verifies signature, next ones are served from cache ###
+    for _ in range(3):
+        csrf_protect._verify_tokens(signed, token, "secret", 60)
+    assert (cache.hits, cache.misses) == (2, 1)
+
+    ### Cached entries still enforce matching tokens and expiry ###
+    with raises(TokenValidationError, match="do not match"):
+        csrf_protect._verify_tokens(signed, "mismatch", "secret", 60)
+    monkeypatch.setattr("fastapi_csrf_protect.base.time", lambda: time() + 61)
+    with raises(TokenValidationError, match="expired"):
+        csrf_protect._verify_tokens(signed, token, "secret", 60)
+    monkeypatch.undo()
+
+    ### Cookies signed with another secret are never matched ###
+    with raises(TokenValidationError, match="invalid"):
+        csrf_protect._verify_tokens(signed, token, "terces", 60)
+
+    ### End-to-end through the test client ###
+    response: Response = test_client.get("/gen-token")
+    headers: dict[str, str] = {"X-CSRF-Token": response.json()["csrf_token"]}
+    response = test_client.post("/protected", headers=headers)
+    assert response.status_code == 200
+
+    ### Reloading configurations drops cached entries ###
+    @CsrfProtect.load_config
+    def _() -> tuple[tuple[str, str], ...]:
+        return (("secret_key", "secret"),)
+
+    assert CsrfProtect().profile.verification_cache is None
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2020-2026 All rights reserved.
+# FILENAME:    ~~/tests/verify.py
+# VERSION:     1.0.7
+# CREATED:     2026-10-17 21:00
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+
+### Standard library ###
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from time import time
+from typing import Any
+
+### Third-party packages ###
+from pytest import mark
+
+### Local modules ###
+from fastapi_csrf_protect import CsrfProtect
+from fastapi_csrf_protect.flexible import CsrfProtect as FlexibleCsrfProtect
+from fastapi_csrf_protect.key_ring import KeyRing
+from fastapi_csrf_protect.verify import VerifyResult
+
+
+@mark.parametrize("csrf_protect_class", (CsrfProtect, FlexibleCsrfProtect))
+@mark.parametrize("token_format", ("compact", "itsdangerous"))
+def test_verify_without_request(
+    csrf_protect_class: type[CsrfProtect] | type[FlexibleCsrfProtect],
+    token_format: str,
+) -> None:
+    @csrf_protect_class.load_config
+    def _() -> tuple[tuple[str, Any], ...]:
+        return (
+            ("max_age", 60),
+            ("secret_key", "secret"),
+            ("token_format", token_format),
+        )
+
+    csrf_protect = csrf_protect_class()
+    token, signed = csrf_protect.generate_csrf_tokens()
+    result: VerifyResult = csrf_protect.verify(signed, token)
+    assert result and result.reason == "ok"
+    assert abs(result.issued_at - time()) < 2  # type: ignore[operator]
+    assert csrf_protect.verify(signed.encode(), token.encode()).ok
+
+    ### Failures are returned with stable reason codes instead of being raised ###
+    outcomes: dict[str, VerifyResult] = {
+        "expired": csrf_protect.verify(signed, token, now=time() + 61),
+        "expired-future": csrf_protect.verify(signed, token, now=time() - 61),
+        "invalid_signature": csrf_protect.verify("invalid", token),
+        "token_mismatch": csrf_protect.verify(signed, "mismatch"),
+    }
+    for reason, outcome in outcomes.items():
+        assert not outcome
+        assert outcome.reason == reason.partition("-")[0]
+    assert csrf_protect.verify(signed, token, now=time() + 61, time_limit=120).ok
+    assert not csrf_protect.verify(signed, token, secret_key="terces").ok
+
+
+def test_verify_with_key_ring() -> None:
+    @CsrfProtect.load_config
+    def _() -> tuple[tuple[str, Any], ...]:
+        return (("secret_keys", {"v1": "old-secret"}),)
+
+    token, signed = CsrfProtect().generate_csrf_tokens()
+
+    @CsrfProtect.load_config
+    def _() -> tuple[tuple[str, Any], ...]:
+        return (("secret_keys", {"v2": "new-secret", "v1": "old-secret"}),)
+
+    assert CsrfProtect().verify(signed, token).ok
+
+    @CsrfProtect.load_config
+    def _() -> tuple[tuple[str, Any], ...]:
+        return (("secret_keys", {"v2": "new-secret"}),)
+
+    assert CsrfProtect().verify(signed, token) == (False, "unknown_key", None)
+
+
+@mark.parametrize("csrf_protect_class", (CsrfProtect, FlexibleCsrfProtect))
+def test_validate_many(
+    csrf_protect_class: type[CsrfProtect] | type[FlexibleCsrfProtect],
+) -> None:
+    @csrf_protect_class.load_config
+    def _() -> tuple[tuple[str, Any], ...]:
+        return (("max_age", 60), ("secret_key", "secret"))
+
+    csrf_protect = csrf_protect_class()
+    pairs: list[tuple[str, str]] = csrf_protect.generate_many(10)
+    assert len({token for token, _ in pairs}) == 10
+    batch: list[tuple[str, str]] = [(signed, token) for token, signed in pairs]
+    batch[3] = (batch[3][0], "mismatch")
+    batch[7] = ("invalid", batch[7][1])
+    expected: list[str] = ["ok"] * 10
+    expected[3], expected[7] = "token_mismatch", "invalid_signature"
+    assert [result.reason for result in csrf_protect.validate_many(batch)] == expected
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results: list[VerifyResult] = csrf_protect.validate_many(
+            batch, executor=executor, chunksize=3
+        )
+    assert [result.reason for result in results] == expected
+    assert not any(csrf_protect.validate_many(batch, now=time() + 61))
+    assert csrf_protect.validate_many([]) == []
+
+
+@mark.parametrize("token_format", ("compact", "itsdangerous"))
+def test_validate_many_with_process_pool(token_format: str) -> None:
+    @CsrfProtect.load_config
+    def _() -> tuple[tuple[str, Any], ...]:
+        return (("secret_keys", {"v1": "old-secret"}), ("token_format", token_format))
+
+    old: list[tuple[str, str]] = CsrfProtect().generate_many(4)
+
+    @CsrfProtect.load_config
+    def _() -> tuple[tuple[str, Any], ...]:
+        return (
+            ("max_age", 60),
+            ("secret_keys", {"v2": "new-secret", "v1": "old-secret"}),
+            ("token_format", token_format),
+        )
+
+    csrf_protect: CsrfProtect = CsrfProtect()
+    batch: list[tuple[str | bytes, str | bytes]] = [
+        (signed, token) for token, signed in old + csrf_protect.generate_many(6)
+    ]
+    batch[2] = ("v0:" + str(batch[2][0]).partition(":")[2], batch[2][1])
+    batch[5] = (batch[5][0], "mismatch")
+    batch[8] = (str(batch[8][0]).encode("latin-1"), str(batch[8][1]).encode())
+    expected: list[str] = ["ok"] * 10
+    expected[2], expected[5] = "unknown_key", "token_mismatch"
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        results: list[VerifyResult] = csrf_protect.validate_many(
+            batch, executor=executor, chunksize=3
+        )
+    assert [result.reason for result in results] == expected
+    key_ring: None | KeyRing = csrf_protect.profile.key_ring
+    assert key_ring is not None
+    assert key_ring.validations == {"v1": 3, "v2": 5}
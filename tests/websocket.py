@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2020-2026 All rights reserved.
+# FILENAME:    ~~/tests/websocket.py
+# VERSION:     1.0.7
+# CREATED:     2026-10-17 22:00
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+
+### Standard library ###
+from typing import Any
+
+### Third-party packages ###
+from fastapi import Depends, FastAPI, WebSocket
+from fastapi.testclient import TestClient
+from pytest import MonkeyPatch, mark, raises
+from starlette.websockets import WebSocketDisconnect
+
+### Local modules ###
+from fastapi_csrf_protect import CsrfProtect
+from fastapi_csrf_protect.flexible import CsrfProtect as FlexibleCsrfProtect
+
+
+@mark.parametrize("csrf_protect_class", (CsrfProtect, FlexibleCsrfProtect))
+@mark.parametrize("query_token", (False, True), ids=("subprotocol", "query"))
+def test_websocket_handshake_validation(
+    csrf_protect_class: type[CsrfProtect] | type[FlexibleCsrfProtect],
+    monkeypatch: MonkeyPatch,
+    query_token: bool,
+) -> None:
+    @csrf_protect_class.load_config
+    def _() -> tuple[tuple[str, Any], ...]:
+        return (
+            ("secret_key", "secret"),
+            ("token_key", "csrf-token"),
+            ("websocket_query_token", query_token),
+        )
+
+    verifications: list[str] = []
+    verify = csrf_protect_class.verify
+
+    def counting_verify(self, *args: Any, **kwargs: Any) -> Any:
+        verifications.append(args[1])
+        return verify(self, *args, **kwargs)
+
+    monkeypatch.setattr(csrf_protect_class, "verify", counting_verify)
+    app: FastAPI = FastAPI()
+
+    @app.websocket(
+        "/ws", dependencies=[Depends(csrf_protect_class.validated_websocket)]
+    )
+    async def echo(websocket: WebSocket) -> None:
+        subprotocols: list[str] = websocket.scope["subprotocols"]
+        await websocket.accept(subprotocol=subprotocols[0] if subprotocols else None)
+        csrf_protect = csrf_protect_class()
+        async for message in websocket.iter_text():
+            await csrf_protect.validate_websocket(websocket)  # recorded on handshake
+            await websocket.send_text(message)
+
+    token, signed = csrf_protect_class().generate_csrf_tokens()
+    with TestClient(app) as client:
+        client.cookies.set("fastapi-csrf-token", signed)
+        accepted: list[dict[str, Any]] = [{"subprotocols": [f"csrf-token.{token}"]}]
+        if query_token:
+            accepted.append({"url": f"/ws?csrf-token={token}"})
+        for options in accepted:
+            with client.websocket_connect(**{"url": "/ws", **options}) as websocket:
+                for index in range(10):
+                    websocket.send_text(f"message-{index}")
+                    assert websocket.receive_text() == f"message-{index}"
+        assert verifications == [token] * len(accepted)
+
+        ### Handshakes with missing or mismatched tokens are rejected before accept ###
+        rejected: list[str] = ["/ws", "/ws?csrf-token=mismatch"]
+        if not query_token:
+            rejected.append(f"/ws?csrf-token={token}")  # query string is opt-in
+        for url in rejected:
+            with (
+                raises(WebSocketDisconnect) as disconnect,
+                client.websocket_connect(url),
+            ):
+                pass
+            assert disconnect.value.code == 1008
+        client.cookies.clear()
+        with (
+            raises(WebSocketDisconnect) as disconnect,
+            client.websocket_connect("/ws", subprotocols=[f"csrf-token.{token}"]),
+        ):
+            pass
+        assert disconnect.value.reason == "Missing Cookie: `fastapi-csrf-token`."